@@ -0,0 +1,5 @@
+"""Benchmarks for red_log configs, formatters and handlers.
+
+Run all benchmarks with `python -m benchmarks` (or `nox -s benchmarks`), with the package installed.
+Results are written as JSON so runs can be compared across releases.
+"""
@@ -0,0 +1,73 @@
+"""Run every benchmark and write the results as JSON.
+
+Usage: `python -m benchmarks [--quick] [--only NAME ...] [-o results.json]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import typing as t
+
+from . import bench_config, bench_formatters, bench_handlers, bench_records, bench_scaling
+from ._utils import environment_info
+
+## Benchmark name -> (full run, quick run)
+BENCHMARKS: dict[str, tuple[t.Callable[[], t.Any], t.Callable[[], t.Any]]] = {
+    "config": (
+        lambda: bench_config.run(),
+        lambda: bench_config.run(repeat=20, import_repeat=3),
+    ),
+    "formatters": (
+        lambda: bench_formatters.run(),
+        lambda: bench_formatters.run(count=20_000, repeat=1),
+    ),
+    "handlers": (
+        lambda: bench_handlers.run(),
+        lambda: bench_handlers.run(count=5_000),
+    ),
+    "records": (
+        lambda: bench_records.run(),
+        lambda: bench_records.run(count=20_000, repeat=1),
+    ),
+    "scaling": (
+        lambda: bench_scaling.run(),
+        lambda: bench_scaling.run(count=10_000),
+    ),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=list(BENCHMARKS),
+        default=list(BENCHMARKS),
+        help="Benchmarks to run (default: all).",
+    )
+    parser.add_argument("--quick", action="store_true", help="Run fewer iterations.")
+    parser.add_argument(
+        "-o", "--output", type=Path, default=None, help="Write results to this JSON file."
+    )
+    args = parser.parse_args()
+
+    results: dict[str, t.Any] = {"environment": environment_info(), "results": {}}
+    for name in args.only:
+        print(f"Running '{name}' benchmarks", file=sys.stderr)
+        full, quick = BENCHMARKS[name]
+        results["results"][name] = quick() if args.quick else full()
+
+    output: str = json.dumps(results, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(output)
+        print(f"Results written to '{args.output}'", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
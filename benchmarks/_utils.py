@@ -0,0 +1,94 @@
+"""Timing and environment helpers shared by the benchmark modules."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+import logging
+import logging.config
+import os
+import platform
+import statistics
+import sys
+import time
+import typing as t
+
+from red_log.config_classes.base import thaw
+
+
+def percentile(samples: t.Sequence[float], pct: float) -> float:
+    """Return the `pct` percentile (0-100) of `samples`, using the nearest-rank method."""
+    if not samples:
+        return 0.0
+
+    ordered: list[float] = sorted(samples)
+    index: int = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+
+    return ordered[index]
+
+
+def summarize_ns(samples: t.Sequence[int]) -> dict[str, float]:
+    """Summarize a list of nanosecond timings as microsecond statistics."""
+    micros: list[float] = [sample / 1000 for sample in samples]
+
+    return {
+        "mean_us": statistics.fmean(micros) if micros else 0.0,
+        "p50_us": percentile(micros, 50),
+        "p99_us": percentile(micros, 99),
+        "max_us": max(micros, default=0.0),
+    }
+
+
+def time_calls(func: t.Callable[[], t.Any], repeat: int) -> dict[str, float]:
+    """Call `func` `repeat` times, return microsecond statistics of each call."""
+    samples: list[int] = []
+    clock = time.perf_counter_ns
+
+    for _ in range(repeat):
+        start: int = clock()
+        func()
+        samples.append(clock() - start)
+
+    return summarize_ns(samples)
+
+
+@contextmanager
+def applied_config(configdict: t.Mapping[str, t.Any]) -> t.Iterator[None]:
+    """Apply `configdict` with `dictConfig()`, and close its handlers on exit."""
+    logging.config.dictConfig(thaw(configdict))
+    try:
+        yield
+    finally:
+        reset_logging()
+
+
+def reset_logging() -> None:
+    """Close and remove every handler attached to a logger, so the next benchmark starts clean."""
+    loggers: list[logging.Logger] = [logging.getLogger()] + [
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+
+    for logger in loggers:
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+
+
+def environment_info() -> dict[str, t.Any]:
+    """Describe the machine and interpreter the benchmarks ran on."""
+    try:
+        from importlib.metadata import version
+
+        red_log_version: str | None = version("red-log")
+    except Exception:
+        red_log_version = None
+
+    return {
+        "red_log_version": red_log_version,
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
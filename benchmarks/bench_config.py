@@ -0,0 +1,138 @@
+"""Measure import time, config assembly time, and config apply time."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging.config
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+import typing as t
+
+from red_log.config_classes import FormatterConfig, JsonFormatterConfig, LoggerConfig
+from red_log.config_classes.base import thaw
+from red_log.config_classes.handlers import (
+    FileHandlerConfig,
+    RotatingFileHandlerConfig,
+    StreamHandlerConfig,
+)
+from red_log.config_classes.loggers import LoggerFactory
+from red_log.fmts import MESSAGE_FMT_DETAILED, MESSAGE_FMT_STANDARD
+from red_log.helpers import assemble_configdict, clear_configdict_cache
+from red_log.runtime import apply_configdict, reset_applied_configdict
+
+from ._utils import reset_logging, time_calls
+
+IMPORT_MODULES: tuple[str, ...] = ("red_log", "red_log.config_classes", "red_log.helpers")
+
+
+def import_time(module: str, repeat: int) -> dict[str, float]:
+    """Import `module` in `repeat` fresh interpreters, return millisecond statistics."""
+    code: str = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    samples: list[float] = [
+        float(subprocess.check_output([sys.executable, "-c", code], text=True)) * 1000
+        for _ in range(repeat)
+    ]
+
+    return {"min_ms": min(samples), "median_ms": statistics.median(samples)}
+
+
+def make_config_inputs(log_dir: Path) -> dict[str, t.Any]:
+    """Return `assemble_configdict()` inputs for a typical service: console, file and rotating file."""
+    return {
+        "formatters": [
+            FormatterConfig(name="default", fmt=MESSAGE_FMT_STANDARD),
+            FormatterConfig(name="detailed", fmt=MESSAGE_FMT_DETAILED),
+            JsonFormatterConfig(name="json"),
+        ],
+        "handlers": [
+            StreamHandlerConfig(name="console", formatter="default", level="INFO"),
+            FileHandlerConfig(
+                name="file", formatter="detailed", filename=str(log_dir / "app.log")
+            ),
+            RotatingFileHandlerConfig(
+                name="rotating",
+                formatter="json",
+                filename=str(log_dir / "app.json.log"),
+                maxBytes=10 * 1024 * 1024,
+                backupCount=3,
+            ),
+        ],
+        "loggers": [
+            LoggerConfig(name="app", level="DEBUG", handlers=["file", "rotating"]),
+            LoggerConfig(name="app.db", level="WARNING", handlers=["file"]),
+            LoggerConfig(name="urllib3", level="WARNING", handlers=["console"]),
+        ],
+        "root_handlers": ["console"],
+        "root_level": "INFO",
+    }
+
+
+def run(repeat: int = 200, import_repeat: int = 10) -> dict[str, t.Any]:
+    """Run the config benchmarks, return their results."""
+    results: dict[str, t.Any] = {
+        "import": {module: import_time(module, import_repeat) for module in IMPORT_MODULES}
+    }
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        inputs: dict[str, t.Any] = make_config_inputs(Path(log_dir))
+
+        def assemble_uncached() -> None:
+            clear_configdict_cache()
+            assemble_configdict(**inputs)
+
+        results["assemble_configdict"] = {
+            "uncached": time_calls(assemble_uncached, repeat),
+            "cached": time_calls(lambda: assemble_configdict(**inputs), repeat),
+        }
+
+        configdict = assemble_configdict(**inputs)
+        handler_configs: dict[str, t.Any] = thaw(configdict["handlers"])
+
+        try:
+            results["dictConfig"] = time_calls(
+                lambda: logging.config.dictConfig(thaw(configdict)), repeat
+            )
+
+            reset_applied_configdict()
+            results["apply_configdict"] = {
+                "full": time_calls(
+                    lambda: apply_configdict(configdict, incremental=False), repeat
+                ),
+                "unchanged": time_calls(lambda: apply_configdict(configdict), repeat),
+            }
+
+            results["LoggerFactory.get_logger"] = time_calls(
+                lambda: LoggerFactory.get_logger(
+                    name="app",
+                    log_level="INFO",
+                    handlers=handler_configs,
+                    formatters=thaw(configdict["formatters"]),
+                    loggers=thaw(configdict["loggers"]),
+                ),
+                repeat,
+            )
+        finally:
+            reset_applied_configdict()
+            LoggerFactory.clear_registry()
+            reset_logging()
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-r", "--repeat", type=int, default=200, help="Calls per measurement.")
+    args = parser.parse_args()
+
+    print(json.dumps(run(repeat=args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Compare records/second of `red_log.formatters.CompiledFormatter` against the stdlib `logging.Formatter`.
+
+Run with the package installed (i.e. `pdm run python benchmarks/bench_formatters.py`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+
+from red_log.fmts import (
+    DATE_FMT_STANDARD,
+    MESSAGE_FMT_BASIC,
+    MESSAGE_FMT_DETAILED,
+    MESSAGE_FMT_STANDARD,
+    RED_LOG_DETAIL_FMT,
+    RED_LOG_FMT,
+)
+from red_log.formatters import CompiledFormatter
+
+FORMATS: dict[str, str] = {
+    "MESSAGE_FMT_BASIC": MESSAGE_FMT_BASIC,
+    "MESSAGE_FMT_STANDARD": MESSAGE_FMT_STANDARD,
+    "MESSAGE_FMT_DETAILED": MESSAGE_FMT_DETAILED,
+    "RED_LOG_FMT": RED_LOG_FMT,
+    "RED_LOG_DETAIL_FMT": RED_LOG_DETAIL_FMT,
+}
+
+
+def make_records(count: int) -> list[logging.LogRecord]:
+    """Create `count` log records, spread over ~1 second like a busy service would."""
+    start: float = time.time()
+    records: list[logging.LogRecord] = []
+
+    for i in range(count):
+        record = logging.LogRecord(
+            "bench", logging.INFO, __file__, 42, "request %s took %dms", ("abc", i), None, "handle"
+        )
+        record.created = start + (i / count)
+        record.msecs = (record.created - int(record.created)) * 1000
+        records.append(record)
+
+    return records
+
+
+def records_per_second(formatter: logging.Formatter, records: list[logging.LogRecord]) -> float:
+    """Format every record in `records` with `formatter`, return the throughput."""
+    fmt = formatter.format
+
+    start: float = time.perf_counter()
+    for record in records:
+        fmt(record)
+    elapsed: float = time.perf_counter() - start
+
+    return len(records) / elapsed
+
+
+def run(count: int = 200_000, repeat: int = 5) -> dict[str, dict[str, float]]:
+    """Benchmark each format in `FORMATS`, return the best records/second of `repeat` runs."""
+    results: dict[str, dict[str, float]] = {}
+
+    for name, fmt in FORMATS.items():
+        stdlib = logging.Formatter(fmt, DATE_FMT_STANDARD)
+        compiled = CompiledFormatter(fmt, DATE_FMT_STANDARD)
+
+        stdlib_rps: float = 0.0
+        compiled_rps: float = 0.0
+        for _ in range(repeat):
+            stdlib_rps = max(stdlib_rps, records_per_second(stdlib, make_records(count)))
+            compiled_rps = max(compiled_rps, records_per_second(compiled, make_records(count)))
+
+        results[name] = {
+            "stdlib_records_per_sec": stdlib_rps,
+            "compiled_records_per_sec": compiled_rps,
+            "speedup": compiled_rps / stdlib_rps,
+        }
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=200_000, help="Records per run.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Runs per formatter.")
+    args = parser.parse_args()
+
+    results = run(count=args.count, repeat=args.repeat)
+
+    print(f"{'format':<24} {'stdlib rec/s':>14} {'compiled rec/s':>16} {'speedup':>8}")
+    for name, result in results.items():
+        print(
+            f"{name:<24} {result['stdlib_records_per_sec']:>14,.0f} "
+            f"{result['compiled_records_per_sec']:>16,.0f} {result['speedup']:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
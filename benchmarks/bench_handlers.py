@@ -0,0 +1,139 @@
+"""Measure records/second and per-call emit latency for each handler config type."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import time
+import typing as t
+
+from red_log.config_classes import FormatterConfig
+from red_log.config_classes.handlers import (
+    BufferedFileHandlerConfig,
+    FileHandlerConfig,
+    QueueListenerConfig,
+    RotatingFileHandlerConfig,
+    ShardedFileHandlerConfig,
+    StreamHandlerConfig,
+    TimedRotatingFileHandlerConfig,
+)
+from red_log.fmts import MESSAGE_FMT_STANDARD
+from red_log.helpers import assemble_configdict
+
+from ._utils import applied_config, reset_logging, summarize_ns
+
+LOGGER_NAME: str = "bench"
+
+
+def make_handler_configs(log_dir: Path, devnull: t.IO[str]) -> dict[str, list[t.Any]]:
+    """Return the handler config(s) to benchmark, keyed by a short name.
+
+    The handler the benchmark logger uses is always named `bench`.
+    """
+    return {
+        "stream": [StreamHandlerConfig(name="bench", formatter="default", stream=devnull)],
+        "file": [
+            FileHandlerConfig(name="bench", formatter="default", filename=str(log_dir / "file.log"))
+        ],
+        "rotating": [
+            RotatingFileHandlerConfig(
+                name="bench",
+                formatter="default",
+                filename=str(log_dir / "rotating.log"),
+                maxBytes=5 * 1024 * 1024,
+                backupCount=2,
+            )
+        ],
+        "timed_rotating": [
+            TimedRotatingFileHandlerConfig(
+                name="bench",
+                formatter="default",
+                filename=str(log_dir / "timed.log"),
+                backupCount=2,
+            )
+        ],
+        "queue": [
+            FileHandlerConfig(name="file", formatter="default", filename=str(log_dir / "queue.log")),
+            QueueListenerConfig(name="bench", handlers=["file"]),
+        ],
+        "buffered": [
+            BufferedFileHandlerConfig(
+                name="bench", formatter="default", filename=str(log_dir / "buffered.log")
+            )
+        ],
+        "sharded": [
+            ShardedFileHandlerConfig(
+                name="bench", formatter="default", filename=str(log_dir / "sharded.log")
+            )
+        ],
+    }
+
+
+def make_configdict(handlers: list[t.Any]):
+    """Return a config that sends the `bench` logger to the `bench` handler."""
+    return assemble_configdict(
+        formatters=[FormatterConfig(name="default", fmt=MESSAGE_FMT_STANDARD)],
+        handlers=handlers,
+        root_handlers=[],
+        root_level="WARNING",
+        use_cache=False,
+    ) | {
+        "loggers": {LOGGER_NAME: {"level": "INFO", "handlers": ["bench"], "propagate": False}}
+    }
+
+
+def bench_handler(handlers: list[t.Any], count: int) -> dict[str, t.Any]:
+    """Log `count` records through the handler, untimed then timed per call."""
+    logger: logging.Logger = logging.getLogger(LOGGER_NAME)
+    log = logger.info
+    clock = time.perf_counter_ns
+
+    with applied_config(make_configdict(handlers)):
+        start: float = time.perf_counter()
+        for i in range(count):
+            log("request %s handled in %dms", "GET /items", i)
+        elapsed: float = time.perf_counter() - start
+
+        samples: list[int] = []
+        for i in range(count):
+            call_start: int = clock()
+            log("request %s handled in %dms", "GET /items", i)
+            samples.append(clock() - call_start)
+
+        ## Buffered/queued handlers return before the record is written, include the time to finish
+        close_start: float = time.perf_counter()
+        reset_logging()
+        close_seconds: float = time.perf_counter() - close_start
+
+    return {
+        "records_per_sec": count / elapsed,
+        "close_seconds": close_seconds,
+        "emit_latency": summarize_ns(samples),
+    }
+
+
+def run(count: int = 50_000) -> dict[str, t.Any]:
+    """Benchmark each handler type, return their results."""
+    results: dict[str, t.Any] = {}
+
+    with tempfile.TemporaryDirectory() as log_dir, open(os.devnull, "w") as devnull:
+        for name, handlers in make_handler_configs(Path(log_dir), devnull).items():
+            results[name] = bench_handler(handlers, count)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=50_000, help="Records per handler.")
+    args = parser.parse_args()
+
+    print(json.dumps(run(count=args.count), indent=2))
+
+
+if __name__ == "__main__":
+    main()
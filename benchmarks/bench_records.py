@@ -0,0 +1,103 @@
+"""Compare the cost of logging with `red_log.records.LazyLogRecord` against the stdlib `logging.LogRecord`.
+
+Each case logs through a logger whose handler formats every record with a `CompiledFormatter`, or (for
+`filtered`) drops every record in a handler filter, so no lazy field is read.
+
+Run with the package installed (i.e. `pdm run python benchmarks/bench_records.py`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+import typing as t
+
+from red_log.fmts import MESSAGE_FMT_BASIC, RED_LOG_FMT
+from red_log.formatters import CompiledFormatter
+from red_log.records import install_record_factory, uninstall_record_factory
+
+
+class _FormatHandler(logging.Handler):
+    """Format records and discard the output, so only record creation and formatting are measured."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+
+
+## Case name -> format string (`None`: the handler filters every record out)
+CASES: dict[str, str | None] = {
+    "filtered": None,
+    "MESSAGE_FMT_BASIC": MESSAGE_FMT_BASIC,
+    "RED_LOG_FMT": RED_LOG_FMT,
+}
+
+
+def records_per_second(logger: logging.Logger, count: int) -> float:
+    """Log `count` records with `logger`, return the throughput."""
+    info: t.Callable[..., None] = logger.info
+
+    start: float = time.perf_counter()
+    for i in range(count):
+        info("request %s took %dms", "abc", i)
+    elapsed: float = time.perf_counter() - start
+
+    return count / elapsed
+
+
+def run(count: int = 200_000, repeat: int = 5) -> dict[str, dict[str, float]]:
+    """Benchmark each case in `CASES`, return the best records/second of `repeat` runs."""
+    results: dict[str, dict[str, float]] = {}
+
+    logger: logging.Logger = logging.getLogger("red_log.bench.records")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    for name, fmt in CASES.items():
+        handler = _FormatHandler()
+        if fmt is None:
+            handler.addFilter(lambda record: False)
+        else:
+            handler.setFormatter(CompiledFormatter(fmt))
+        logger.handlers = [handler]
+
+        stdlib_rps: float = 0.0
+        lazy_rps: float = 0.0
+        for _ in range(repeat):
+            stdlib_rps = max(stdlib_rps, records_per_second(logger, count))
+
+            install_record_factory()
+            try:
+                lazy_rps = max(lazy_rps, records_per_second(logger, count))
+            finally:
+                uninstall_record_factory()
+
+        results[name] = {
+            "stdlib_records_per_sec": stdlib_rps,
+            "lazy_records_per_sec": lazy_rps,
+            "speedup": lazy_rps / stdlib_rps,
+        }
+
+    logger.handlers = []
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=200_000, help="Records per run.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Runs per case.")
+    args = parser.parse_args()
+
+    results = run(count=args.count, repeat=args.repeat)
+
+    print(f"{'case':<20} {'stdlib rec/s':>14} {'lazy rec/s':>12} {'speedup':>8}")
+    for name, result in results.items():
+        print(
+            f"{name:<20} {result['stdlib_records_per_sec']:>14,.0f} "
+            f"{result['lazy_records_per_sec']:>12,.0f} {result['speedup']:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
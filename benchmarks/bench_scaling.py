@@ -0,0 +1,128 @@
+"""Measure how total records/second scales with the number of logging threads and processes."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import tempfile
+import threading
+import time
+import typing as t
+
+from red_log.config_classes import FormatterConfig
+from red_log.config_classes.handlers import (
+    FileHandlerConfig,
+    RotatingFileHandlerConfig,
+    ShardedFileHandlerConfig,
+)
+from red_log.fmts import MESSAGE_FMT_STANDARD
+from red_log.helpers import assemble_configdict
+from red_log.runtime import MultiprocessLogWriter
+
+from ._utils import applied_config
+
+THREAD_COUNTS: tuple[int, ...] = (1, 2, 4, 8, 16)
+PROCESS_COUNTS: tuple[int, ...] = (1, 2, 4)
+
+
+def log_records(count: int) -> None:
+    """Log `count` records through the `bench` logger."""
+    log = logging.getLogger("bench").info
+    for i in range(count):
+        log("request %s handled in %dms", "GET /items", i)
+
+
+def make_configdict(handler: t.Any):
+    """Return a config that sends every record to `handler`."""
+    return assemble_configdict(
+        formatters=[FormatterConfig(name="default", fmt=MESSAGE_FMT_STANDARD)],
+        handlers=[handler],
+        root_handlers=[handler.name],
+        root_level="INFO",
+        use_cache=False,
+    )
+
+
+def bench_threads(handler: t.Any, count: int, threads: int) -> float:
+    """Log `count` records split over `threads` threads, return total records/second."""
+    with applied_config(make_configdict(handler)):
+        workers: list[threading.Thread] = [
+            threading.Thread(target=log_records, args=(count // threads,)) for _ in range(threads)
+        ]
+
+        start: float = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed: float = time.perf_counter() - start
+
+    return count / elapsed
+
+
+def bench_processes(handler: t.Any, count: int, processes: int) -> float:
+    """Log `count` records split over `processes` processes through a `MultiprocessLogWriter`.
+
+    Returns total records/second, including the time for the writer to write every record.
+    """
+    writer = MultiprocessLogWriter(make_configdict(handler))
+
+    start: float = time.perf_counter()
+    with writer:
+        with ProcessPoolExecutor(
+            processes,
+            mp_context=writer.context,
+            initializer=writer.worker_initializer,
+            initargs=writer.worker_initargs,
+        ) as pool:
+            list(pool.map(log_records, [count // processes] * processes))
+    elapsed: float = time.perf_counter() - start
+
+    return count / elapsed
+
+
+def run(count: int = 100_000) -> dict[str, t.Any]:
+    """Run the scaling benchmarks, return records/second by worker count."""
+    results: dict[str, t.Any] = {"threads": {}, "processes": {}}
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        thread_handlers: dict[str, t.Any] = {
+            "file": FileHandlerConfig(
+                name="bench", formatter="default", filename=str(Path(log_dir, "threads.log"))
+            ),
+            "sharded": ShardedFileHandlerConfig(
+                name="bench", formatter="default", filename=str(Path(log_dir, "sharded.log"))
+            ),
+        }
+        for name, handler in thread_handlers.items():
+            results["threads"][name] = {
+                threads: bench_threads(handler, count, threads) for threads in THREAD_COUNTS
+            }
+
+        rotating = RotatingFileHandlerConfig(
+            name="bench",
+            formatter="default",
+            filename=str(Path(log_dir, "processes.log")),
+            maxBytes=5 * 1024 * 1024,
+            backupCount=2,
+        )
+        results["processes"]["multiprocess_writer"] = {
+            processes: bench_processes(rotating, count, processes) for processes in PROCESS_COUNTS
+        }
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--count", type=int, default=100_000, help="Total records per run.")
+    args = parser.parse_args()
+
+    print(json.dumps(run(count=args.count), indent=2))
+
+
+if __name__ == "__main__":
+    main()
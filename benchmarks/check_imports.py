@@ -0,0 +1,99 @@
+"""Fail if importing light red_log modules pulls in heavy ones, or takes longer than a budget.
+
+Each module is imported in a fresh interpreter with `-X importtime`, and the modules it imported
+are checked against `FORBIDDEN_IMPORTS`. `tests/test_import_time.py` runs the import checks with the
+test suite; this script adds the time budget, which is too machine-dependent for a test.
+
+Usage: `python -m benchmarks.check_imports [--budget-ms 25]`
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+## Module -> modules importing it must not import
+FORBIDDEN_IMPORTS: dict[str, tuple[str, ...]] = {
+    "red_log": (
+        "red_log.config_classes",
+        "red_log.formatters",
+        "red_log.handlers",
+        "red_log.helpers",
+        "red_log.runtime",
+        "typing",
+    ),
+    "red_log.fmts": (
+        "red_log.config_classes",
+        "red_log.formatters",
+        "red_log.handlers",
+        "red_log.helpers",
+        "red_log.runtime",
+        "typing",
+        "json",
+        "pathlib",
+    ),
+    "red_log.config_classes": ("red_log.config_classes.prefab", "red_log.helpers"),
+    "red_log.helpers": ("red_log.helpers.__methods", "red_log.config_classes.loggers"),
+}
+
+
+def parse_importtime(module: str) -> dict[str, int]:
+    """Import `module` with `-X importtime`, return cumulative microseconds by imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _self, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            timings[name.strip()] = int(cumulative)
+
+    return timings
+
+
+def check(budget_ms: float) -> list[str]:
+    """Return a description of each import that broke a rule."""
+    errors: list[str] = []
+
+    for module, forbidden in FORBIDDEN_IMPORTS.items():
+        timings: dict[str, int] = parse_importtime(module)
+
+        for name in forbidden:
+            if name in timings:
+                errors.append(f"'import {module}' imported '{name}'")
+
+        elapsed_ms: float = timings.get(module, 0) / 1000
+        print(f"import {module}: {elapsed_ms:.1f}ms")
+        if module in ("red_log", "red_log.fmts") and elapsed_ms > budget_ms:
+            errors.append(f"'import {module}' took {elapsed_ms:.1f}ms, budget is {budget_ms}ms")
+
+    return errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=25.0,
+        help="Maximum cumulative import time of 'red_log' and 'red_log.fmts'.",
+    )
+    args = parser.parse_args()
+
+    errors: list[str] = check(args.budget_ms)
+    for error in errors:
+        print(f"FAIL: {error}", file=sys.stderr)
+
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
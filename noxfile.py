@@ -24,7 +24,7 @@ PY_VERSIONS: list[str] = ["3.12", "3.11"]
 ## Set PDM version to install throughout
 PDM_VER: str = "2.11.2"
 ## Set paths to lint with the lint session
-LINT_PATHS: list[str] = ["src", "tests", "./noxfile.py"]
+LINT_PATHS: list[str] = ["src", "tests", "benchmarks", "./noxfile.py"]
 
 ## Get tuple of Python ver ('maj', 'min', 'mic')
 PY_VER_TUPLE = platform.python_version_tuple()
@@ -149,6 +149,32 @@ def run_tests(session: nox.Session, pdm_ver: str):
     )
 
 
+@nox.session(python=[DEFAULT_PYTHON], name="benchmarks")
+@nox.parametrize("pdm_ver", [PDM_VER])
+def run_benchmarks(session: nox.Session, pdm_ver: str):
+    session.install(f"pdm>={pdm_ver}")
+    session.run("pdm", "install")
+
+    ## Pass extra args to the benchmark runner, i.e. `nox -s benchmarks -- --quick`
+    bench_args: list[str] = session.posargs or [
+        "--output",
+        f"benchmarks/results/benchmarks-py{DEFAULT_PYTHON}.json",
+    ]
+
+    print("Running benchmarks")
+    session.run("pdm", "run", "python", "-m", "benchmarks", *bench_args)
+
+
+@nox.session(python=PY_VERSIONS, name="import-time")
+@nox.parametrize("pdm_ver", [PDM_VER])
+def run_import_time_check(session: nox.Session, pdm_ver: str):
+    session.install(f"pdm>={pdm_ver}")
+    session.run("pdm", "install")
+
+    print("Checking red_log import time")
+    session.run("pdm", "run", "python", "-m", "benchmarks.check_imports", *session.posargs)
+
+
 @nox.session(python=PY_VERSIONS, name="pre-commit-all")
 def run_pre_commit_all(session: nox.Session):
     session.install("pre-commit")
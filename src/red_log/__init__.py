@@ -4,18 +4,67 @@ Configurations (formatters, handlers, loggers, filters) can be created as classe
 can be compiled down to `logging.config.dictConfig`-compatible dicts using each class's
 `.get_dictconfig()` method, or by passing multiple initialized configuration classes to the
 `assemble_configdict()` method.
+
+Submodules and their attributes are imported on first access (PEP 562), so importing a light
+submodule like `red_log.fmts` does not import the config classes, handlers, and helpers.
 """
 
 from __future__ import annotations
 
-from . import config_classes, fmts
-from .__base import BASE_LOGGING_CONFIG_DICT
-from .helpers import (
-    assemble_configdict,
-    get_formatter_config,
-    get_logger_config,
-    get_rotatingfilehandler_config,
-    get_streamhandler_config,
-    print_configdict,
-    save_configdict,
+## Type checkers treat this as True; avoids importing `typing` at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from . import config_classes, fmts, formatters, handlers, helpers, metrics, records, runtime
+    from .__base import BASE_LOGGING_CONFIG_DICT
+    from .helpers import (
+        assemble_configdict,
+        get_formatter_config,
+        get_logger_config,
+        get_rotatingfilehandler_config,
+        get_streamhandler_config,
+        load_configdict,
+        print_configdict,
+        save_configdict,
+        validate_configdict,
+    )
+
+_LAZY_SUBMODULES: frozenset[str] = frozenset(
+    {"config_classes", "fmts", "formatters", "handlers", "helpers", "metrics", "records", "runtime"}
 )
+## Attribute name -> module it is imported from
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "BASE_LOGGING_CONFIG_DICT": ".__base",
+    "assemble_configdict": ".helpers",
+    "get_formatter_config": ".helpers",
+    "get_logger_config": ".helpers",
+    "get_rotatingfilehandler_config": ".helpers",
+    "get_streamhandler_config": ".helpers",
+    "load_configdict": ".helpers",
+    "print_configdict": ".helpers",
+    "save_configdict": ".helpers",
+    "validate_configdict": ".helpers",
+}
+
+__all__ = sorted(_LAZY_SUBMODULES | _LAZY_ATTRIBUTES.keys())
+
+
+def __getattr__(name: str):
+    """Import submodules and attributes of this package on first access."""
+    import importlib
+
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    module_name: str | None = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    ## Cache on the module, so this function is not called again for `name`
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,28 @@
+"""Convert logging level names to level numbers."""
+
+from __future__ import annotations
+
+import logging
+import typing as t
+
+
+def level_to_int(level: t.Union[int, str]) -> int:
+    """Convert a level name (i.e. `"ERROR"`) or number to a level number.
+
+    Params:
+        level (int | str): A logging level number, or the name of a level (case insensitive).
+
+    Returns:
+        (int): The level number.
+
+    Raises:
+        ValueError: When `level` is not the name of a registered logging level.
+
+    """
+    if isinstance(level, int):
+        return level
+
+    try:
+        return logging.getLevelNamesMapping()[f"{level}".upper()]
+    except KeyError as exc:
+        raise ValueError(f"Unknown logging level: '{level}'") from exc
@@ -8,31 +8,96 @@ of the class's configuration, which is compatible with the logging dictConfig.
 These dicts must be added to the configuration using the `.assemble_configdict()` method in `logging_utils()`. The classes
 exist to aid in creating formatters, handlers, and loggers for a logging configuration by presenting all available options.
 
+Submodules and their attributes are imported on first access (PEP 562).
 """
 
 from __future__ import annotations
 
-from . import prefab
-from .base import BASE_LOGGING_CONFIG_DICT
-from .filters import (
-    critical_filter,
-    debug_filter,
-    error_filter,
-    info_filter,
-    warning_filter,
-)
-from .formatters import FormatterConfig
-from .handlers import FileHandlerConfig, RotatingFileHandlerConfig, StreamHandlerConfig
-from .loggers import LoggerConfig, LoggerFactory
-from .prefab import third_party
-from .prefab.third_party.red_log_logging import (
-    get_red_log_console_handler,
-    get_red_log_formatter,
-    get_red_log_logger,
-)
-from .types import (
-    HANDLER_CLASSES_TYPE,
-    HANDLER_CLASSES_TYPE_ANNOTATION,
-    LOGGING_CONFIG_DICT_TYPE,
-    LOGGING_CONFIG_DICT_TYPE_ANNOTATION,
+## Type checkers treat this as True; avoids importing `typing` at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from . import base, filters, formatters, handlers, instrumentation, loggers, prefab, types
+    from .base import BASE_LOGGING_CONFIG_DICT
+    from .filters import (
+        FilterConfig,
+        critical_filter,
+        debug_filter,
+        error_filter,
+        info_filter,
+        warning_filter,
+    )
+    from .formatters import FormatterConfig, JsonFormatterConfig
+    from .handlers import FileHandlerConfig, RotatingFileHandlerConfig, StreamHandlerConfig
+    from .instrumentation import MetricsConfig, ProfilingConfig
+    from .loggers import LoggerConfig, LoggerFactory
+    from .prefab import third_party
+    from .prefab.third_party.red_log_logging import (
+        get_red_log_console_handler,
+        get_red_log_formatter,
+        get_red_log_logger,
+    )
+    from .types import (
+        FORMATTER_CLASSES_TYPE,
+        FORMATTER_CLASSES_TYPE_ANNOTATION,
+        HANDLER_CLASSES_TYPE,
+        HANDLER_CLASSES_TYPE_ANNOTATION,
+        LOGGING_CONFIG_DICT_TYPE,
+        LOGGING_CONFIG_DICT_TYPE_ANNOTATION,
+    )
+
+_LAZY_SUBMODULES: frozenset[str] = frozenset(
+    {"base", "filters", "formatters", "handlers", "instrumentation", "loggers", "prefab", "types"}
 )
+## Attribute name -> module it is imported from
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "BASE_LOGGING_CONFIG_DICT": ".base",
+    "FilterConfig": ".filters",
+    "critical_filter": ".filters",
+    "debug_filter": ".filters",
+    "error_filter": ".filters",
+    "info_filter": ".filters",
+    "warning_filter": ".filters",
+    "FormatterConfig": ".formatters",
+    "JsonFormatterConfig": ".formatters",
+    "FileHandlerConfig": ".handlers",
+    "RotatingFileHandlerConfig": ".handlers",
+    "StreamHandlerConfig": ".handlers",
+    "MetricsConfig": ".instrumentation",
+    "ProfilingConfig": ".instrumentation",
+    "LoggerConfig": ".loggers",
+    "LoggerFactory": ".loggers",
+    "third_party": ".prefab",
+    "get_red_log_console_handler": ".prefab.third_party.red_log_logging",
+    "get_red_log_formatter": ".prefab.third_party.red_log_logging",
+    "get_red_log_logger": ".prefab.third_party.red_log_logging",
+    "FORMATTER_CLASSES_TYPE": ".types",
+    "FORMATTER_CLASSES_TYPE_ANNOTATION": ".types",
+    "HANDLER_CLASSES_TYPE": ".types",
+    "HANDLER_CLASSES_TYPE_ANNOTATION": ".types",
+    "LOGGING_CONFIG_DICT_TYPE": ".types",
+    "LOGGING_CONFIG_DICT_TYPE_ANNOTATION": ".types",
+}
+
+__all__ = sorted(_LAZY_SUBMODULES | _LAZY_ATTRIBUTES.keys())
+
+
+def __getattr__(name: str):
+    """Import submodules and attributes of this package on first access."""
+    import importlib
+
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    module_name: str | None = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    ## Cache on the module, so this function is not called again for `name`
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,3 +4,4 @@ from __future__ import annotations
 
 from ._base_config import BASE_LOGGING_CONFIG_DICT
 from ._bases import BaseHandlerConfig, BaseLoggingConfig
+from ._frozen import FrozenDict, freeze, thaw
@@ -3,19 +3,60 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 import typing as t
 
-@dataclass
+from ._frozen import freeze
+
+
+@dataclass(frozen=True)
 class BaseLoggingConfig(ABC):
-    """Abstract base class for a full logging config dict."""
+    """Abstract base class for a full logging config dict.
+
+    Config classes are frozen: lists and dicts passed to them are stored as tuples and `FrozenDict`s,
+    so config objects are immutable and hashable, and can be used as cache keys. The hash is computed
+    once per object, so looking the same objects up again (i.e. in `assemble_configdict()`'s cache)
+    does not hash every field again.
+    """
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        ## Set before @dataclass processes the subclass, so it keeps this __hash__ instead of generating one
+        cls.__hash__ = BaseLoggingConfig.__hash__
+
+    def __post_init__(self) -> None:
+        for _field in fields(self):
+            object.__setattr__(self, _field.name, freeze(getattr(self, _field.name)))
+
+    def __hash__(self) -> int:
+        ## Same fields as the __hash__ @dataclass generates
+        try:
+            return self.__dict__["_hash"]
+        except KeyError:
+            _hash: int = hash(
+                tuple(
+                    getattr(self, _field.name)
+                    for _field in fields(self)
+                    if (_field.compare if _field.hash is None else _field.hash)
+                )
+            )
+            object.__setattr__(self, "_hash", _hash)
+
+            return _hash
+
+    def __getstate__(self) -> dict[str, t.Any]:
+        ## String hashes differ between processes, so the cached hash is not pickled
+        state: dict[str, t.Any] = dict(self.__dict__)
+        state.pop("_hash", None)
+
+        return state
 
     @abstractmethod
     def get_configdict(self) -> None:
         pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class BaseHandlerConfig(BaseLoggingConfig):
     """Abstract base class for a logging handler dict.
 
@@ -0,0 +1,100 @@
+"""Read-only containers for config classes and compiled logging dictConfigs.
+
+Config classes are frozen dataclasses, and `assemble_configdict()` returns `FrozenDict`s, so one
+compiled config can be cached and shared between callers without being copied.
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+
+class FrozenDict(dict):
+    """A read-only, hashable `dict`.
+
+    `FrozenDict` is a real `dict` subclass, so it works everywhere a dict is expected (including
+    `logging.config.dictConfig()`, which copies the dicts it is given, and `json.dumps()`), but any
+    attempt to modify it raises a `TypeError`. Use `.copy()` for a mutable shallow copy, or
+    `thaw()` for a mutable deep copy.
+
+    A `FrozenDict` is hashable if all of its values are hashable.
+    """
+
+    __slots__ = ("_hash",)
+
+    def _readonly(self, *args, **kwargs) -> t.NoReturn:
+        raise TypeError(f"{self.__class__.__name__} is read-only")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            _hash: int = hash(frozenset(self.items()))
+            object.__setattr__(self, "_hash", _hash)
+
+            return _hash
+
+    def __copy__(self) -> FrozenDict:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> FrozenDict:
+        ## Immutable, so sharing is safe (like a tuple of immutable values)
+        return self
+
+    def __reduce__(self) -> tuple:
+        return (self.__class__, (dict(self),))
+
+
+## Types that never need to be frozen, checked first because they are the most common values
+_SCALAR_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None), bytes})
+
+
+def freeze(value: t.Any) -> t.Any:
+    """Recursively convert dicts, lists, and sets in `value` to `FrozenDict`s, tuples, and frozensets.
+
+    Values that are already frozen are returned as-is, so frozen structures are shared instead of copied.
+
+    Params:
+        value (Any): The value to freeze.
+
+    Returns:
+        (Any): A read-only version of `value`.
+
+    """
+    if type(value) in _SCALAR_TYPES or isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)) and not hasattr(value, "_fields"):
+        return tuple([freeze(v) for v in value])
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+
+    return value
+
+
+def thaw(value: t.Any) -> t.Any:
+    """Recursively convert `FrozenDict`s and tuples in `value` to mutable dicts and lists.
+
+    Params:
+        value (Any): The value to thaw, i.e. a logging config dict returned by `assemble_configdict()`.
+
+    Returns:
+        (Any): A mutable copy of `value`.
+
+    """
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)) and not hasattr(value, "_fields"):
+        return [thaw(v) for v in value]
+
+    return value
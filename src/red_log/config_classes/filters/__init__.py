@@ -2,15 +2,26 @@
 
 When using a dictConfig, you only need to reference these filters by name, i.e. `filters=["info_filter", "debug_filter", ...]`, but you
 do need to import the filter function into whatever script runs the `logging.config.dictConfig()` function.
+
+Filter classes (like the sampling filters) are added to a config with a `FilterConfig`, and referenced by the `FilterConfig`'s name.
 """
 
 from __future__ import annotations
 
-from . import loglevel_filters
+from . import loglevel_filters, sampling_filters, suppression_filters
+from ._filters import FilterConfig
 from .loglevel_filters import (
+    LEVEL_FILTER_THRESHOLDS,
     critical_filter,
     debug_filter,
     error_filter,
     info_filter,
     warning_filter,
 )
+from .sampling_filters import (
+    DropReportingFilter,
+    HashSamplingFilter,
+    RateSamplingFilter,
+    TokenBucketFilter,
+)
+from .suppression_filters import DuplicateSuppressionFilter
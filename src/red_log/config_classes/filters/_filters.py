@@ -2,25 +2,52 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
+import logging.config
+import typing as t
 
 from red_log.config_classes.base import BaseLoggingConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class FilterConfig(BaseLoggingConfig):
     """Define a logging filter.
 
+    A filter is either a function (`func`), or a filter class (`filter_class`) that is created with
+    `params` as keyword arguments, i.e. one of the sampling filters in
+    `red_log.config_classes.filters.sampling_filters`.
+
     Params:
         name (str): A name for the filter, which can be added to a dictConfig's `filters` param.
         func (callable): The filter function to use when this class is called by a handler.
+        filter_class (str | None): Dotted path to a `logging.Filter` class (or factory), used instead of `func`.
+        params (dict[str, Any]): Keyword arguments for `filter_class`.
     """
 
     name: str
-    func: callable
+    func: t.Callable[[logging.LogRecord], bool] | None = None
+    filter_class: str | None = None
+    params: dict[str, t.Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if (self.func is None) == (self.filter_class is None):
+            raise ValueError(f"Filter '{self.name}' needs exactly one of func or filter_class.")
+
+        super().__post_init__()
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the filter described by this class."""
+        if self.filter_class is not None:
+            return {self.name: {"()": self.filter_class, **self.params}}
+
+        return {self.name: {"()": self.get_filter}}
 
     def get_filter(self) -> logging.Filter:
+        if self.filter_class is not None:
+            factory = logging.config.BaseConfigurator({}).resolve(self.filter_class)
+            return factory(**self.params)
+
         filter_obj = logging.Filter(name=self.name)
         filter_obj.filter = self.func
         return filter_obj
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from ._loglevel_filters import (
+    LEVEL_FILTER_THRESHOLDS,
     critical_filter,
     debug_filter,
     error_filter,
@@ -8,6 +8,8 @@ When adding these methods to a config, you must import the function into the sam
 from __future__ import annotations
 
 import logging
+import typing as t
+
 
 def debug_filter(record: logging.LogRecord) -> bool:
     """Filter to only show DEBUG and above."""
@@ -32,3 +34,14 @@ def error_filter(record: logging.LogRecord) -> bool:
 def critical_filter(record: logging.LogRecord) -> bool:
     """Filter to only show CRITICAL and above."""
     return record.levelno >= logging.CRITICAL
+
+
+## Filter function -> the level it is equivalent to as a handler `level`. Used by `assemble_configdict()`
+#  to fold these filters into handler levels.
+LEVEL_FILTER_THRESHOLDS: dict[t.Callable[[logging.LogRecord], bool], int] = {
+    debug_filter: logging.DEBUG,
+    info_filter: logging.INFO,
+    warning_filter: logging.WARNING,
+    error_filter: logging.ERROR,
+    critical_filter: logging.CRITICAL,
+}
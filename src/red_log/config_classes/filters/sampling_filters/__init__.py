@@ -0,0 +1,10 @@
+"""Sampling filters, which pass a fraction of low-level records and count the ones they drop."""
+
+from __future__ import annotations
+
+from ._sampling_filters import (
+    DropReportingFilter,
+    HashSamplingFilter,
+    RateSamplingFilter,
+    TokenBucketFilter,
+)
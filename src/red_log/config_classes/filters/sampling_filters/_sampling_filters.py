@@ -0,0 +1,239 @@
+"""Filters that sample high-volume records, for use with `FilterConfig(filter_class=...)`.
+
+Records above `max_level` (by default, WARNING and above) always pass. Dropped records are counted
+per logger, and the counts are logged to the `red_log.sampling` logger every `report_interval`
+seconds, and once more at interpreter exit.
+
+```python title="Sample 10% of DEBUG/INFO records" linenums="1"
+FilterConfig(
+    name="sample",
+    filter_class="red_log.config_classes.filters.RateSamplingFilter",
+    params={"rate": 0.1},
+)
+```
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections import Counter
+import logging
+import random
+import threading
+import time
+import typing as t
+import weakref
+import zlib
+
+from red_log.__levels import level_to_int
+
+## Logger that dropped-record reports are logged to
+REPORT_LOGGER_NAME: str = "red_log.sampling"
+
+## Filters with reporting enabled, reported one last time at exit
+_REPORTING_FILTERS: weakref.WeakSet[DropReportingFilter] = weakref.WeakSet()
+
+
+def _report_all() -> None:
+    for drop_filter in list(_REPORTING_FILTERS):
+        drop_filter.report()
+
+
+## Registered after `logging` registers logging.shutdown(), so it runs before the handlers are closed
+atexit.register(_report_all)
+
+
+class DropReportingFilter(logging.Filter):
+    """Base class for filters that drop some records, count them, and report the counts.
+
+    Subclasses implement `sample()`, which returns `True` to keep a record. Drops are reported at most
+    `report_interval` seconds after they happen, by the next dropped record or by a timer thread if no
+    more records are dropped, and at interpreter exit.
+
+    Params:
+        max_level (int | str): Only records at or below this level are sampled. Higher records always pass.
+        report_interval (float): Seconds between reports of dropped records. `0` disables reporting.
+        report_level (int | str): Level of the report records.
+        name (str): Passed to `logging.Filter`; only records from this logger (and its children) are sampled.
+    """
+
+    def __init__(
+        self,
+        max_level: t.Union[int, str] = logging.INFO,
+        report_interval: float = 60.0,
+        report_level: t.Union[int, str] = logging.WARNING,
+        name: str = "",
+    ) -> None:
+        super().__init__(name)
+
+        self.max_level: int = level_to_int(max_level)
+        self.report_interval = report_interval
+        self.report_level: int = level_to_int(report_level)
+
+        ## Logger name -> records dropped since the last report
+        self.dropped: Counter[str] = Counter()
+        self._dropped_lock = threading.Lock()
+        self._last_report: float = time.monotonic()
+        ## Set while this filter logs a report, so the report itself is never sampled
+        self._reporting = threading.local()
+        ## Reports drops when no later record is dropped to trigger the report
+        self._timer: threading.Timer | None = None
+
+        if self.report_interval > 0:
+            _REPORTING_FILTERS.add(self)
+
+    def sample(self, record: logging.LogRecord) -> bool:
+        """Return `True` to keep `record`."""
+        raise NotImplementedError("Subclasses must implement sample method")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level or not super().filter(record):
+            return True
+        if getattr(self._reporting, "active", False):
+            return True
+
+        if self.sample(record):
+            return True
+
+        with self._dropped_lock:
+            self.dropped[record.name] += 1
+            if self.report_interval <= 0:
+                return False
+
+            remaining: float = self.report_interval - (time.monotonic() - self._last_report)
+
+            if remaining > 0 and self._timer is None:
+                self._timer = threading.Timer(remaining, self._report_on_timer)
+                self._timer.name = f"red_log-{self.__class__.__name__}-{id(self)}"
+                self._timer.daemon = True
+                self._timer.start()
+
+        if remaining <= 0:
+            self.report()
+
+        return False
+
+    def _report_on_timer(self) -> None:
+        with self._dropped_lock:
+            self._timer = None
+
+        self.report()
+
+    def report(self) -> None:
+        """Log the number of records dropped since the last report, and reset the counts."""
+        with self._dropped_lock:
+            dropped, self.dropped = self.dropped, Counter()
+            elapsed: float = time.monotonic() - self._last_report
+            self._last_report = time.monotonic()
+
+        if not dropped:
+            return
+
+        self._reporting.active = True
+        try:
+            logging.getLogger(REPORT_LOGGER_NAME).log(
+                self.report_level,
+                "%s dropped %d record(s) in the last %.1fs: %s",
+                self.__class__.__name__,
+                sum(dropped.values()),
+                elapsed,
+                dict(dropped.most_common()),
+            )
+        finally:
+            self._reporting.active = False
+
+
+class RateSamplingFilter(DropReportingFilter):
+    """Keep a random `rate` fraction of records.
+
+    Params:
+        rate (float): Fraction (0.0-1.0) of records to keep.
+    """
+
+    def __init__(self, rate: float = 0.1, **kwargs: t.Any) -> None:
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("rate must be between 0.0 and 1.0.")
+
+        super().__init__(**kwargs)
+
+        self.rate = rate
+        self._random = random.random
+
+    def sample(self, record: logging.LogRecord) -> bool:
+        return self._random() < self.rate
+
+
+class HashSamplingFilter(DropReportingFilter):
+    """Keep records whose `key` attribute hashes into the first `rate` fraction of buckets.
+
+    All records with the same key value (i.e. every record for one request id) are kept or dropped
+    together, and the decision is the same in every process. Records without the attribute are kept.
+
+    Params:
+        key (str): Name of the record attribute to sample by, i.e. set with `extra={"request_id": ...}`.
+        rate (float): Fraction (0.0-1.0) of key values to keep.
+    """
+
+    _BUCKETS: int = 10_000
+
+    def __init__(self, key: str = "request_id", rate: float = 0.1, **kwargs: t.Any) -> None:
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("rate must be between 0.0 and 1.0.")
+
+        super().__init__(**kwargs)
+
+        self.key = key
+        self.rate = rate
+        self._threshold: int = round(rate * self._BUCKETS)
+
+    def sample(self, record: logging.LogRecord) -> bool:
+        value: t.Any = getattr(record, self.key, None)
+        if value is None:
+            return True
+
+        ## crc32 instead of hash(), which is randomized per process for strings
+        return zlib.crc32(str(value).encode()) % self._BUCKETS < self._threshold
+
+
+class TokenBucketFilter(DropReportingFilter):
+    """Rate-limit each logger to `rate` records per second, allowing bursts of up to `burst` records.
+
+    Every logger gets its own bucket, so one noisy logger cannot use up the budget of the others.
+
+    Params:
+        rate (float): Records per second each logger may sustain.
+        burst (int): Maximum records a logger may log at once after being quiet.
+    """
+
+    def __init__(self, rate: float = 100.0, burst: int = 200, **kwargs: t.Any) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+        if burst < 1:
+            raise ValueError("burst must be at least 1.")
+
+        super().__init__(**kwargs)
+
+        self.rate = rate
+        self.burst = burst
+
+        ## Logger name -> [tokens, time of last refill]
+        self._buckets: dict[str, list[float]] = {}
+        self._buckets_lock = threading.Lock()
+
+    def sample(self, record: logging.LogRecord) -> bool:
+        now: float = time.monotonic()
+
+        with self._buckets_lock:
+            bucket: list[float] | None = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = [float(self.burst), now]
+
+            tokens: float = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+            if tokens >= 1.0:
+                bucket[0] = tokens - 1.0
+                return True
+
+            bucket[0] = tokens
+            return False
@@ -0,0 +1,5 @@
+"""Filters that suppress repeated records."""
+
+from __future__ import annotations
+
+from ._suppression_filters import DuplicateSuppressionFilter
@@ -0,0 +1,249 @@
+"""Suppress repeats of the same record, and summarize how many were suppressed.
+
+```python title="Suppress repeats for 10 seconds" linenums="1"
+FilterConfig(
+    name="dedupe",
+    filter_class="red_log.config_classes.filters.DuplicateSuppressionFilter",
+    params={"window": 10.0},
+)
+```
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections import OrderedDict
+import logging
+import threading
+import time
+import typing as t
+import weakref
+
+from red_log.__levels import level_to_int
+
+## (logger name, level, message template, pathname, lineno)
+_RecordKey = t.Tuple[str, int, t.Any, str, int]
+
+## Live filters, whose pending summaries are logged one last time at exit
+_SUPPRESSION_FILTERS: weakref.WeakSet[DuplicateSuppressionFilter] = weakref.WeakSet()
+
+
+def _flush_all() -> None:
+    for suppression_filter in list(_SUPPRESSION_FILTERS):
+        suppression_filter.flush_summaries()
+
+
+## Registered after `logging` registers logging.shutdown(), so it runs before the handlers are closed
+atexit.register(_flush_all)
+
+
+class _Seen:
+    """A record that was passed, and the repeats of it that were suppressed since."""
+
+    __slots__ = ("first_seen", "suppressed", "record")
+
+    def __init__(self, first_seen: float, record: logging.LogRecord) -> None:
+        self.first_seen = first_seen
+        self.suppressed: int = 0
+        self.record = record
+
+
+class DuplicateSuppressionFilter(logging.Filter):
+    """Pass the first occurrence of a record, and drop repeats of it for `window` seconds.
+
+    Records are the same when they have the same logger, level, message template (`msg`, before
+    `args` are merged in), and call site (pathname:lineno). When the window of a record that had repeats
+    ends, a summary record ("Message repeated N more time(s)...") is created with the same logger, level,
+    and call site. When the filter is attached to the logger, the summary is handled by the logger like any
+    other record. When it is attached to handlers, the summary is only passed to the handlers this filter
+    instance is attached to (including handlers behind a queue or async handler), so handlers that did not
+    suppress the repeats do not get a summary of them.
+
+    At most `maxsize` records are tracked. When the map is full, the oldest record's window is ended early.
+
+    A summary is logged when a later record is filtered after the window ended, or by a timer thread at
+    the end of the window if no more records come. Pending summaries are logged at interpreter exit, or
+    by calling `flush_summaries()`.
+
+    Params:
+        window (float): Seconds to suppress repeats of a record for.
+        maxsize (int): Maximum number of distinct records to track.
+        min_level (int | str): Only records at or above this level are suppressed.
+        name (str): Passed to `logging.Filter`; only records from this logger (and its children) are suppressed.
+    """
+
+    def __init__(
+        self,
+        window: float = 10.0,
+        maxsize: int = 1024,
+        min_level: t.Union[int, str] = logging.NOTSET,
+        name: str = "",
+    ) -> None:
+        if window <= 0:
+            raise ValueError("window must be greater than 0.")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+
+        super().__init__(name)
+
+        self.window = window
+        self.maxsize = maxsize
+        self.min_level: int = level_to_int(min_level)
+
+        ## Ordered by first_seen, so expired records are always at the front
+        self._seen: OrderedDict[_RecordKey, _Seen] = OrderedDict()
+        self._lock = threading.Lock()
+        ## Set while this filter logs summaries, so they are never suppressed
+        self._summarizing = threading.local()
+        ## Logs summaries when no later record is filtered to trigger them
+        self._timer: threading.Timer | None = None
+
+        _SUPPRESSION_FILTERS.add(self)
+
+    @staticmethod
+    def _get_key(record: logging.LogRecord) -> _RecordKey:
+        msg: t.Any = record.msg
+        if not isinstance(msg, str):
+            try:
+                hash(msg)
+            except TypeError:
+                msg = str(msg)
+
+        return (record.name, record.levelno, msg, record.pathname, record.lineno)
+
+    def _pop_expired(self, now: float) -> list[_Seen]:
+        """Remove records whose window has ended. Caller must hold `_lock`."""
+        expired: list[_Seen] = []
+
+        while self._seen:
+            seen: _Seen = next(iter(self._seen.values()))
+            if now - seen.first_seen < self.window:
+                break
+
+            self._seen.popitem(last=False)
+            expired.append(seen)
+
+        return expired
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.min_level or not super().filter(record):
+            return True
+        if getattr(self._summarizing, "active", False):
+            return True
+
+        key: _RecordKey = self._get_key(record)
+        now: float = record.created
+
+        with self._lock:
+            ended: list[_Seen] = self._pop_expired(now)
+
+            seen: _Seen | None = self._seen.get(key)
+            if seen is None:
+                self._seen[key] = _Seen(now, record)
+                while len(self._seen) > self.maxsize:
+                    ended.append(self._seen.popitem(last=False)[1])
+            else:
+                seen.suppressed += 1
+                if self._timer is None:
+                    self._start_timer(seen.first_seen + self.window - now)
+
+        if ended:
+            self._log_summaries(ended, now)
+
+        return seen is None
+
+    def _start_timer(self, delay: float) -> None:
+        """Log the summaries of windows that end in `delay` seconds. Caller must hold `_lock`."""
+        self._timer = threading.Timer(max(0.0, delay), self._summarize_on_timer)
+        self._timer.name = f"red_log-{self.__class__.__name__}-{id(self)}"
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _summarize_on_timer(self) -> None:
+        now: float = time.time()
+
+        with self._lock:
+            self._timer = None
+            ended: list[_Seen] = self._pop_expired(now)
+
+            ## Wait for the next window that has repeats to summarize
+            for seen in self._seen.values():
+                if seen.suppressed:
+                    self._start_timer(seen.first_seen + self.window - now)
+                    break
+
+        if ended:
+            self._log_summaries(ended, now)
+
+    def _get_owners(self, logger: logging.Logger) -> list[logging.Handler]:
+        """Return the handlers a record from `logger` reaches that this filter is attached to."""
+        owners: list[logging.Handler] = []
+        visited: set[int] = set()
+        pending: list[logging.Handler] = []
+
+        current: logging.Logger | None = logger
+        while current is not None:
+            pending.extend(current.handlers)
+            if not current.propagate:
+                break
+            current = current.parent
+
+        while pending:
+            handler: logging.Handler = pending.pop(0)
+            if id(handler) in visited:
+                continue
+            visited.add(id(handler))
+
+            if self in handler.filters:
+                owners.append(handler)
+
+            ## Handlers that forward records: queue handlers, and red_log's AsyncHandler
+            listener: t.Any = getattr(handler, "listener", None)
+            pending.extend(getattr(listener, "handlers", None) or ())
+            pending.extend(getattr(handler, "_targets", None) or ())
+
+        return owners
+
+    def _log_summaries(self, ended: list[_Seen], now: float) -> None:
+        """Log a summary for each ended record that had repeats."""
+        self._summarizing.active = True
+        try:
+            for seen in ended:
+                if not seen.suppressed:
+                    continue
+
+                original: logging.LogRecord = seen.record
+                logger: logging.Logger = logging.getLogger(original.name)
+                summary: logging.LogRecord = logger.makeRecord(
+                    original.name,
+                    original.levelno,
+                    original.pathname,
+                    original.lineno,
+                    "Message repeated %d more time(s) in the last %.1fs: %s",
+                    (
+                        seen.suppressed,
+                        max(0.0, now - seen.first_seen),
+                        original.getMessage(),
+                    ),
+                    None,
+                    original.funcName,
+                )
+
+                if self in logger.filters:
+                    logger.handle(summary)
+                    continue
+
+                for handler in self._get_owners(logger):
+                    if summary.levelno >= handler.level:
+                        handler.handle(summary)
+        finally:
+            self._summarizing.active = False
+
+    def flush_summaries(self) -> None:
+        """End every tracked record's window, and log summaries for the ones that had repeats."""
+        with self._lock:
+            ended: list[_Seen] = list(self._seen.values())
+            self._seen.clear()
+
+        if ended:
+            self._log_summaries(ended, time.time())
@@ -5,4 +5,4 @@ Formatters define the message and timestamp format for log messages.
 
 from __future__ import annotations
 
-from ._formatters import FormatterConfig
+from ._formatters import FormatterConfig, JsonFormatterConfig
@@ -6,13 +6,16 @@ that can be added to a logging config dict.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import typing as t
 
 from red_log.config_classes.base import BaseLoggingConfig
 from red_log.fmts._formats import (
     DATE_FMT_DATE_ONLY,
     DATE_FMT_STANDARD,
     DATE_FMT_TIME_ONLY,
+    JSON_FIELDS_DETAILED,
+    JSON_FIELDS_STANDARD,
     MESSAGE_FMT_BASIC,
     MESSAGE_FMT_DETAILED,
     MESSAGE_FMT_STANDARD,
@@ -21,7 +24,7 @@ from red_log.fmts._formats import (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class FormatterConfig(BaseLoggingConfig):
     """Define a logging formatter.
 
@@ -33,6 +36,8 @@ class FormatterConfig(BaseLoggingConfig):
             means formats need to be written like `%(asctime)s %(levelname)s %(message)s`. If
             you change this style, make sure the `fmt` you pass uses the correct formatting style.
         validate (bool): When `True`, the configuration dict this formatter returns will be validated by the logging module.
+        formatter_class (str | None): Dotted path to a `logging.Formatter` subclass to use instead of the stdlib
+            `logging.Formatter`, i.e. `red_log.formatters.CompiledFormatter`.
 
     """
 
@@ -41,6 +46,7 @@ class FormatterConfig(BaseLoggingConfig):
     datefmt: str = DATE_FMT_STANDARD
     style: str = "%"
     validate: bool = True
+    formatter_class: str | None = None
 
     def get_configdict(self) -> dict[str, dict[str, str]]:
         """Return a dict representation of the formatter described by this class."""
@@ -50,5 +56,54 @@ class FormatterConfig(BaseLoggingConfig):
         if self.style:
             formatter_dict[self.name]["style"] = self.style
         formatter_dict[self.name]["validate"] = self.validate
+        if self.formatter_class:
+            formatter_dict[self.name]["class"] = self.formatter_class
 
         return formatter_dict
+
+
+@dataclass(frozen=True)
+class JsonFormatterConfig(BaseLoggingConfig):
+    """Define a red_log JsonFormatter, which outputs one JSON object per line.
+
+    Params:
+        name (str): The name of the formatter.
+        fields (list[str]): The LogRecord attributes to output, in order. `asctime` and `message` are
+            computed the same way `logging.Formatter` computes them.
+        datefmt (str): The string formatting to use for `asctime`.
+        rename (dict[str, str] | None): Map of LogRecord attribute -> JSON key, i.e. `{"levelname": "level"}`.
+        static_fields (dict[str, Any] | None): Keys & values added to every log line, i.e. `{"service": "api"}`.
+
+    """
+
+    name: str = None
+    fields: list[str] = field(default_factory=lambda: list(JSON_FIELDS_STANDARD))
+    datefmt: str = DATE_FMT_STANDARD
+    rename: dict[str, str] | None = None
+    static_fields: dict[str, t.Any] | None = None
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the formatter described by this class."""
+        formatter_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "()": self.get_formatter_class(),
+                "fields": list(self.fields),
+            }
+        }
+        if self.datefmt:
+            formatter_dict[self.name]["datefmt"] = self.datefmt
+        if self.rename:
+            formatter_dict[self.name]["rename"] = dict(self.rename)
+        if self.static_fields:
+            formatter_dict[self.name]["static_fields"] = dict(self.static_fields)
+
+        return formatter_dict
+
+    def get_formatter_class(self) -> str:
+        """Return the logging formatter class this class represents.
+
+        Returns:
+            (str): `red_log.formatters.JsonFormatter`.
+
+        """
+        return "red_log.formatters.JsonFormatter"
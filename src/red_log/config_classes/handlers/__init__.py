@@ -6,11 +6,18 @@ Handlers define what to do with log messages as they are created.
 from __future__ import annotations
 
 from ._handlers import (
+    QUEUEABLE_HANDLER_CLASSES,
+    AsyncHandlerConfig,
+    BatchingSocketHandlerConfig,
+    BufferedFileHandlerConfig,
+    CompressingRotatingFileHandlerConfig,
     FileHandlerConfig,
+    MmapFileHandlerConfig,
     QueueHandlerConfig,
     QueueListenerConfig,
     RotatingFileHandlerConfig,
     SMTPHandlerConfig,
+    ShardedFileHandlerConfig,
     SocketHandlerConfig,
     StreamHandlerConfig,
     TimedRotatingFileHandlerConfig,
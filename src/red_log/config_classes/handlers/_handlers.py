@@ -16,7 +16,7 @@ from red_log.config_classes.base import (
 )
 
 
-@dataclass
+@dataclass(frozen=True)
 class StreamHandlerConfig(BaseHandlerConfig):
     """Define a logging StreamHandler.
 
@@ -38,7 +38,7 @@ class StreamHandlerConfig(BaseHandlerConfig):
             }
         }
         if self.filters:
-            handler_dict["filters"] = self.filters
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -51,7 +51,7 @@ class StreamHandlerConfig(BaseHandlerConfig):
         return "logging.StreamHandler"
 
 
-@dataclass
+@dataclass(frozen=True)
 class FileHandlerConfig(BaseHandlerConfig):
     """Define a logging FileHandler.
 
@@ -71,6 +71,8 @@ class FileHandlerConfig(BaseHandlerConfig):
                 "filename": self.filename,
             }
         }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -83,7 +85,7 @@ class FileHandlerConfig(BaseHandlerConfig):
         return "logging.FileHandler"
 
 
-@dataclass
+@dataclass(frozen=True)
 class RotatingFileHandlerConfig(BaseHandlerConfig):
     """Define a logging RotatingFileHandler.
 
@@ -110,6 +112,8 @@ class RotatingFileHandlerConfig(BaseHandlerConfig):
                 "backupCount": self.backupCount,
             }
         }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -122,7 +126,221 @@ class RotatingFileHandlerConfig(BaseHandlerConfig):
         return "logging.handlers.RotatingFileHandler"
 
 
-@dataclass
+@dataclass(frozen=True)
+class CompressingRotatingFileHandlerConfig(BaseHandlerConfig):
+    """Define a red_log CompressingRotatingFileHandler.
+
+    The log file is rotated when it reaches `maxBytes`, or at the next `when`/`interval` boundary,
+    whichever comes first. Rotated files are compressed and pruned by a background thread.
+
+    Params:
+        filename (str | None): The name/path of the file to log messages to.
+        maxBytes (int): The maximum size of the file (in bytes) before it is rotated. `0` disables size-based rotation.
+        when (str): Time of day/unit to rotate log files, i.e. `midnight`, `H`, `W0`.
+        interval (int): Rotate every `interval` occurrences of `when`.
+        backupCount (int): Number of rotated (compressed) log files to keep. `0` keeps all of them.
+        compression (str | None): `gzip`, `xz`, or `zstd` (requires the `zstandard` package). `None` disables compression.
+        utc (bool): Use UTC for time-based rotation and rotated file names.
+
+    """
+
+    filename: str | None = field(default="app.log")
+    maxBytes: int = 0
+    when: str = "midnight"
+    interval: int = 1
+    backupCount: int = 0
+    compression: str | None = "gzip"
+    utc: bool = False
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "filename": f"{self.filename}",
+                "maxBytes": self.maxBytes,
+                "when": self.when,
+                "interval": self.interval,
+                "backupCount": self.backupCount,
+                "compression": self.compression,
+                "utc": self.utc,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_log.handlers.CompressingRotatingFileHandler`.
+
+        """
+        return "red_log.handlers.CompressingRotatingFileHandler"
+
+
+@dataclass(frozen=True)
+class BufferedFileHandlerConfig(BaseHandlerConfig):
+    """Define a red_log BufferedFileHandler.
+
+    Formatted records are collected in a preallocated buffer and written to the file in one
+    `write()` call when the buffer fills, when `flush_interval` milliseconds pass, or when a
+    record at or above `flush_level` is logged.
+
+    Params:
+        filename (str | None): The name/path of the file to log messages to.
+        mode (str): `a` to append to the file, `w` to truncate it first.
+        encoding (str): The encoding to write records with.
+        capacity (int): Size of the write buffer, in bytes.
+        flush_interval (int): Maximum time (in milliseconds) a record waits in the buffer. `0` disables time-based flushing.
+        flush_level (str): Records at or above this level flush the buffer immediately.
+
+    """
+
+    filename: str | None = field(default="app.log")
+    mode: str = "a"
+    encoding: str = "utf-8"
+    capacity: int = 64 * 1024
+    flush_interval: int = 1000
+    flush_level: str = "ERROR"
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "filename": f"{self.filename}",
+                "mode": self.mode,
+                "encoding": self.encoding,
+                "capacity": self.capacity,
+                "flush_interval": self.flush_interval,
+                "flush_level": self.flush_level,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_log.handlers.BufferedFileHandler`.
+
+        """
+        return "red_log.handlers.BufferedFileHandler"
+
+
+@dataclass(frozen=True)
+class MmapFileHandlerConfig(BaseHandlerConfig):
+    """Define a red_log MmapFileHandler.
+
+    Records are copied into preallocated, memory-mapped segment files (`<filename>.000001`, ...) instead of
+    being written with one `write()` call each. Read segments with `red_log.handlers.read_mmap_segment()`.
+
+    Params:
+        filename (str | None): The base name/path of the segment files.
+        segment_size (int): Size (in bytes) each segment file is preallocated to.
+        backupCount (int): Number of full segments to keep. `0` keeps all of them.
+        encoding (str): The encoding to write records with.
+
+    """
+
+    filename: str | None = field(default="app.log")
+    segment_size: int = 64 * 1024 * 1024
+    backupCount: int = 0
+    encoding: str = "utf-8"
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "filename": f"{self.filename}",
+                "segment_size": self.segment_size,
+                "backupCount": self.backupCount,
+                "encoding": self.encoding,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_log.handlers.MmapFileHandler`.
+
+        """
+        return "red_log.handlers.MmapFileHandler"
+
+
+@dataclass(frozen=True)
+class ShardedFileHandlerConfig(BaseHandlerConfig):
+    """Define a red_log ShardedFileHandler.
+
+    Each logging thread formats its records into its own append buffer without taking a lock, and
+    a background thread merges the buffers in `order` and writes them to the file every
+    `flush_interval` milliseconds.
+
+    Params:
+        filename (str | None): The name/path of the file to log messages to.
+        mode (str): `a` to append to the file, `w` to truncate it first.
+        encoding (str): The encoding to write records with.
+        shards (int): Number of append buffers, shared round-robin by logging threads.
+        flush_interval (int): Time (in milliseconds) between writes.
+        flush_level (str): Records at or above this level trigger an immediate flush by the writer thread.
+        order (str): Merge records by `sequence` (logging order) or `time` (record timestamp).
+
+    """
+
+    filename: str | None = field(default="app.log")
+    mode: str = "a"
+    encoding: str = "utf-8"
+    shards: int = 8
+    flush_interval: int = 100
+    flush_level: str = "ERROR"
+    order: str = "sequence"
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "filename": f"{self.filename}",
+                "mode": self.mode,
+                "encoding": self.encoding,
+                "shards": self.shards,
+                "flush_interval": self.flush_interval,
+                "flush_level": self.flush_level,
+                "order": self.order,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_log.handlers.ShardedFileHandler`.
+
+        """
+        return "red_log.handlers.ShardedFileHandler"
+
+
+@dataclass(frozen=True)
 class TimedRotatingFileHandlerConfig(BaseHandlerConfig):
     """Define a logging TimedRotatingFileHandler.
 
@@ -152,6 +370,8 @@ class TimedRotatingFileHandlerConfig(BaseHandlerConfig):
                 "backupCount": self.backupCount,
             }
         }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -164,7 +384,7 @@ class TimedRotatingFileHandlerConfig(BaseHandlerConfig):
         return "logging.handlers.TimedRotatingFileHandler"
 
 
-@dataclass
+@dataclass(frozen=True)
 class SocketHandlerConfig(BaseHandlerConfig):
     """Define a logging SocketHandler.
 
@@ -187,6 +407,8 @@ class SocketHandlerConfig(BaseHandlerConfig):
                 "port": self.port,
             }
         }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -199,7 +421,73 @@ class SocketHandlerConfig(BaseHandlerConfig):
         return "logging.handlers.SocketHandler"
 
 
-@dataclass
+@dataclass(frozen=True)
+class BatchingSocketHandlerConfig(BaseHandlerConfig):
+    """Define a red_log BatchingSocketHandler.
+
+    Records are sent to a TCP collector in length-prefixed frames of up to `batch_size` pickled records,
+    over a persistent connection. A background thread sends the frames and reconnects with exponential
+    backoff, while records wait in a buffer of up to `capacity` records (dropping the oldest when it is full).
+
+    Params:
+        host (str): Host IP/FQDN.
+        port (int): Host port where log messages should be sent.
+        batch_size (int): Maximum records sent in one frame.
+        flush_interval (int): Maximum time (in milliseconds) a record waits for a batch to fill.
+        capacity (int): Maximum number of buffered records.
+        timeout (float): Timeout (in seconds) for connecting and sending.
+        retry_start (float): Delay (in seconds) before the first reconnect attempt.
+        retry_factor (float): Factor the delay is multiplied by after each failed attempt.
+        retry_max (float): Maximum delay (in seconds) between reconnect attempts.
+        close_timeout (float): Maximum time (in seconds) to wait for buffered records to be sent on close.
+
+    """
+
+    host: str = "localhost"
+    port: int = 0
+    batch_size: int = 512
+    flush_interval: int = 500
+    capacity: int = 10_000
+    timeout: float = 5.0
+    retry_start: float = 0.5
+    retry_factor: float = 2.0
+    retry_max: float = 30.0
+    close_timeout: float = 5.0
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "class": self.get_handler_class(),
+                "level": self.level,
+                "formatter": self.formatter,
+                "host": self.host,
+                "port": self.port,
+                "batch_size": self.batch_size,
+                "flush_interval": self.flush_interval,
+                "capacity": self.capacity,
+                "timeout": self.timeout,
+                "retry_start": self.retry_start,
+                "retry_factor": self.retry_factor,
+                "retry_max": self.retry_max,
+                "close_timeout": self.close_timeout,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_log.handlers.BatchingSocketHandler`.
+
+        """
+        return "red_log.handlers.BatchingSocketHandler"
+
+
+@dataclass(frozen=True)
 class SMTPHandlerConfig(BaseHandlerConfig):
     """Define a logging SMTPHandler.
 
@@ -236,6 +524,8 @@ class SMTPHandlerConfig(BaseHandlerConfig):
             handler_dict[self.name]["credentials"] = self.credentials
         if self.secure:
             handler_dict[self.name]["secure"] = self.secure
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -248,7 +538,7 @@ class SMTPHandlerConfig(BaseHandlerConfig):
         return "logging.handlers.SMTPHandler"
 
 
-@dataclass
+@dataclass(frozen=True)
 class QueueHandlerConfig(BaseHandlerConfig):
     """Define a logging QueueHandler.
 
@@ -268,6 +558,8 @@ class QueueHandlerConfig(BaseHandlerConfig):
                 "queue": self.queue,
             }
         }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
         return handler_dict
 
     def get_handler_class(self) -> str:
@@ -280,37 +572,141 @@ class QueueHandlerConfig(BaseHandlerConfig):
         return "logging.handlers.QueueHandler"
 
 
-@dataclass
+@dataclass(frozen=True)
 class QueueListenerConfig(BaseLoggingConfig):
     """Define a logging QueueListener.
 
+    The stdlib `QueueListener` is not a handler, so it cannot be created by `logging.config.dictConfig()`.
+    This class describes a `red_log.handlers.ManagedQueueHandler` instead, which puts records on the queue
+    and owns a `QueueListener` thread that passes them to the handlers in `handlers`.
+
     Params:
         name (str): The name of the handler.
-        queue (queue.Queue): The queue to listen for log messages in.
+        queue (queue.Queue | None): The queue to listen for log messages in. When `None`, the handler creates
+            an unbounded queue.
         handlers (list[str]): List of handler names to apply to this listener.
+        respect_handler_level (bool): When `True`, records are only passed to handlers whose level allows them.
+        spill_dir (str | None): When set, the handler uses a `red_log.handlers.SpillQueue` in this directory, which
+            moves records to disk when more than `spill_high_water` are waiting (i.e. during an outage of a
+            downstream handler), and replays them in order once the listener catches up.
+        spill_high_water (int): Maximum number of records kept in memory.
+        spill_segment_size (int): Maximum size (in bytes) of a spill segment file.
+        spill_max_bytes (int): Maximum total size (in bytes) of the spill segment files. The oldest are deleted first.
 
     """
 
-    name: str
-    queue: Queue
-    handlers: list
+    name: str = "queue"
+    queue: Queue | None = None
+    handlers: list = field(default_factory=lambda: [])
+    respect_handler_level: bool = True
+    spill_dir: str | None = None
+    spill_high_water: int = 10_000
+    spill_segment_size: int = 16 * 1024 * 1024
+    spill_max_bytes: int = 1024 * 1024 * 1024
+
+    def __post_init__(self) -> None:
+        if self.queue is not None and self.spill_dir is not None:
+            raise ValueError(f"Queue listener '{self.name}' accepts a queue or a spill_dir, not both.")
+
+        super().__post_init__()
 
     def get_configdict(self) -> dict[str, dict[str, t.Any]]:
         """Return a dict representation of the handler described by this class."""
         listener_dict: dict[str, dict[str, t.Any]] = {
             self.name: {
-                "class": self.get_handler_class(),
-                "queue": self.queue,
-                "handlers": self.handlers,
+                "()": self.get_handler_class(),
+                "handlers": list(self.handlers),
+                "respect_handler_level": self.respect_handler_level,
             }
         }
+        if self.queue is not None:
+            listener_dict[self.name]["queue"] = self.queue
+        if self.spill_dir is not None:
+            listener_dict[self.name].update(
+                {
+                    "spill_dir": f"{self.spill_dir}",
+                    "spill_high_water": self.spill_high_water,
+                    "spill_segment_size": self.spill_segment_size,
+                    "spill_max_bytes": self.spill_max_bytes,
+                }
+            )
         return listener_dict
 
     def get_handler_class(self) -> str:
         """Return the logging handler class this class represents.
 
         Returns:
-            (str): `logging.handlers.QueueListener`.
+            (str): `red_log.handlers.ManagedQueueHandler`.
 
         """
-        return "logging.handleres.QueueListener"
+        return "red_log.handlers.ManagedQueueHandler"
+
+
+@dataclass(frozen=True)
+class AsyncHandlerConfig(BaseLoggingConfig):
+    """Define a red_log AsyncHandler, for asyncio applications.
+
+    Records are buffered in memory, and a drain task on the event loop writes them to the handlers in
+    `handlers` on an executor thread, so blocking file/socket I/O never runs on the event loop.
+
+    Params:
+        name (str): The name of the handler.
+        handlers (list[str]): List of handler names to write records to.
+        capacity (int): Maximum number of buffered records.
+        overflow (str): What to do with a record when the buffer is full: `drop_oldest`, `drop_new`, or `block`.
+        batch_size (int): Maximum records written per executor call.
+        respect_handler_level (bool): When `True`, records are only passed to handlers whose level allows them.
+        level (str): The handler's logging level.
+        filters (list[str] | None): The names of filters to apply before records are buffered.
+
+    """
+
+    name: str = "async"
+    handlers: list = field(default_factory=lambda: [])
+    capacity: int = 10_000
+    overflow: str = "drop_oldest"
+    batch_size: int = 256
+    respect_handler_level: bool = True
+    level: str = "NOTSET"
+    filters: list[str] | None = field(default=None)
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the handler described by this class."""
+        handler_dict: dict[str, dict[str, t.Any]] = {
+            self.name: {
+                "()": self.get_handler_class(),
+                "level": self.level,
+                "handlers": list(self.handlers),
+                "capacity": self.capacity,
+                "overflow": self.overflow,
+                "batch_size": self.batch_size,
+                "respect_handler_level": self.respect_handler_level,
+            }
+        }
+        if self.filters:
+            handler_dict[self.name]["filters"] = self.filters
+        return handler_dict
+
+    def get_handler_class(self) -> str:
+        """Return the logging handler class this class represents.
+
+        Returns:
+            (str): `red_log.handlers.AsyncHandler`.
+
+        """
+        return "red_log.handlers.AsyncHandler"
+
+
+## Handler classes that do blocking I/O, and are moved behind a queue in non-blocking mode
+QUEUEABLE_HANDLER_CLASSES: tuple[str, ...] = (
+    "logging.StreamHandler",
+    "logging.FileHandler",
+    "logging.handlers.WatchedFileHandler",
+    "logging.handlers.RotatingFileHandler",
+    "logging.handlers.TimedRotatingFileHandler",
+    "logging.handlers.SocketHandler",
+    "logging.handlers.DatagramHandler",
+    "logging.handlers.SysLogHandler",
+    "red_log.handlers.BufferedFileHandler",
+    "red_log.handlers.CompressingRotatingFileHandler",
+)
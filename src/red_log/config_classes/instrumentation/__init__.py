@@ -0,0 +1,5 @@
+"""Describe red_log's runtime instrumentation (metrics, profiling) in the `red_log` section of a logging config."""
+
+from __future__ import annotations
+
+from ._instrumentation import RED_LOG_CONFIG_KEY, MetricsConfig, ProfilingConfig
@@ -0,0 +1,82 @@
+"""Use these classes to turn on red_log's runtime instrumentation for a logging config.
+
+Their settings are stored under the `red_log` key of the config dict, which `logging.config.dictConfig()`
+ignores. `red_log.runtime.apply_configdict()` reads them after applying the config.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import typing as t
+
+from red_log.config_classes.base import BaseLoggingConfig
+
+## Top-level logging config key for red_log's own settings
+RED_LOG_CONFIG_KEY: str = "red_log"
+
+
+@dataclass(frozen=True)
+class MetricsConfig(BaseLoggingConfig):
+    """Collect runtime metrics for the config's handlers (see `red_log.metrics`).
+
+    Params:
+        handlers (list[str] | None): Names of the handlers to instrument. `None` instruments every handler.
+        prometheus_file (str | None): When set, metrics are written to this file in the Prometheus text
+            format every `interval` seconds (i.e. for a node_exporter textfile collector).
+        interval (float): Seconds between writes of `prometheus_file`.
+        latency_buckets (list[float] | None): Upper bounds (in seconds) of the emit latency histogram buckets.
+            `None` uses `red_log.metrics.DEFAULT_LATENCY_BUCKETS`.
+
+    """
+
+    handlers: list[str] | None = field(default=None)
+    prometheus_file: str | None = None
+    interval: float = 15.0
+    latency_buckets: list[float] | None = field(default=None)
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the metrics settings, for the config's `red_log` section."""
+        metrics_dict: dict[str, t.Any] = {"interval": self.interval}
+        if self.handlers is not None:
+            metrics_dict["handlers"] = list(self.handlers)
+        if self.prometheus_file is not None:
+            metrics_dict["prometheus_file"] = f"{self.prometheus_file}"
+        if self.latency_buckets is not None:
+            metrics_dict["latency_buckets"] = list(self.latency_buckets)
+
+        return {"metrics": metrics_dict}
+
+
+@dataclass(frozen=True)
+class ProfilingConfig(BaseLoggingConfig):
+    """Attribute the config's handlers' cost to the log statements that call them (see `red_log.metrics`).
+
+    Params:
+        handlers (list[str] | None): Names of the handlers to profile. `None` profiles every handler.
+        sample_rate (float): Fraction (0-1) of records to sample.
+        top (int): Number of call sites written to `report_file`.
+        report_file (str | None): When set, the report of the most expensive log statements is written to
+            this file at exit, and when profiling is turned off.
+
+    """
+
+    handlers: list[str] | None = field(default=None)
+    sample_rate: float = 0.1
+    top: int = 20
+    report_file: str | None = None
+
+    def __post_init__(self):
+        if not 0 < self.sample_rate <= 1:
+            raise ValueError("sample_rate must be greater than 0, and at most 1.")
+
+        super().__post_init__()
+
+    def get_configdict(self) -> dict[str, dict[str, t.Any]]:
+        """Return a dict representation of the profiling settings, for the config's `red_log` section."""
+        profiling_dict: dict[str, t.Any] = {"sample_rate": self.sample_rate, "top": self.top}
+        if self.handlers is not None:
+            profiling_dict["handlers"] = list(self.handlers)
+        if self.report_file is not None:
+            profiling_dict["report_file"] = f"{self.report_file}"
+
+        return {"profiling": profiling_dict}
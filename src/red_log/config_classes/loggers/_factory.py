@@ -3,13 +3,49 @@
 from __future__ import annotations
 
 import logging
-import logging.config
+import threading
+
+from red_log.config_classes.base import FrozenDict, freeze
+from red_log.runtime import apply_configdict, get_applied_configdict
+
 
 class LoggerFactory:
-    """Generate loggers based on LoggerFactory's config."""
+    """Generate loggers based on LoggerFactory's config.
+
+    Configs are applied with `red_log.runtime.apply_configdict()`, so a changed config only re-creates the
+    handlers that changed. Loggers are kept in a registry keyed by logger name and (frozen) config, so
+    requesting a logger again with the config that is already applied returns the existing logger without
+    re-applying anything.
+    """
 
     _LOG: logging.Logger | None = None
 
+    ## (logger name, frozen config) -> logger, for the config in _REGISTRY_CONFIG
+    _REGISTRY: dict[tuple[str, FrozenDict], logging.Logger] = {}
+    _REGISTRY_CONFIG: FrozenDict | None = None
+    _REGISTRY_LOCK: threading.RLock = threading.RLock()
+
+    @staticmethod
+    def __build_configdict(
+        log_level: str,
+        handlers: dict[str, dict],
+        formatters: dict[str, dict],
+        loggers: dict[str, dict],
+    ) -> FrozenDict:
+        """Return the (frozen) logging config described by the inputs."""
+        return freeze(
+            {
+                "version": 1,
+                "handlers": handlers,
+                "formatters": formatters,
+                "loggers": loggers,
+                "root": {
+                    "level": log_level.upper(),
+                    "handlers": list(handlers.keys()),
+                },
+            }
+        )
+
     @staticmethod
     def __create_logger(
         name: str,
@@ -18,7 +54,7 @@ class LoggerFactory:
         formatters: dict[str, dict],
         loggers: dict[str, dict],
     ) -> logging.Logger:
-        """Create a logger cnofig from inputs.
+        """Create a logger config from inputs.
 
         Params:
             name (str): The name of the logger.
@@ -27,32 +63,44 @@ class LoggerFactory:
             formatters (dict[str, dict[str, Any]]): A dict describing the formatters for this logger config.
             loggers (dict[str, dict[str, Any]]): A dict describing the loggers for this logger config.
         """
-        log_level = log_level.upper()
+        logging_config: FrozenDict = LoggerFactory.__build_configdict(
+            log_level=log_level,
+            handlers=handlers,
+            formatters=formatters,
+            loggers=loggers,
+        )
+        registry_key: tuple[str, FrozenDict] = (name, logging_config)
 
-        # Configure logging using dictConfig
-        logging_config = {
-            "version": 1,
-            "handlers": handlers,
-            "formatters": formatters,
-            "loggers": loggers,
-            "root": {
-                "level": log_level,
-                "handlers": list(handlers.keys()),
-            },
-        }
+        with LoggerFactory._REGISTRY_LOCK:
+            if get_applied_configdict() is not LoggerFactory._REGISTRY_CONFIG:
+                ## Logging was reconfigured outside of the factory, registered loggers may be stale
+                LoggerFactory._REGISTRY.clear()
+                LoggerFactory._REGISTRY_CONFIG = None
 
-        try:
-            logging.config.dictConfig(logging_config)
-        except Exception as exc:
-            msg = Exception(f"Unhandled exception configuring logger. Details: {exc}")
-            # log.error(msg)
+            logger: logging.Logger | None = LoggerFactory._REGISTRY.get(registry_key)
+            if logger is None:
+                if logging_config != LoggerFactory._REGISTRY_CONFIG:
+                    try:
+                        apply_configdict(logging_config)
+                    except Exception as exc:
+                        msg = Exception(
+                            f"Unhandled exception configuring logger. Details: {exc}"
+                        )
+                        # log.error(msg)
 
-            raise msg
+                        raise msg
 
-        # Get or create logger
-        LoggerFactory._LOG = logging.getLogger(name)
+                    ## Only loggers for the applied config are valid
+                    LoggerFactory._REGISTRY.clear()
+                    LoggerFactory._REGISTRY_CONFIG = get_applied_configdict()
 
-        return LoggerFactory._LOG
+                # Get or create logger
+                logger = logging.getLogger(name)
+                LoggerFactory._REGISTRY[registry_key] = logger
+
+            LoggerFactory._LOG = logger
+
+        return logger
 
     @staticmethod
     def get_logger(
@@ -80,3 +128,10 @@ class LoggerFactory:
         )
 
         return logger
+
+    @staticmethod
+    def clear_registry() -> None:
+        """Forget all registered loggers, so the next `get_logger()` call re-applies its config."""
+        with LoggerFactory._REGISTRY_LOCK:
+            LoggerFactory._REGISTRY.clear()
+            LoggerFactory._REGISTRY_CONFIG = None
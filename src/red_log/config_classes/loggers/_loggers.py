@@ -8,7 +8,7 @@ import typing as t
 from red_log.config_classes.base import BaseLoggingConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggerConfig(BaseLoggingConfig):
     """Define a logging Logger.
 
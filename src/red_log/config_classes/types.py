@@ -4,19 +4,37 @@ from __future__ import annotations
 
 import typing as t
 
+from .formatters import FormatterConfig, JsonFormatterConfig
 from .handlers import (
+    AsyncHandlerConfig,
+    BatchingSocketHandlerConfig,
+    BufferedFileHandlerConfig,
+    CompressingRotatingFileHandlerConfig,
     FileHandlerConfig,
+    MmapFileHandlerConfig,
     QueueHandlerConfig,
     QueueListenerConfig,
     RotatingFileHandlerConfig,
+    ShardedFileHandlerConfig,
     SocketHandlerConfig,
     StreamHandlerConfig,
     TimedRotatingFileHandlerConfig,
 )
 
+FORMATTER_CLASSES_TYPE = t.Union[FormatterConfig, JsonFormatterConfig]
+FORMATTER_CLASSES_TYPE_ANNOTATION = t.Annotated[
+    FORMATTER_CLASSES_TYPE,
+    "A logging formatter config class.",
+]
 HANDLER_CLASSES_TYPE = t.Union[
+    AsyncHandlerConfig,
+    BatchingSocketHandlerConfig,
+    BufferedFileHandlerConfig,
+    CompressingRotatingFileHandlerConfig,
     FileHandlerConfig,
+    MmapFileHandlerConfig,
     RotatingFileHandlerConfig,
+    ShardedFileHandlerConfig,
     TimedRotatingFileHandlerConfig,
     StreamHandlerConfig,
     SocketHandlerConfig,
@@ -6,6 +6,8 @@ from ._formats import (
     DATE_FMT_DATE_ONLY,
     DATE_FMT_STANDARD,
     DATE_FMT_TIME_ONLY,
+    JSON_FIELDS_DETAILED,
+    JSON_FIELDS_STANDARD,
     MESSAGE_FMT_BASIC,
     MESSAGE_FMT_DETAILED,
     MESSAGE_FMT_STANDARD,
@@ -19,3 +19,26 @@ MESSAGE_FMT_BASIC: str = "%(asctime)-19s %(levelname)-8s : %(message)s"
 DATE_FMT_STANDARD: str = "%Y-%m-%d %H:%M:%S"
 DATE_FMT_DATE_ONLY: str = "%Y-%m-%d"
 DATE_FMT_TIME_ONLY: str = "%H:%M:%S"
+
+## Record attributes for red_log.formatters.JsonFormatter
+JSON_FIELDS_STANDARD: tuple[str, ...] = (
+    "asctime",
+    "levelname",
+    "name",
+    "module",
+    "lineno",
+    "funcName",
+    "message",
+)
+JSON_FIELDS_DETAILED: tuple[str, ...] = (
+    "asctime",
+    "levelname",
+    "name",
+    "module",
+    "pathname",
+    "lineno",
+    "funcName",
+    "process",
+    "threadName",
+    "message",
+)
@@ -0,0 +1,10 @@
+"""Formatter classes provided by red_log.
+
+Like `red_log.handlers`, these are real `logging.Formatter` subclasses. Select one in a
+`FormatterConfig` with the `formatter_class` param, i.e. `formatter_class="red_log.formatters.CompiledFormatter"`.
+"""
+
+from __future__ import annotations
+
+from ._compiled import CompiledFormatter, compile_format
+from ._json import JsonFormatter, encode_json_value
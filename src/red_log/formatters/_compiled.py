@@ -0,0 +1,131 @@
+"""A `logging.Formatter` that compiles its `%`-style format string once, instead of interpolating a dict per record."""
+
+from __future__ import annotations
+
+import logging
+import operator
+import re
+import time
+import typing as t
+
+## Matches a literal `%%`, or a `%(name)<spec>` placeholder in a %-style format string
+_PLACEHOLDER_RE: re.Pattern = re.compile(
+    r"%%|%\((?P<name>[^)]+)\)(?P<spec>[#0+ -]*\d*(?:\.\d+)?[diouxXeEfFgGcrsa])"
+)
+
+
+def compile_format(
+    fmt: str,
+) -> tuple[t.Callable[[logging.LogRecord], str], tuple[str, ...]]:
+    """Compile a %-style format string into a function that renders a `LogRecord`.
+
+    Named placeholders (`%(asctime)s`) are replaced with positional ones (`%s`), and the record
+    attributes they reference are read with a single `operator.attrgetter()`, so the record's
+    `__dict__` is never copied or merged.
+
+    Params:
+        fmt (str): A %-style log format string, like the formats in `red_log.fmts`.
+
+    Returns:
+        (tuple[Callable[[LogRecord], str], tuple[str, ...]]): The render function, and the names of the
+            record attributes the format string uses.
+
+    """
+    names: list[str] = []
+
+    def _to_positional(match: re.Match) -> str:
+        if match.group("name") is None:
+            ## Literal `%%`
+            return match.group(0)
+
+        names.append(match.group("name"))
+
+        return f"%{match.group('spec')}"
+
+    template: str = _PLACEHOLDER_RE.sub(_to_positional, fmt)
+
+    if not names:
+
+        def render(record: logging.LogRecord) -> str:
+            return template % ()
+
+    elif len(names) == 1:
+        _name: str = names[0]
+
+        def render(record: logging.LogRecord) -> str:
+            return template % (getattr(record, _name),)
+
+    else:
+        getter = operator.attrgetter(*names)
+
+        def render(record: logging.LogRecord) -> str:
+            return template % getter(record)
+
+    return render, tuple(names)
+
+
+class CompiledFormatter(logging.Formatter):
+    """A drop-in replacement for `logging.Formatter` that renders records with a compiled format.
+
+    For the `%` style, the format string is compiled once by `compile_format()`, and the
+    formatted timestamp is cached for the current second, so `time.strftime()` runs at most
+    once per second instead of once per record. Other styles, and formats with `defaults`,
+    fall back to the stdlib implementation.
+
+    Params:
+        fmt (str | None): The log message format.
+        datefmt (str | None): The timestamp format.
+        style (str): The format style (`%`, `{`, or `$`).
+        validate (bool): When `True`, the format is validated against its style.
+        defaults (dict[str, Any] | None): Default values for custom fields in the format.
+    """
+
+    def __init__(
+        self,
+        fmt: str | None = None,
+        datefmt: str | None = None,
+        style: str = "%",
+        validate: bool = True,
+        *,
+        defaults: dict[str, t.Any] | None = None,
+    ) -> None:
+        super().__init__(
+            fmt=fmt, datefmt=datefmt, style=style, validate=validate, defaults=defaults
+        )
+
+        self._render: t.Callable[[logging.LogRecord], str] | None = None
+        self.fields: tuple[str, ...] = ()
+        if style == "%" and not defaults:
+            self._render, self.fields = compile_format(self._style._fmt)
+
+        ## (second, datefmt, formatted timestamp) of the last call to formatTime()
+        self._time_cache: tuple[int, str | None, str] = (-1, None, "")
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Render the record with the compiled format."""
+        if self._render is None:
+            return super().formatMessage(record)
+
+        return self._render(record)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Return the record's creation time, formatted with `datefmt`.
+
+        The formatted time is reused for every record created within the same second.
+        """
+        seconds: int = int(record.created)
+        cached: tuple[int, str | None, str] = self._time_cache
+
+        if cached[0] != seconds or cached[1] != datefmt:
+            ct: time.struct_time = self.converter(seconds)
+            cached = (
+                seconds,
+                datefmt,
+                time.strftime(datefmt or self.default_time_format, ct),
+            )
+            self._time_cache = cached
+
+        if not datefmt and self.default_msec_format:
+            return self.default_msec_format % (cached[2], record.msecs)
+
+        return cached[2]
@@ -0,0 +1,143 @@
+"""A formatter that renders each log record as a single-line JSON object (NDJSON)."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import typing as t
+
+from red_log.fmts._formats import JSON_FIELDS_STANDARD
+
+from ._compiled import CompiledFormatter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+## Encode a str as a JSON string, using the C accelerator when it is available
+_encode_str: t.Callable[[str], str] = json.encoder.encode_basestring
+
+
+def _encode_other(value: t.Any) -> str:
+    """Encode a value that is not a str/int/float/bool/None, using orjson if it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str).decode("utf-8")
+        except TypeError:
+            ## i.e. ints larger than 64 bits
+            pass
+
+    return json.dumps(value, default=str, ensure_ascii=False)
+
+
+def encode_json_value(value: t.Any) -> str:
+    """Encode a single value as JSON.
+
+    Checks the common LogRecord attribute types first, so most values are encoded without a
+    call into `json`/`orjson`.
+
+    Params:
+        value (Any): The value to encode.
+
+    Returns:
+        (str): The JSON representation of `value`.
+
+    """
+    value_type: type = type(value)
+
+    if value_type is str:
+        return _encode_str(value)
+    if value_type is int:
+        return int.__repr__(value)
+    if value is None:
+        return "null"
+    if value_type is float:
+        return float.__repr__(value) if math.isfinite(value) else "null"
+    if value_type is bool:
+        return "true" if value else "false"
+
+    return _encode_other(value)
+
+
+class JsonFormatter(CompiledFormatter):
+    """Format log records as one JSON object per line.
+
+    The record attributes to output, and the key each is written under, are chosen once when
+    the formatter is created. Formatting a record joins pre-encoded keys with the encoded
+    attribute values, no intermediate dict is built. `asctime` uses the cached timestamp from
+    `CompiledFormatter`, and `exc_info`/`stack_info` are added whenever a record has them.
+
+    Params:
+        fields (list[str] | None): LogRecord attributes to include, in output order, where `message`, `asctime`,
+            `exc_info`, and `stack_info` are rendered like the stdlib formatter renders them.
+            Defaults to `red_log.fmts.JSON_FIELDS_STANDARD`.
+        datefmt (str | None): The format for `asctime`.
+        rename (dict[str, str] | None): Map of record attribute -> JSON key, i.e. `{"levelname": "level"}`.
+        static_fields (dict[str, Any] | None): Extra keys & values added to every object, i.e. `{"service": "api"}`.
+    """
+
+    def __init__(
+        self,
+        fields: list[str] | None = None,
+        datefmt: str | None = None,
+        rename: dict[str, str] | None = None,
+        static_fields: dict[str, t.Any] | None = None,
+    ) -> None:
+        super().__init__(fmt="%(message)s", datefmt=datefmt)
+
+        rename = rename or {}
+        self.fields: tuple[str, ...] = tuple(
+            fields if fields is not None else JSON_FIELDS_STANDARD
+        )
+
+        ## Build the field plan: (pre-encoded key, function returning the encoded value)
+        self._plan: list[tuple[str, t.Callable[[logging.LogRecord], str]]] = [
+            (f"{_encode_str(rename.get(field, field))}:", self._get_encoder(field))
+            for field in self.fields
+        ]
+        self._static: str = "".join(
+            f",{_encode_str(key)}:{encode_json_value(value)}"
+            for key, value in (static_fields or {}).items()
+        )
+        self._exc_key: str = f",{_encode_str(rename.get('exc_info', 'exc_info'))}:"
+        self._stack_key: str = f",{_encode_str(rename.get('stack_info', 'stack_info'))}:"
+
+    def _get_encoder(self, field: str) -> t.Callable[[logging.LogRecord], str]:
+        """Return a function that reads `field` from a record and encodes it as JSON."""
+        if field == "message":
+            return lambda record: _encode_str(record.getMessage())
+        if field == "asctime":
+            return lambda record: _encode_str(self.formatTime(record, self.datefmt))
+        if field == "exc_info":
+            return lambda record: encode_json_value(record.exc_text or None)
+        if field == "stack_info":
+            return lambda record: (
+                _encode_str(self.formatStack(record.stack_info))
+                if record.stack_info
+                else "null"
+            )
+        if field in ("levelname", "name"):
+            ## Always a str, skip the type checks
+            return lambda record: _encode_str(getattr(record, field))
+
+        return lambda record: encode_json_value(getattr(record, field, None))
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Return the record as a JSON object string."""
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+
+        out: str = (
+            "{"
+            + ",".join([key + encode(record) for key, encode in self._plan])
+            + self._static
+        )
+
+        if record.exc_text and "exc_info" not in self.fields:
+            out += self._exc_key + _encode_str(record.exc_text)
+        if record.stack_info and "stack_info" not in self.fields:
+            out += self._stack_key + _encode_str(self.formatStack(record.stack_info))
+
+        return out + "}"
@@ -0,0 +1,17 @@
+"""Handler classes provided by red_log.
+
+These are real `logging.Handler` subclasses (as opposed to the `*HandlerConfig` classes in
+`red_log.config_classes.handlers`, which only describe a handler for a dictConfig). The config
+classes reference these handlers by their dotted path, i.e. `red_log.handlers.ManagedQueueHandler`.
+"""
+
+from __future__ import annotations
+
+from ._async import AsyncHandler
+from ._batching_socket import BatchingSocketHandler, recv_batch
+from ._buffered import BufferedFileHandler
+from ._compressing import CompressingRotatingFileHandler
+from ._mmap import MmapFileHandler, read_mmap_segment
+from ._queue import ManagedQueueHandler, get_handler_by_name
+from ._sharded import ShardedFileHandler
+from ._spill import SpillQueue
@@ -0,0 +1,338 @@
+"""A handler for asyncio applications, which never does blocking I/O on the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+import threading
+import typing as t
+
+from ._queue import get_handler_by_name
+
+## What to do with a record when the buffer is full
+OVERFLOW_POLICIES: tuple[str, ...] = ("drop_oldest", "drop_new", "block")
+
+
+class AsyncHandler(logging.Handler):
+    """Buffer records in memory, and write them to other handlers from a drain task on the event loop.
+
+    The handler binds to the running event loop the first time a record is emitted from it. `emit()`
+    only appends the record to a bounded buffer. A drain task on the loop passes batches of records to
+    the target handlers (i.e. file or socket handlers) with `loop.run_in_executor()`, on a dedicated
+    thread, so the loop never waits on their I/O.
+
+    When the buffer holds `capacity` records, `overflow` decides what happens to a new record:
+
+    - `drop_oldest`: the oldest buffered record is dropped.
+    - `drop_new`: the new record is dropped.
+    - `block`: on the event loop, the buffer is written synchronously (stalling the loop); on other
+        threads, the caller waits until the drain task makes room.
+
+    Dropped records are counted in `dropped`. When the loop shuts down (i.e. `asyncio.run()` cancels the
+    drain task), buffered records are written before the task exits. Records emitted while no loop is
+    bound are written synchronously. Call `await handler.drain()` to wait until everything buffered so far
+    is written.
+
+    Params:
+        handlers (list[str | logging.Handler]): Names of handlers in the logging dictConfig (or handler objects)
+            to write records to.
+        capacity (int): Maximum number of buffered records.
+        overflow (str): What to do when the buffer is full: `drop_oldest`, `drop_new`, or `block`.
+        batch_size (int): Maximum records passed to the executor at once.
+        respect_handler_level (bool): When `True`, records are only passed to handlers whose level allows them.
+    """
+
+    def __init__(
+        self,
+        handlers: list[t.Union[str, logging.Handler]] | None = None,
+        capacity: int = 10_000,
+        overflow: str = "drop_oldest",
+        batch_size: int = 256,
+        respect_handler_level: bool = True,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Invalid overflow policy '{overflow}', must be one of {list(OVERFLOW_POLICIES)}."
+            )
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        super().__init__()
+
+        ## Index into the list instead of iterating so dictConfig can convert each item
+        handlers = handlers or []
+        self.handler_names: list[t.Union[str, logging.Handler]] = [
+            handlers[i] for i in range(len(handlers))
+        ]
+        self.capacity = capacity
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.respect_handler_level = respect_handler_level
+
+        ## Number of records dropped because the buffer was full
+        self.dropped: int = 0
+
+        self._targets: list[logging.Handler] | None = None
+        self._buffer: collections.deque[logging.LogRecord] = collections.deque()
+        ## Notified when the drain task makes room, for the `block` policy
+        self._space = threading.Condition(threading.Lock())
+        ## Serializes writes to the target handlers
+        self._write_lock = threading.Lock()
+
+        self._bind_lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._wakeup_pending: bool = False
+        ## Set by the drain task after each batch it writes, for drain()
+        self._drained: asyncio.Event | None = None
+        self._drain_task: asyncio.Task | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        ## The batch currently being written by the executor
+        self._inflight: Future | None = None
+
+    def _get_targets(self) -> list[logging.Handler]:
+        """Resolve (once) the names in `self.handler_names` to handler objects."""
+        if self._targets is None:
+            resolved: list[logging.Handler] = []
+
+            for handler in self.handler_names:
+                if isinstance(handler, logging.Handler):
+                    resolved.append(handler)
+                    continue
+
+                _handler = get_handler_by_name(handler)
+                if _handler is None:
+                    raise ValueError(
+                        f"AsyncHandler '{self.name}' could not find a handler named '{handler}'."
+                    )
+
+                resolved.append(_handler)
+
+            self._targets = resolved
+
+        return self._targets
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop | None:
+        """Return the bound event loop, binding to the current thread's running loop if needed.
+
+        Returns `None` when no loop is bound and the current thread is not running one.
+        """
+        loop = self._loop
+        if loop is not None and not loop.is_closed() and not self._drain_task.done():
+            return loop
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        with self._bind_lock:
+            if self._loop is not running or self._drain_task.done():
+                self._bind(running)
+
+        return running
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start a drain task on `loop`. Must be called from the loop's thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"red_log-AsyncHandler-{self.name}"
+            )
+
+        self._loop = loop
+        self._loop_thread_id = threading.get_ident()
+        self._wakeup = asyncio.Event()
+        self._wakeup_pending = False
+        self._drained = asyncio.Event()
+        self._drain_task = loop.create_task(
+            self._drain_forever(), name=f"red_log-AsyncHandler-{self.name}"
+        )
+
+    def _wake(self, in_loop: bool) -> None:
+        """Wake the drain task, unless it was already woken and has not run yet."""
+        if self._wakeup_pending:
+            return
+
+        self._wakeup_pending = True
+        if in_loop:
+            self._wakeup.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _pop_batch(self, size: int) -> list[logging.LogRecord]:
+        batch: list[logging.LogRecord] = []
+        try:
+            for _ in range(size):
+                batch.append(self._buffer.popleft())
+        except IndexError:
+            pass
+
+        return batch
+
+    def _write(self, records: list[logging.LogRecord]) -> None:
+        """Pass records to the target handlers."""
+        with self._write_lock:
+            targets: list[logging.Handler] = self._get_targets()
+
+            for record in records:
+                for handler in targets:
+                    if not self.respect_handler_level or record.levelno >= handler.level:
+                        handler.handle(record)
+
+    def _write_pending(self) -> None:
+        """Wait for the in-flight batch, then write every buffered record on the calling thread."""
+        inflight: Future | None = self._inflight
+        if inflight is not None:
+            try:
+                inflight.result()
+            except Exception:
+                pass
+            self._inflight = None
+
+        while self._buffer:
+            self._write(self._pop_batch(len(self._buffer)))
+
+    async def _drain_forever(self) -> None:
+        """Write buffered records in the executor whenever the handler is woken."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                self._wakeup_pending = False
+
+                while self._buffer:
+                    if self._executor is None:
+                        ## Closed while the loop is still running
+                        self._write_pending()
+                        break
+
+                    self._inflight = self._executor.submit(
+                        self._write, self._pop_batch(self.batch_size)
+                    )
+                    try:
+                        await asyncio.wrap_future(self._inflight, loop=loop)
+                    except asyncio.CancelledError:
+                        ## Leave the batch in `_inflight`, so `_write_pending()` waits for it
+                        raise
+                    except Exception:
+                        ## Target handlers report their own errors; keep draining
+                        pass
+                    self._inflight = None
+                    self._drained.set()
+
+                    if self.overflow == "block":
+                        with self._space:
+                            self._space.notify_all()
+
+                self._drained.set()
+        except asyncio.CancelledError:
+            ## The loop is shutting down, write what is left before exiting
+            self._write_pending()
+            raise
+        finally:
+            ## Wake drain() callers, which write any records left on their own once the task is done
+            self._drained.set()
+
+    def handle(self, record: logging.LogRecord) -> t.Union[bool, logging.LogRecord]:
+        """Filter and emit a record without taking the handler's lock.
+
+        The lock is not needed for the buffer, and a caller blocked on a full buffer must not stop the
+        event loop thread from emitting (and draining).
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Append a record to the buffer, applying the overflow policy if it is full."""
+        try:
+            loop: asyncio.AbstractEventLoop | None = self._get_loop()
+            if loop is None:
+                ## No event loop to drain the buffer, write on the calling thread
+                self._buffer.append(record)
+                self._write_pending()
+
+                return
+
+            in_loop: bool = threading.get_ident() == self._loop_thread_id
+
+            if len(self._buffer) >= self.capacity:
+                if self.overflow == "drop_new":
+                    self.dropped += 1
+
+                    return
+                elif self.overflow == "drop_oldest":
+                    try:
+                        self._buffer.popleft()
+                        self.dropped += 1
+                    except IndexError:
+                        pass
+                elif in_loop:
+                    ## The drain task cannot run while the loop is blocked, write everything now
+                    self._buffer.append(record)
+                    self._write_pending()
+
+                    return
+                else:
+                    with self._space:
+                        while len(self._buffer) >= self.capacity and not self._drain_task.done():
+                            self._space.wait(0.1)
+
+            self._buffer.append(record)
+            self._wake(in_loop)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    @property
+    def pending(self) -> int:
+        """The number of records waiting in the buffer."""
+        return len(self._buffer)
+
+    async def drain(self) -> None:
+        """Wait until every record buffered so far has been written."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while self._buffer or self._inflight is not None:
+            if self._loop is loop and not self._drain_task.done():
+                self._drained.clear()
+                self._wake(True)
+                await self._drained.wait()
+            else:
+                self._write_pending()
+
+    def flush(self) -> None:
+        """Flush the target handlers."""
+        if self._targets is not None:
+            for handler in self._targets:
+                handler.flush()
+
+    def close(self) -> None:
+        """Write buffered records, stop the drain task and executor, and close the handler."""
+        try:
+            self._write_pending()
+
+            task: asyncio.Task | None = self._drain_task
+            if task is not None and not task.done() and not self._loop.is_closed():
+                if threading.get_ident() == self._loop_thread_id:
+                    task.cancel()
+                else:
+                    self._loop.call_soon_threadsafe(task.cancel)
+
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        finally:
+            super().close()
@@ -0,0 +1,336 @@
+"""A socket handler that sends batches of records over a persistent TCP connection."""
+
+from __future__ import annotations
+
+import collections
+import logging
+import pickle
+import select
+import socket
+import struct
+import sys
+import threading
+import time
+import typing as t
+
+## Frame header: length (in bytes) of the pickled batch that follows
+FRAME_HEADER: struct.Struct = struct.Struct(">L")
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes | None:
+    """Read exactly `size` bytes from `sock`, or return `None` if the connection closes first."""
+    chunks: list[bytes] = []
+
+    while size:
+        chunk: bytes = sock.recv(size)
+        if not chunk:
+            return None
+
+        chunks.append(chunk)
+        size -= len(chunk)
+
+    return b"".join(chunks)
+
+
+def recv_batch(sock: socket.socket) -> list[logging.LogRecord] | None:
+    """Read one frame sent by `BatchingSocketHandler` from `sock`, and return its records.
+
+    Only use this with trusted senders, frames are unpickled.
+
+    Params:
+        sock (socket.socket): A connected socket.
+
+    Returns:
+        (list[logging.LogRecord] | None): The batch's records, or `None` if the connection closed.
+
+    """
+    header: bytes | None = _recv_exactly(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+
+    payload: bytes | None = _recv_exactly(sock, FRAME_HEADER.unpack(header)[0])
+    if payload is None:
+        return None
+
+    return [logging.makeLogRecord(record_dict) for record_dict in pickle.loads(payload)]
+
+
+class BatchingSocketHandler(logging.Handler):
+    """Send log records to a TCP collector in batches, over a persistent connection.
+
+    `emit()` only converts the record to a picklable dict and appends it to a bounded buffer. A
+    background thread sends the buffer as frames of up to `batch_size` records, when `batch_size`
+    records are waiting or `flush_interval` milliseconds after the first one was buffered. Each frame
+    is a 4-byte big-endian length followed by a pickled list of record dicts (the same dicts
+    `logging.handlers.SocketHandler` pickles, one per record). Use `recv_batch()` to read frames on the
+    receiving side.
+
+    The connection is kept open between batches. When the collector is down, the background thread
+    reconnects with exponential backoff (`retry_start` seconds, multiplied by `retry_factor` up to
+    `retry_max`), while records keep accumulating in the buffer. When the buffer holds `capacity`
+    records, the oldest are dropped and counted in `dropped`. The logging thread never waits on the
+    network.
+
+    Params:
+        host (str): Host IP/FQDN of the collector.
+        port (int): Port of the collector.
+        batch_size (int): Maximum records sent in one frame.
+        flush_interval (int): Maximum time (in milliseconds) a record waits for a batch to fill.
+        capacity (int): Maximum number of buffered records.
+        timeout (float): Timeout (in seconds) for connecting and sending.
+        retry_start (float): Delay (in seconds) before the first reconnect attempt.
+        retry_factor (float): Factor the delay is multiplied by after each failed attempt.
+        retry_max (float): Maximum delay (in seconds) between reconnect attempts.
+        close_timeout (float): Maximum time (in seconds) `close()` waits for buffered records to be sent.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        batch_size: int = 512,
+        flush_interval: int = 500,
+        capacity: int = 10_000,
+        timeout: float = 5.0,
+        retry_start: float = 0.5,
+        retry_factor: float = 2.0,
+        retry_max: float = 30.0,
+        close_timeout: float = 5.0,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if capacity < batch_size:
+            raise ValueError("capacity must be at least batch_size.")
+
+        super().__init__()
+
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.capacity = capacity
+        self.timeout = timeout
+        self.retry_start = retry_start
+        self.retry_factor = retry_factor
+        self.retry_max = retry_max
+        self.close_timeout = close_timeout
+
+        ## Number of records dropped because the buffer was full, could not be sent at close, or came after close
+        self.dropped: int = 0
+
+        self.sock: socket.socket | None = None
+        self._buffer: collections.deque[dict[str, t.Any]] = collections.deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._closing: bool = False
+        ## Set to interrupt the backoff wait when the handler is closed
+        self._closed_event = threading.Event()
+
+        self._sender = threading.Thread(
+            target=self._send_forever,
+            name=f"red_log-BatchingSocketHandler-{host}:{port}",
+            daemon=True,
+        )
+        self._sender.start()
+
+    def _make_record_dict(self, record: logging.LogRecord) -> dict[str, t.Any]:
+        """Return a picklable dict of a record, like `logging.handlers.SocketHandler.makePickle()`."""
+        if record.exc_info:
+            ## Caches the traceback in record.exc_text
+            self.format(record)
+
+        record_dict: dict[str, t.Any] = dict(record.__dict__)
+        record_dict["msg"] = record.getMessage()
+        record_dict["args"] = None
+        record_dict["exc_info"] = None
+        record_dict.pop("message", None)
+
+        return record_dict
+
+    def _make_frame(self, batch: list[dict[str, t.Any]]) -> bytes:
+        """Return a length-prefixed frame of pickled records, dropping records that cannot be pickled."""
+        try:
+            payload: bytes = pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            picklable: list[dict[str, t.Any]] = []
+            for record_dict in batch:
+                try:
+                    pickle.dumps(record_dict, pickle.HIGHEST_PROTOCOL)
+                    picklable.append(record_dict)
+                except Exception as exc:
+                    with self._cond:
+                        self.dropped += 1
+                    self._report_error(f"could not pickle record '{record_dict.get('msg')}'", exc)
+
+            payload = pickle.dumps(picklable, pickle.HIGHEST_PROTOCOL)
+
+        return FRAME_HEADER.pack(len(payload)) + payload
+
+    def _report_error(self, message: str, exc: Exception) -> None:
+        """Report an error on the sender thread, where there is no record to pass to handleError()."""
+        if logging.raiseExceptions:
+            print(
+                f"--- Logging error: BatchingSocketHandler {message}. Details: {exc}",
+                file=sys.stderr,
+            )
+
+    def _connect(self) -> socket.socket:
+        sock: socket.socket = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        return sock
+
+    def _is_connection_closed(self) -> bool:
+        """Return `True` if the collector closed the connection, without blocking.
+
+        `sendall()` to a closed connection can still succeed once (and lose the data), so check before each send.
+        """
+        readable, _, _ = select.select([self.sock], [], [], 0)
+        if not readable:
+            return False
+
+        try:
+            return self.sock.recv(1, socket.MSG_PEEK) == b""
+        except OSError:
+            return True
+
+    def _close_socket(self) -> None:
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+
+    def _send(self, batch: list[dict[str, t.Any]]) -> None:
+        """Send a batch, connecting first if needed. Raises `OSError` if it could not be sent."""
+        if self.sock is not None and self._is_connection_closed():
+            self._close_socket()
+        if self.sock is None:
+            self.sock = self._connect()
+
+        try:
+            self.sock.sendall(self._make_frame(batch))
+        except OSError:
+            self._close_socket()
+            raise
+
+    def _requeue(self, batch: list[dict[str, t.Any]]) -> None:
+        """Put an unsent batch back at the front of the buffer, dropping the oldest records beyond `capacity`."""
+        with self._cond:
+            overflow: int = len(self._buffer) + len(batch) - self.capacity
+            if overflow > 0:
+                self.dropped += overflow
+                batch = batch[overflow:]
+
+            self._buffer.extendleft(reversed(batch))
+
+    def _next_batch(self) -> list[dict[str, t.Any]] | None:
+        """Wait for a batch to fill (or `flush_interval` to pass), and take it from the buffer.
+
+        Returns `None` when the handler is closing and the buffer is empty.
+        """
+        with self._cond:
+            while not self._buffer and not self._closing:
+                self._cond.wait()
+
+            if not self._closing and len(self._buffer) < self.batch_size:
+                self._cond.wait(self.flush_interval / 1000)
+
+            if not self._buffer:
+                return None
+
+            size: int = min(self.batch_size, len(self._buffer))
+
+            return [self._buffer.popleft() for _ in range(size)]
+
+    def _send_forever(self) -> None:
+        """Send batches until the handler is closed, reconnecting with exponential backoff."""
+        delay: float = self.retry_start
+        deadline: float | None = None
+
+        while True:
+            batch: list[dict[str, t.Any]] | None = self._next_batch()
+            if batch is None:
+                if self._closing:
+                    break
+                continue
+
+            try:
+                self._send(batch)
+                delay = self.retry_start
+                continue
+            except OSError as exc:
+                self._requeue(batch)
+                error: OSError = exc
+
+            if self._closing:
+                if deadline is None:
+                    deadline = time.monotonic() + self.close_timeout
+                remaining: float = deadline - time.monotonic()
+                if remaining <= 0:
+                    with self._cond:
+                        self.dropped += len(self._buffer)
+                        self._buffer.clear()
+
+                    self._report_error(
+                        f"could not send buffered records to {self.host}:{self.port} before closing", error
+                    )
+                    break
+
+                time.sleep(min(delay, remaining))
+            else:
+                self._closed_event.wait(delay)
+
+            delay = min(delay * self.retry_factor, self.retry_max)
+
+        self._close_socket()
+
+    @property
+    def pending(self) -> int:
+        """The number of records waiting to be sent."""
+        return len(self._buffer)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Append a record to the buffer, dropping the oldest record if it is full.
+
+        Records emitted after `close()` are never sent, and are counted in `dropped`.
+        """
+        try:
+            record_dict: dict[str, t.Any] = self._make_record_dict(record)
+
+            with self._cond:
+                if self._closing:
+                    self.dropped += 1
+
+                    return
+
+                if len(self._buffer) >= self.capacity:
+                    self._buffer.popleft()
+                    self.dropped += 1
+
+                self._buffer.append(record_dict)
+                size: int = len(self._buffer)
+                ## Wake the sender for the first record (to start the flush interval) and for full batches
+                if size == 1 or size == self.batch_size:
+                    self._cond.notify()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Send buffered records (waiting up to `close_timeout` seconds), stop the sender, and close the socket."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._closed_event.set()
+
+        if self._sender is not threading.current_thread():
+            self._sender.join(self.close_timeout + self.timeout)
+
+        super().close()
+
+    def __repr__(self) -> str:
+        level: str = logging.getLevelName(self.level)
+
+        return f"<{self.__class__.__name__} {self.host}:{self.port} ({level})>"
@@ -0,0 +1,169 @@
+"""A file handler that batches formatted records in memory and writes them in one syscall."""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+import typing as t
+
+from red_log.__levels import level_to_int
+
+
+class BufferedFileHandler(logging.Handler):
+    """Write formatted log records to a file in batches.
+
+    Formatted records are copied into a preallocated buffer of `capacity` bytes. The buffer is
+    written to the file with a single `os.write()` when it is full, when `flush_interval`
+    milliseconds have passed since the last write, when a record at or above `flush_level` is
+    handled, and when the handler is flushed/closed (i.e. at interpreter shutdown).
+
+    Params:
+        filename (str | Path): The path to the log file.
+        mode (str): `a` to append to an existing file, `w` to truncate it.
+        encoding (str): Encoding for formatted records.
+        capacity (int): Size (in bytes) of the write buffer.
+        flush_interval (int): Maximum time (in milliseconds) a record waits in the buffer. `0` disables
+            time-based flushing.
+        flush_level (int | str): Records at or above this level flush the buffer immediately.
+        delay (bool): When `True`, the file is not opened until the first write.
+    """
+
+    terminator: str = "\n"
+
+    def __init__(
+        self,
+        filename: t.Union[str, Path],
+        mode: str = "a",
+        encoding: str = "utf-8",
+        capacity: int = 64 * 1024,
+        flush_interval: int = 1000,
+        flush_level: t.Union[int, str] = logging.ERROR,
+        delay: bool = False,
+    ) -> None:
+        if mode not in ("a", "w"):
+            raise ValueError(f"Invalid mode '{mode}', must be 'a' or 'w'.")
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0.")
+
+        super().__init__()
+
+        self.baseFilename: str = os.path.abspath(os.fspath(filename))
+        self.mode = mode
+        self.encoding = encoding
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.flush_level = level_to_int(flush_level)
+
+        self._buffer: bytearray = bytearray(capacity)
+        self._length: int = 0
+        self._last_write: float = time.monotonic()
+        self._fd: int | None = None
+
+        if not delay:
+            self._open()
+
+        self._stop_flushing = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_periodically,
+                name=f"red_log-BufferedFileHandler-{self.baseFilename}",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def _open(self) -> int:
+        """Open the log file, if it is not already open, and return its file descriptor."""
+        if self._fd is None:
+            flags: int = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+            flags |= os.O_APPEND if self.mode == "a" else os.O_TRUNC
+
+            self._fd = os.open(self.baseFilename, flags, 0o644)
+            ## Only truncate on the first open
+            self.mode = "a"
+
+        return self._fd
+
+    def _write(self, data: t.Union[bytes, memoryview]) -> None:
+        """Write all of `data` to the log file."""
+        fd: int = self._open()
+
+        while data:
+            written: int = os.write(fd, data)
+            data = data[written:]
+
+        self._last_write = time.monotonic()
+
+    def _flush_buffer(self) -> None:
+        """Write the buffer to the log file. Caller must hold the handler's lock."""
+        if self._length:
+            with memoryview(self._buffer) as view:
+                self._write(view[: self._length])
+            self._length = 0
+
+    def _flush_periodically(self) -> None:
+        """Flush the buffer every `flush_interval` milliseconds, until the handler is closed."""
+        interval: float = self.flush_interval / 1000
+
+        while not self._stop_flushing.wait(interval):
+            if time.monotonic() - self._last_write < interval:
+                continue
+
+            try:
+                self.flush()
+            except Exception:
+                ## Nothing useful can be done with the error on this thread, try again next interval
+                pass
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format a record and copy it into the buffer, writing the buffer out if needed."""
+        try:
+            data: bytes = (self.format(record) + self.terminator).encode(self.encoding)
+            size: int = len(data)
+
+            if self._length + size > self.capacity:
+                self._flush_buffer()
+
+            if size > self.capacity:
+                ## Too large to buffer
+                self._write(data)
+            else:
+                self._buffer[self._length : self._length + size] = data
+                self._length += size
+
+            if record.levelno >= self.flush_level:
+                self._flush_buffer()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write any buffered records to the log file."""
+        with self.lock:
+            self._flush_buffer()
+
+    def close(self) -> None:
+        """Flush the buffer, stop the background flush thread, and close the file."""
+        self._stop_flushing.set()
+
+        with self.lock:
+            try:
+                self._flush_buffer()
+            finally:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+
+                super().close()
+
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+
+    def __repr__(self) -> str:
+        level: str = logging.getLevelName(self.level)
+
+        return f"<{self.__class__.__name__} {self.baseFilename} ({level})>"
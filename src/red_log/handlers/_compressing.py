@@ -0,0 +1,263 @@
+"""A file handler that rotates on size or time, and compresses rotated files in the background."""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import logging.handlers
+import lzma
+import os
+from pathlib import Path
+import queue
+import re
+import shutil
+import sys
+import threading
+import time
+import typing as t
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+## Chunk size used to copy a rotated file into its compressed archive
+_COPY_CHUNK_SIZE: int = 1024 * 1024
+## strftime format of the timestamp appended to rotated files
+_ROLLOVER_SUFFIX: str = "%Y%m%d-%H%M%S"
+
+
+def _compress_gzip(src: str, dst: str) -> None:
+    with open(src, "rb") as f_in, gzip.open(dst, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out, _COPY_CHUNK_SIZE)
+
+
+def _compress_xz(src: str, dst: str) -> None:
+    with open(src, "rb") as f_in, lzma.open(dst, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out, _COPY_CHUNK_SIZE)
+
+
+def _compress_zstd(src: str, dst: str) -> None:
+    with open(src, "rb") as f_in, open(dst, "wb") as f_out:
+        zstandard.ZstdCompressor().copy_stream(f_in, f_out, read_size=_COPY_CHUNK_SIZE)
+
+
+## Compression name -> (archive file extension, compress function)
+COMPRESSORS: dict[str, tuple[str, t.Callable[[str, str], None]]] = {
+    "gzip": (".gz", _compress_gzip),
+    "xz": (".xz", _compress_xz),
+    "zstd": (".zst", _compress_zstd),
+}
+
+
+class CompressingRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """Rotate a log file when it reaches `maxBytes` or at the next `when`/`interval` boundary, whichever comes first.
+
+    A rollover only closes the file, renames it to `<filename>.<YYYYmmdd-HHMMSS>` (a single `rename()`,
+    which does not depend on the file's size), and opens a new file. Rotated files are handed to a
+    background thread, which compresses them and deletes the oldest archives beyond `backupCount`, so
+    the logging thread never waits on compression or cleanup.
+
+    Rotated files left uncompressed by a previous run (i.e. after a crash) are compressed when the
+    handler is created.
+
+    Params:
+        filename (str | Path): The path to the log file.
+        maxBytes (int): Rotate before a record would make the file reach this size (in bytes). `0` disables size-based rotation.
+        when (str): Time-based rotation unit, as in `logging.handlers.TimedRotatingFileHandler` (`S`, `M`, `H`,
+            `D`, `midnight`, `W0`-`W6`).
+        interval (int): Rotate every `interval` `when`s.
+        backupCount (int): Number of rotated files to keep. `0` keeps all of them.
+        compression (str | None): `gzip`, `xz`, or `zstd` (requires the `zstandard` package). `None` keeps
+            rotated files uncompressed.
+        encoding (str | None): Encoding of the log file.
+        delay (bool): When `True`, the file is not opened until the first write.
+        utc (bool): Use UTC instead of local time for time-based rotation and rotated file names.
+    """
+
+    def __init__(
+        self,
+        filename: t.Union[str, Path],
+        maxBytes: int = 0,
+        when: str = "midnight",
+        interval: int = 1,
+        backupCount: int = 0,
+        compression: str | None = "gzip",
+        encoding: str | None = "utf-8",
+        delay: bool = False,
+        utc: bool = False,
+    ) -> None:
+        if compression is not None and compression not in COMPRESSORS:
+            raise ValueError(
+                f"Invalid compression '{compression}', must be one of {list(COMPRESSORS)} or None."
+            )
+        if compression == "zstd" and zstandard is None:
+            raise ValueError(
+                "zstd compression requires the 'zstandard' package, install it or use 'gzip'/'xz'."
+            )
+
+        super().__init__(
+            filename,
+            when=when,
+            interval=interval,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=delay,
+            utc=utc,
+        )
+
+        self.maxBytes = maxBytes
+        self.compression = compression
+        self.archive_extension: str = COMPRESSORS[compression][0] if compression else ""
+
+        ## Matches rotated files (compressed or not) of this log file, captures timestamp and counter
+        self._rotated_re: re.Pattern = re.compile(
+            rf"^{re.escape(os.path.basename(self.baseFilename))}\.(\d{{8}}-\d{{6}})(?:\.(\d+))?"
+            rf"({'|'.join(re.escape(ext) for ext, _ in COMPRESSORS.values())})?$"
+        )
+
+        self._pending: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+        for path in self._get_rotated_files():
+            if not self._is_archive(path):
+                self._submit(path)
+
+    def _is_archive(self, path: str) -> bool:
+        """Return `True` if `path` is a rotated file that does not need (more) compression."""
+        return self.compression is None or path.endswith(self.archive_extension)
+
+    def _get_rotated_files(self) -> list[str]:
+        """Return the paths of this log file's rotated files, oldest first."""
+        dirname: str = os.path.dirname(self.baseFilename)
+        rotated: list[tuple[tuple[str, int], str]] = []
+
+        for name in os.listdir(dirname):
+            match = self._rotated_re.match(name)
+            if match:
+                stamp, counter, _ext = match.groups()
+                rotated.append(((stamp, int(counter or 0)), os.path.join(dirname, name)))
+
+        return [path for _, path in sorted(rotated)]
+
+    def _get_rollover_path(self) -> str:
+        """Return an unused path to rename the current log file to."""
+        now: float = time.time()
+        time_tuple = time.gmtime(now) if self.utc else time.localtime(now)
+        base: str = f"{self.baseFilename}.{time.strftime(_ROLLOVER_SUFFIX, time_tuple)}"
+
+        path: str = base
+        counter: int = 0
+        while os.path.exists(path) or os.path.exists(path + self.archive_extension):
+            counter += 1
+            path = f"{base}.{counter}"
+
+        return path
+
+    def _submit(self, path: str) -> None:
+        """Hand a rotated file to the background worker, starting it if needed."""
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._process_rotated_files,
+                    name=f"red_log-CompressingRotatingFileHandler-{self.baseFilename}",
+                    daemon=True,
+                )
+                self._worker.start()
+
+        self._pending.put(path)
+
+    def _process_rotated_files(self) -> None:
+        """Compress rotated files and prune old archives, until a `None` sentinel is received."""
+        while True:
+            path: str | None = self._pending.get()
+            if path is None:
+                break
+
+            try:
+                self.compress(path)
+                self.prune()
+            except Exception as exc:
+                ## There is no record to pass to handleError(); report like it would
+                if logging.raiseExceptions:
+                    print(
+                        f"--- Logging error: could not compress/prune rotated log file '{path}'. Details: {exc}",
+                        file=sys.stderr,
+                    )
+
+    def compress(self, path: str) -> None:
+        """Compress a rotated file, replacing it with its archive."""
+        if self.compression is None or not os.path.exists(path):
+            return
+
+        compress_func: t.Callable[[str, str], None] = COMPRESSORS[self.compression][1]
+        archive_path: str = path + self.archive_extension
+        tmp_path: str = archive_path + ".tmp"
+
+        try:
+            compress_func(path, tmp_path)
+            os.replace(tmp_path, archive_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        os.remove(path)
+
+    def prune(self) -> None:
+        """Delete the oldest rotated files beyond `backupCount`."""
+        if self.backupCount <= 0:
+            return
+
+        rotated: list[str] = self._get_rotated_files()
+        for path in rotated[: max(0, len(rotated) - self.backupCount)]:
+            os.remove(path)
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        """Return `True` if the time boundary has passed, or `record` would make the file reach `maxBytes`."""
+        if super().shouldRollover(record):
+            return True
+
+        if self.maxBytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            ## Same check as RotatingFileHandler. Streams are flushed after every record, so tell() is
+            #  the file's size
+            msg: str = f"{self.format(record)}{self.terminator}"
+            if self.stream.tell() + len(msg) >= self.maxBytes:
+                return True
+
+        return False
+
+    def doRollover(self) -> None:
+        """Rename the current log file, open a new one, and queue the old one for compression."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            rollover_path: str = self._get_rollover_path()
+            os.rename(self.baseFilename, rollover_path)
+            self._submit(rollover_path)
+
+        current_time: int = int(time.time())
+        new_rollover_at: int = self.computeRollover(current_time)
+        while new_rollover_at <= current_time:
+            new_rollover_at += self.interval
+        self.rolloverAt = new_rollover_at
+
+        if not self.delay:
+            self.stream = self._open()
+
+    def close(self) -> None:
+        """Close the log file, and wait for queued rotated files to be compressed."""
+        super().close()
+
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+
+        if worker is not None:
+            self._pending.put(None)
+            if worker is not threading.current_thread():
+                worker.join()
@@ -0,0 +1,226 @@
+"""A file handler that appends formatted records to preallocated, memory-mapped segment files."""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+from pathlib import Path
+import re
+import struct
+import typing as t
+
+## Segment header: magic, format version, reserved, length (in bytes) of valid data after the header
+SEGMENT_HEADER: struct.Struct = struct.Struct("<4sHHQ")
+SEGMENT_MAGIC: bytes = b"RLMM"
+SEGMENT_VERSION: int = 1
+
+
+def read_mmap_segment(path: t.Union[str, Path]) -> bytes:
+    """Return the valid (written) data of a segment file created by `MmapFileHandler`.
+
+    Params:
+        path (str | Path): Path to a segment file.
+
+    Returns:
+        (bytes): The encoded, formatted records in the segment.
+
+    Raises:
+        ValueError: When the file is not a segment file.
+
+    """
+    with open(path, "rb") as f:
+        header: bytes = f.read(SEGMENT_HEADER.size)
+        if len(header) < SEGMENT_HEADER.size:
+            raise ValueError(f"'{path}' is too small to be a red_log mmap segment file.")
+
+        magic, version, _reserved, length = SEGMENT_HEADER.unpack(header)
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            raise ValueError(f"'{path}' is not a red_log mmap segment file.")
+
+        return f.read(length)
+
+
+class MmapFileHandler(logging.Handler):
+    """Write formatted log records into memory-mapped segment files.
+
+    Each segment file (`<filename>.000001`, `<filename>.000002`, ...) is preallocated to `segment_size`
+    bytes and mapped into memory. A record is copied into the mapping at the current write offset, and
+    the offset is stored in the segment's header, so no `write()` syscall is made per record and the
+    page cache absorbs bursts. When a record does not fit, the segment is truncated to its used size and
+    a new segment is started.
+
+    If the process crashes, the data and header are still in the page cache and reach the file. On the
+    next start, the handler reads the valid length back from the last segment's header and continues
+    writing after it. Use `read_mmap_segment()` to read a segment's records.
+
+    Params:
+        filename (str | Path): Base path of the segment files.
+        segment_size (int): Size (in bytes) each segment file is preallocated to.
+        backupCount (int): Number of full segments to keep, besides the one being written. `0` keeps all of them.
+        encoding (str): Encoding for formatted records.
+    """
+
+    terminator: str = "\n"
+
+    def __init__(
+        self,
+        filename: t.Union[str, Path],
+        segment_size: int = 64 * 1024 * 1024,
+        backupCount: int = 0,
+        encoding: str = "utf-8",
+    ) -> None:
+        if segment_size <= SEGMENT_HEADER.size:
+            raise ValueError(f"segment_size must be greater than {SEGMENT_HEADER.size}.")
+
+        super().__init__()
+
+        self.baseFilename: str = os.path.abspath(os.fspath(filename))
+        self.segment_size = segment_size
+        self.backupCount = backupCount
+        self.encoding = encoding
+
+        self._segment_re: re.Pattern = re.compile(
+            rf"^{re.escape(os.path.basename(self.baseFilename))}\.(\d{{6}})$"
+        )
+
+        self._fd: int | None = None
+        self._mmap: mmap.mmap | None = None
+        self._segment_index: int = 0
+        ## Write position, relative to the start of the data (after the header)
+        self._offset: int = 0
+        self._capacity: int = 0
+
+        self._open_last_segment()
+
+    def _get_segment_path(self, index: int) -> str:
+        return f"{self.baseFilename}.{index:06d}"
+
+    def _get_segment_indexes(self) -> list[int]:
+        """Return the indexes of existing segment files, oldest first."""
+        dirname: str = os.path.dirname(self.baseFilename)
+        indexes: list[int] = []
+
+        for name in os.listdir(dirname):
+            match = self._segment_re.match(name)
+            if match:
+                indexes.append(int(match.group(1)))
+
+        return sorted(indexes)
+
+    def _open_last_segment(self) -> None:
+        """Continue writing the newest segment after its valid data, or start the first segment."""
+        indexes: list[int] = self._get_segment_indexes()
+        if not indexes:
+            self._open_segment(1, 0)
+            return
+
+        index: int = indexes[-1]
+        try:
+            with open(self._get_segment_path(index), "rb") as f:
+                magic, version, _reserved, length = SEGMENT_HEADER.unpack(
+                    f.read(SEGMENT_HEADER.size)
+                )
+                file_size: int = os.fstat(f.fileno()).st_size
+        except (OSError, struct.error):
+            magic, version, length, file_size = b"", 0, 0, 0
+
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            ## Not readable as a segment, leave it alone
+            self._open_segment(index + 1, 0)
+            return
+
+        ## A length past the end of the file means a torn header write, keep what is really there
+        self._open_segment(index, min(length, file_size - SEGMENT_HEADER.size))
+
+    def _open_segment(self, index: int, offset: int, min_size: int = 0) -> None:
+        """Open (creating if needed) segment `index`, preallocate it, map it, and write at `offset`."""
+        path: str = self._get_segment_path(index)
+        size: int = max(self.segment_size, SEGMENT_HEADER.size + offset + min_size)
+
+        fd: int = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            if os.fstat(fd).st_size < size:
+                if hasattr(os, "posix_fallocate"):
+                    ## Allocate the blocks now, so a full disk fails here instead of with SIGBUS on write
+                    os.posix_fallocate(fd, 0, size)
+                else:
+                    os.ftruncate(fd, size)
+
+            self._mmap = mmap.mmap(fd, size)
+        except BaseException:
+            os.close(fd)
+            raise
+
+        self._fd = fd
+        self._segment_index = index
+        self._offset = offset
+        self._capacity = size - SEGMENT_HEADER.size
+        self._write_header()
+
+    def _write_header(self) -> None:
+        SEGMENT_HEADER.pack_into(self._mmap, 0, SEGMENT_MAGIC, SEGMENT_VERSION, 0, self._offset)
+
+    def _close_segment(self) -> None:
+        """Sync the current segment to disk, truncate it to its valid data, and unmap it."""
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+
+        if self._fd is not None:
+            os.ftruncate(self._fd, SEGMENT_HEADER.size + self._offset)
+            os.close(self._fd)
+            self._fd = None
+
+    def _roll(self, min_size: int) -> None:
+        """Close the current segment, start the next one, and delete segments beyond `backupCount`."""
+        ## An empty segment is grown for the record instead of being left behind
+        index: int = self._segment_index + 1 if self._offset else self._segment_index
+
+        self._close_segment()
+        self._open_segment(index, 0, min_size)
+
+        if self.backupCount > 0:
+            for old_index in self._get_segment_indexes()[: -(self.backupCount + 1)]:
+                os.remove(self._get_segment_path(old_index))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format a record and copy it into the current segment, rolling to a new segment if it is full."""
+        try:
+            data: bytes = (self.format(record) + self.terminator).encode(self.encoding)
+            size: int = len(data)
+
+            if self._mmap is None:
+                self._open_last_segment()
+            if self._offset + size > self._capacity:
+                self._roll(size)
+
+            start: int = SEGMENT_HEADER.size + self._offset
+            self._mmap[start : start + size] = data
+            self._offset += size
+            ## Only count the record as written once its data is in place
+            self._write_header()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Sync the current segment to disk."""
+        with self.lock:
+            if self._mmap is not None:
+                self._mmap.flush()
+
+    def close(self) -> None:
+        """Sync and truncate the current segment, and close it."""
+        with self.lock:
+            try:
+                self._close_segment()
+            finally:
+                super().close()
+
+    def __repr__(self) -> str:
+        level: str = logging.getLevelName(self.level)
+
+        return f"<{self.__class__.__name__} {self.baseFilename} ({level})>"
@@ -0,0 +1,174 @@
+"""A `QueueHandler` that owns and manages the lifecycle of its `QueueListener`.
+
+The stdlib `QueueHandler` only puts records on a queue; something else has to create,
+start, and stop a `QueueListener` that pulls records off the queue and passes them to
+the "real" handlers. `ManagedQueueHandler` does that work for you, so it can be created
+directly from a logging dictConfig.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+from queue import Queue
+import threading
+import typing as t
+
+from ._spill import SpillQueue
+
+log = logging.getLogger("red_log.handlers")
+
+
+def get_handler_by_name(name: str) -> logging.Handler | None:
+    """Return a configured handler by its name, or `None` if no handler with that name exists.
+
+    Handlers created by `logging.config.dictConfig()` are registered by the name they were given
+    in the config dict.
+
+    Params:
+        name (str): The name of the handler in the logging dictConfig.
+
+    Returns:
+        (logging.Handler | None): The handler object, or `None` if it does not exist.
+
+    """
+    getter = getattr(logging, "getHandlerByName", None)
+    if getter is not None:
+        return getter(name)
+
+    ## Python < 3.12 has no public accessor for the handler registry
+    return logging._handlers.get(name)
+
+
+class ManagedQueueHandler(logging.handlers.QueueHandler):
+    """Put log records on a queue, and run a `QueueListener` thread that passes them to other handlers.
+
+    The handlers the listener dispatches to are referenced by name, so this handler can be
+    declared in a dictConfig alongside them. Names are resolved when the listener starts,
+    which happens on the first emitted record (or when `start_listener()` is called, or when
+    the handler is used as a context manager). The listener is stopped, and the queue drained,
+    when the handler is closed or the interpreter exits.
+
+    Params:
+        handlers (list[str | logging.Handler]): Names of handlers in the logging dictConfig (or handler
+            objects) the listener should pass records to.
+        queue (queue.Queue | None): The queue to use. When `None`, an unbounded `queue.Queue` is created (or a
+            `SpillQueue`, when `spill_dir` is set).
+        respect_handler_level (bool): When `True`, the listener only passes records to handlers whose level
+            allows the record.
+        spill_dir (str | None): When set, a `red_log.handlers.SpillQueue` in this directory is used, which moves
+            records to disk when more than `spill_high_water` are waiting.
+        spill_high_water (int): Maximum number of records the spill queue keeps in memory.
+        spill_segment_size (int): Maximum size (in bytes) of a spill segment file.
+        spill_max_bytes (int): Maximum total size (in bytes) of the spill segment files. The oldest are deleted first.
+    """
+
+    def __init__(
+        self,
+        handlers: list[t.Union[str, logging.Handler]] | None = None,
+        queue: Queue | None = None,
+        respect_handler_level: bool = True,
+        spill_dir: str | None = None,
+        spill_high_water: int = 10_000,
+        spill_segment_size: int = 16 * 1024 * 1024,
+        spill_max_bytes: int = 1024 * 1024 * 1024,
+    ) -> None:
+        if spill_dir is not None:
+            if queue is not None:
+                raise ValueError("ManagedQueueHandler accepts a queue or a spill_dir, not both.")
+
+            queue = SpillQueue(
+                spill_dir,
+                high_water=spill_high_water,
+                segment_size=spill_segment_size,
+                max_bytes=spill_max_bytes,
+            )
+
+        super().__init__(queue if queue is not None else Queue(-1))
+
+        ## Index into the list instead of iterating so dictConfig can convert each item
+        handlers = handlers or []
+        self.handler_names: list[t.Union[str, logging.Handler]] = [
+            handlers[i] for i in range(len(handlers))
+        ]
+        self.respect_handler_level = respect_handler_level
+        self.listener: logging.handlers.QueueListener | None = None
+
+        self._listener_lock = threading.Lock()
+
+        atexit.register(self.stop_listener)
+
+    def _resolve_handlers(self) -> list[logging.Handler]:
+        """Resolve the names in `self.handler_names` to handler objects."""
+        resolved: list[logging.Handler] = []
+
+        for handler in self.handler_names:
+            if isinstance(handler, logging.Handler):
+                resolved.append(handler)
+                continue
+
+            _handler = get_handler_by_name(handler)
+            if _handler is None:
+                raise ValueError(
+                    f"ManagedQueueHandler '{self.name}' could not find a handler named '{handler}'."
+                )
+
+            resolved.append(_handler)
+
+        return resolved
+
+    def start_listener(self) -> None:
+        """Start the `QueueListener` thread, if it is not already running."""
+        with self._listener_lock:
+            if self.listener is not None:
+                return
+
+            self.listener = logging.handlers.QueueListener(
+                self.queue,
+                *self._resolve_handlers(),
+                respect_handler_level=self.respect_handler_level,
+            )
+            self.listener.start()
+
+    def stop_listener(self) -> None:
+        """Stop the `QueueListener` thread, after it has handled all queued records."""
+        with self._listener_lock:
+            if self.listener is None:
+                return
+
+            try:
+                self.listener.stop()
+            finally:
+                self.listener = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Start the listener (on first use), then put the record on the queue."""
+        if self.listener is None:
+            try:
+                self.start_listener()
+            except Exception:
+                self.handleError(record)
+
+                return
+
+        super().emit(record)
+
+    def close(self) -> None:
+        """Stop the listener, flushing queued records, and close the handler."""
+        try:
+            self.stop_listener()
+            atexit.unregister(self.stop_listener)
+
+            if isinstance(self.queue, SpillQueue):
+                self.queue.close()
+        finally:
+            super().close()
+
+    def __enter__(self) -> ManagedQueueHandler:
+        self.start_listener()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop_listener()
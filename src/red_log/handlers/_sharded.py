@@ -0,0 +1,218 @@
+"""A file handler whose emitting threads never wait on each other, or on the file."""
+
+from __future__ import annotations
+
+import collections
+import itertools
+import logging
+from operator import itemgetter
+import os
+from pathlib import Path
+import threading
+import typing as t
+
+from red_log.__levels import level_to_int
+
+## (sequence number, record creation time, formatted record)
+_ShardEntry = t.Tuple[int, float, str]
+
+_ORDER_KEYS: dict[str, t.Callable[[_ShardEntry], t.Any]] = {
+    "sequence": itemgetter(0),
+    "time": itemgetter(1, 0),
+}
+
+
+class ShardedFileHandler(logging.Handler):
+    """Write formatted log records to a file from a background thread, without a per-record lock.
+
+    `logging.Handler.handle()` takes the handler's lock for every record, so threads logging through one
+    handler serialize on it. This handler overrides `handle()` to skip the lock: each emitting thread is
+    assigned one of `shards` append buffers (`collections.deque`, whose `append()` is atomic), formats the
+    record on its own thread, and appends it with a global sequence number. A writer thread drains all
+    shards every `flush_interval` milliseconds, merges the records in `order`, and writes them in one call.
+
+    Records are ordered within each drained batch. A record emitted while a batch is being drained may
+    be written in the next batch, after records with a higher sequence number.
+
+    Params:
+        filename (str | Path): The path to the log file.
+        mode (str): `a` to append to an existing file, `w` to truncate it.
+        encoding (str): Encoding for formatted records.
+        shards (int): Number of append buffers. Threads are assigned a buffer round-robin.
+        flush_interval (int): Time (in milliseconds) between writes.
+        flush_level (int | str): Records at or above this level wake the writer thread immediately.
+        order (str): Merge records by `sequence` (the order `handle()` was called in) or by `time`
+            (the record's `created` timestamp).
+        delay (bool): When `True`, the file is not opened until the first write.
+    """
+
+    terminator: str = "\n"
+
+    def __init__(
+        self,
+        filename: t.Union[str, Path],
+        mode: str = "a",
+        encoding: str = "utf-8",
+        shards: int = 8,
+        flush_interval: int = 100,
+        flush_level: t.Union[int, str] = logging.ERROR,
+        order: str = "sequence",
+        delay: bool = False,
+    ) -> None:
+        if mode not in ("a", "w"):
+            raise ValueError(f"Invalid mode '{mode}', must be 'a' or 'w'.")
+        if shards <= 0:
+            raise ValueError("shards must be greater than 0.")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be greater than 0.")
+        if order not in _ORDER_KEYS:
+            raise ValueError(
+                f"Invalid order '{order}', must be one of {list(_ORDER_KEYS)}."
+            )
+
+        super().__init__()
+
+        self.baseFilename: str = os.path.abspath(os.fspath(filename))
+        self.mode = mode
+        self.encoding = encoding
+        self.flush_interval = flush_interval
+        self.flush_level = level_to_int(flush_level)
+        self.order = order
+
+        self._shards: list[collections.deque[_ShardEntry]] = [
+            collections.deque() for _ in range(shards)
+        ]
+        self._order_key = _ORDER_KEYS[order]
+        ## next() on an itertools.count is atomic
+        self._sequence: t.Iterator[int] = itertools.count()
+        self._next_shard: t.Iterator[int] = itertools.count()
+        self._local = threading.local()
+
+        ## Serializes draining and writing; emitting threads never take it
+        self._write_lock = threading.Lock()
+        self._fd: int | None = None
+
+        if not delay:
+            self._open()
+
+        self._wake = threading.Event()
+        self._stop_writing = threading.Event()
+        self._writer = threading.Thread(
+            target=self._write_periodically,
+            name=f"red_log-ShardedFileHandler-{self.baseFilename}",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def _open(self) -> int:
+        """Open the log file, if it is not already open, and return its file descriptor."""
+        if self._fd is None:
+            flags: int = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+            flags |= os.O_APPEND if self.mode == "a" else os.O_TRUNC
+
+            self._fd = os.open(self.baseFilename, flags, 0o644)
+            ## Only truncate on the first open
+            self.mode = "a"
+
+        return self._fd
+
+    def _get_shard(self) -> collections.deque[_ShardEntry]:
+        """Return the append buffer assigned to the current thread."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._shards[next(self._next_shard) % len(self._shards)]
+            self._local.shard = shard
+
+            return shard
+
+    def _drain(self) -> None:
+        """Write all buffered records to the log file, in order. Caller must hold `_write_lock`."""
+        batch: list[_ShardEntry] = []
+
+        for shard in self._shards:
+            ## Only take what is there now, so a busy shard cannot starve the others
+            for _ in range(len(shard)):
+                batch.append(shard.popleft())
+
+        if not batch:
+            return
+
+        batch.sort(key=self._order_key)
+
+        data: bytes = "".join([entry[2] for entry in batch]).encode(self.encoding)
+        fd: int = self._open()
+
+        while data:
+            written: int = os.write(fd, data)
+            data = data[written:]
+
+    def _write_periodically(self) -> None:
+        """Drain the shards every `flush_interval` milliseconds, until the handler is closed."""
+        interval: float = self.flush_interval / 1000
+
+        while not self._stop_writing.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+
+            try:
+                self.flush()
+            except Exception:
+                ## Nothing useful can be done with the error on this thread, try again next interval
+                pass
+
+    def handle(self, record: logging.LogRecord) -> t.Union[bool, logging.LogRecord]:
+        """Filter and emit a record, without taking the handler's lock."""
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+
+        return rv
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format a record on the calling thread and append it to that thread's shard."""
+        try:
+            self._get_shard().append(
+                (
+                    next(self._sequence),
+                    record.created,
+                    self.format(record) + self.terminator,
+                )
+            )
+
+            if record.levelno >= self.flush_level:
+                self._wake.set()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write any buffered records to the log file."""
+        with self._write_lock:
+            self._drain()
+
+    def close(self) -> None:
+        """Stop the writer thread, write any buffered records, and close the file."""
+        self._stop_writing.set()
+        self._wake.set()
+
+        if self._writer is not threading.current_thread():
+            self._writer.join()
+
+        with self._write_lock:
+            try:
+                self._drain()
+            finally:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+
+                super().close()
+
+    def __repr__(self) -> str:
+        level: str = logging.getLevelName(self.level)
+
+        return f"<{self.__class__.__name__} {self.baseFilename} ({level})>"
@@ -0,0 +1,339 @@
+"""A queue that spills records to segment files on disk when too many are waiting in memory."""
+
+from __future__ import annotations
+
+import collections
+import logging
+import os
+from pathlib import Path
+import pickle
+import queue
+import re
+import struct
+import typing as t
+
+try:
+    import fcntl
+except ImportError:
+    ## Windows
+    fcntl = None
+    import msvcrt
+
+## Frame header: length (in bytes) of the pickled record that follows
+SPILL_FRAME_HEADER: struct.Struct = struct.Struct(">L")
+
+_SEGMENT_RE: re.Pattern = re.compile(r"^spill-(\d{8})\.seg$")
+_QUEUE_DIR_RE: re.Pattern = re.compile(r"^queue-(\d+)$")
+## Held (locked) by the SpillQueue using a queue directory, for as long as it is open
+SPILL_LOCK_FILE: str = "spill.lock"
+
+
+def _try_lock(path: str) -> t.BinaryIO | None:
+    """Open and lock the file at `path` without blocking. Returns `None` if another queue holds the lock."""
+    f: t.BinaryIO = open(path, "a+b")
+
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        f.close()
+
+        return None
+
+    return f
+
+
+class _Segment:
+    """A spill segment file, and the number of records written to it."""
+
+    __slots__ = ("index", "path", "size", "count")
+
+    def __init__(self, index: int, path: str, size: int = 0, count: int = 0) -> None:
+        self.index = index
+        self.path = path
+        self.size = size
+        self.count = count
+
+
+class SpillQueue(queue.Queue):
+    """An unbounded `queue.Queue` for log records, which keeps at most `high_water` records in memory.
+
+    Records are kept in memory until `high_water` records are waiting. After that, new records are
+    pickled and appended to segment files (`spill-00000001.seg`, ...) in `spill_dir`, so memory use stays
+    flat however long the consumer is stalled (i.e. during a network or NFS outage). Once the records in
+    memory have been consumed, spilled records are read back in order, and the queue switches back to
+    memory when the disk is empty.
+
+    Every open `SpillQueue` writes to its own `queue-N` subdirectory of `spill_dir`, and holds a lock on
+    the `spill.lock` file in it until `close()` (or until the process exits), so several queues and
+    processes can share a `spill_dir`. A new queue takes over the first subdirectory whose lock is free,
+    and creates a new one when every subdirectory is in use.
+
+    Segment files hold up to `segment_size` bytes. When the segments take more than `max_bytes`, the
+    oldest segment is deleted, and its unread records are counted in `dropped`. Segment files left in the
+    subdirectory by a previous queue (i.e. after a crash) are replayed before new records; a segment that
+    was partly consumed is replayed from its start. Segments of a queue that is still open are never
+    touched.
+
+    Records are stored like `logging.handlers.QueueHandler.prepare()` leaves them (message merged, no
+    `exc_info`), so only their attributes need to be picklable. `put()` raises if a record has to be
+    spilled and cannot be pickled, which `QueueHandler` reports with `handleError()`.
+
+    Params:
+        spill_dir (str | Path): Directory for the queue directories. Created if it does not exist.
+        high_water (int): Maximum number of records kept in memory.
+        segment_size (int): Maximum size (in bytes) of a segment file.
+        max_bytes (int): Maximum total size (in bytes) of the segment files. Must be at least 2 * `segment_size`.
+    """
+
+    def __init__(
+        self,
+        spill_dir: t.Union[str, Path],
+        high_water: int = 10_000,
+        segment_size: int = 16 * 1024 * 1024,
+        max_bytes: int = 1024 * 1024 * 1024,
+    ) -> None:
+        if high_water < 1:
+            raise ValueError("high_water must be at least 1.")
+        if max_bytes < 2 * segment_size:
+            raise ValueError("max_bytes must be at least 2 * segment_size.")
+
+        self.spill_dir: str = os.path.abspath(os.fspath(spill_dir))
+        self.high_water = high_water
+        self.segment_size = segment_size
+        self.max_bytes = max_bytes
+
+        ## Number of spilled records deleted to stay within max_bytes
+        self.dropped: int = 0
+
+        super().__init__(maxsize=0)
+
+    def _init(self, maxsize: int) -> None:
+        """Set up the in-memory deque and the disk state. Called by `queue.Queue.__init__()`."""
+        self._memory: collections.deque[logging.LogRecord | None] = collections.deque()
+        ## Oldest first, the last segment is the one being written
+        self._segments: collections.deque[_Segment] = collections.deque()
+        self._disk_bytes: int = 0
+        ## Records on disk that have not been read yet
+        self._disk_count: int = 0
+
+        self._write_file: t.BinaryIO | None = None
+        self._read_file: t.BinaryIO | None = None
+        self._read_count: int = 0
+
+        ## The queue directory this queue owns, and the open (locked) lock file in it
+        self.queue_dir: str = ""
+        self._lock_file: t.BinaryIO | None = None
+
+        os.makedirs(self.spill_dir, exist_ok=True)
+        self._lock_queue_dir()
+        self._load_segments()
+
+    def _lock_queue_dir(self) -> None:
+        """Take over the first queue directory no open queue holds, or create a new one."""
+        indexes: list[int] = sorted(
+            int(match.group(1))
+            for match in (_QUEUE_DIR_RE.match(name) for name in os.listdir(self.spill_dir))
+            if match
+        )
+
+        for index in indexes:
+            path: str = os.path.join(self.spill_dir, f"queue-{index}")
+            self._lock_file = _try_lock(os.path.join(path, SPILL_LOCK_FILE))
+            if self._lock_file is not None:
+                self.queue_dir = path
+
+                return
+
+        index = indexes[-1] if indexes else 0
+        while True:
+            index += 1
+            path = os.path.join(self.spill_dir, f"queue-{index}")
+
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                ## Created by another queue at the same time
+                continue
+
+            ## Another queue can take the new directory before it is locked here
+            self._lock_file = _try_lock(os.path.join(path, SPILL_LOCK_FILE))
+            if self._lock_file is not None:
+                self.queue_dir = path
+
+                return
+
+    def _get_segment_path(self, index: int) -> str:
+        return os.path.join(self.queue_dir, f"spill-{index:08d}.seg")
+
+    def _load_segments(self) -> None:
+        """Pick up segment files left by a previous queue, counting their complete records."""
+        indexes: list[int] = sorted(
+            int(match.group(1))
+            for match in (_SEGMENT_RE.match(name) for name in os.listdir(self.queue_dir))
+            if match
+        )
+
+        for index in indexes:
+            path: str = self._get_segment_path(index)
+            size: int = 0
+            count: int = 0
+
+            with open(path, "r+b") as f:
+                while True:
+                    header: bytes = f.read(SPILL_FRAME_HEADER.size)
+                    if len(header) < SPILL_FRAME_HEADER.size:
+                        break
+
+                    length: int = SPILL_FRAME_HEADER.unpack(header)[0]
+                    if len(f.read(length)) < length:
+                        break
+
+                    size += SPILL_FRAME_HEADER.size + length
+                    count += 1
+
+                ## Cut off a record that was only partly written
+                f.truncate(size)
+
+            if count:
+                self._segments.append(_Segment(index, path, size, count))
+                self._disk_bytes += size
+                self._disk_count += count
+            else:
+                os.remove(path)
+
+    def _open_write_segment(self) -> None:
+        """Start a new segment file after the newest one."""
+        index: int = self._segments[-1].index + 1 if self._segments else 1
+        segment = _Segment(index, self._get_segment_path(index))
+
+        ## Unbuffered, so each record reaches the file (and survives a crash) with one write()
+        self._write_file = open(segment.path, "ab", buffering=0)
+        self._segments.append(segment)
+
+    def _close_write_segment(self) -> None:
+        if self._write_file is not None:
+            self._write_file.close()
+            self._write_file = None
+
+    def _evict(self) -> None:
+        """Delete the oldest segments until the segment files fit in `max_bytes`."""
+        while self._disk_bytes > self.max_bytes and len(self._segments) > 1:
+            segment: _Segment = self._segments.popleft()
+            unread: int = segment.count
+
+            if self._read_file is not None:
+                ## The oldest segment is the one being read
+                unread -= self._read_count
+                self._read_file.close()
+                self._read_file = None
+                self._read_count = 0
+
+            self.dropped += unread
+            self._disk_count -= unread
+            self._disk_bytes -= segment.size
+            os.remove(segment.path)
+
+    def _spill(self, item: logging.LogRecord | None) -> None:
+        """Append a record to the newest segment, rolling and evicting segments as needed."""
+        payload: bytes = pickle.dumps(
+            None if item is None else item.__dict__, pickle.HIGHEST_PROTOCOL
+        )
+        frame: bytes = SPILL_FRAME_HEADER.pack(len(payload)) + payload
+
+        ## A record too large for a segment still goes in an empty one
+        if self._write_file is None or (
+            self._segments[-1].size and self._segments[-1].size + len(frame) > self.segment_size
+        ):
+            self._close_write_segment()
+            self._open_write_segment()
+
+        self._write_file.write(frame)
+
+        segment: _Segment = self._segments[-1]
+        segment.size += len(frame)
+        segment.count += 1
+        self._disk_bytes += len(frame)
+        self._disk_count += 1
+
+        self._evict()
+
+    def _read_spilled(self) -> logging.LogRecord | None:
+        """Read the next record from the oldest segment, deleting segments as they are used up."""
+        segment: _Segment = self._segments[0]
+
+        if self._read_file is None:
+            self._read_file = open(segment.path, "rb")
+            self._read_count = 0
+
+        header: bytes = self._read_file.read(SPILL_FRAME_HEADER.size)
+        payload: bytes = self._read_file.read(SPILL_FRAME_HEADER.unpack(header)[0])
+
+        self._read_count += 1
+        self._disk_count -= 1
+
+        if self._read_count == segment.count:
+            ## Used up. If it is the only segment, the disk is empty and the next spill starts a new one
+            self._read_file.close()
+            self._read_file = None
+            self._read_count = 0
+
+            if len(self._segments) == 1:
+                self._close_write_segment()
+
+            self._segments.popleft()
+            self._disk_bytes -= segment.size
+            os.remove(segment.path)
+
+        record_dict: dict[str, t.Any] | None = pickle.loads(payload)
+
+        return None if record_dict is None else logging.makeLogRecord(record_dict)
+
+    def _refill(self) -> None:
+        """Move spilled records back into memory, up to half of `high_water`."""
+        target: int = max(1, self.high_water // 2)
+
+        while self._disk_count and len(self._memory) < target:
+            self._memory.append(self._read_spilled())
+
+    def _qsize(self) -> int:
+        return len(self._memory) + self._disk_count
+
+    def _put(self, item: logging.LogRecord | None) -> None:
+        ## Once anything is on disk, new records go there too, so records are replayed in order
+        if self._disk_count or len(self._memory) >= self.high_water:
+            self._spill(item)
+        else:
+            self._memory.append(item)
+
+    def _get(self) -> logging.LogRecord | None:
+        if not self._memory:
+            self._refill()
+
+        return self._memory.popleft()
+
+    @property
+    def spilled(self) -> int:
+        """The number of records currently waiting on disk."""
+        with self.mutex:
+            return self._disk_count
+
+    def close(self) -> None:
+        """Close the segment files, and release `queue_dir`.
+
+        Records still on disk are replayed by the next `SpillQueue` that takes over `queue_dir`.
+        """
+        with self.mutex:
+            self._close_write_segment()
+
+            if self._read_file is not None:
+                self._read_file.close()
+                self._read_file = None
+
+            if self._lock_file is not None:
+                ## Closing the file releases the lock
+                self._lock_file.close()
+                self._lock_file = None
@@ -1,12 +1,68 @@
+"""Helper functions to build, save, load, validate, and inspect logging dictConfigs.
+
+Attributes are imported on first access (PEP 562), because the helpers import every
+config class.
+"""
+
 from __future__ import annotations
 
-from .__methods import (
-    assemble_configdict,
-    ensure_logdir,
-    get_formatter_config,
-    get_logger_config,
-    get_rotatingfilehandler_config,
-    get_streamhandler_config,
-    print_configdict,
-    save_configdict,
-)
+## Type checkers treat this as True; avoids importing `typing` at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .__methods import (
+        assemble_configdict,
+        ensure_logdir,
+        get_formatter_config,
+        get_logger_config,
+        get_rotatingfilehandler_config,
+        get_streamhandler_config,
+        print_configdict,
+        save_configdict,
+    )
+    from ._configdict_cache import clear_configdict_cache, config_fingerprint
+    from ._configdict_loader import compile_raw_configdict, load_configdict
+    from ._configdict_validation import (
+        ConfigValidationError,
+        get_configdict_errors,
+        validate_configdict,
+    )
+
+## Attribute name -> module it is imported from
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "assemble_configdict": ".__methods",
+    "ensure_logdir": ".__methods",
+    "get_formatter_config": ".__methods",
+    "get_logger_config": ".__methods",
+    "get_rotatingfilehandler_config": ".__methods",
+    "get_streamhandler_config": ".__methods",
+    "print_configdict": ".__methods",
+    "save_configdict": ".__methods",
+    "clear_configdict_cache": "._configdict_cache",
+    "config_fingerprint": "._configdict_cache",
+    "compile_raw_configdict": "._configdict_loader",
+    "load_configdict": "._configdict_loader",
+    "ConfigValidationError": "._configdict_validation",
+    "get_configdict_errors": "._configdict_validation",
+    "validate_configdict": "._configdict_validation",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    """Import attributes of this package on first access."""
+    import importlib
+
+    module_name: str | None = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    ## Cache on the module, so this function is not called again for `name`
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -6,14 +6,18 @@ import logging
 
 log = logging.getLogger("red_log.std.logging_utils")
 
-from copy import deepcopy
+from dataclasses import replace
 import json
 from pathlib import Path
 import typing as t
 
 from red_log.__base import BASE_LOGGING_CONFIG_DICT
+from red_log.config_classes.base import FrozenDict, freeze
+from red_log.__levels import level_to_int
+from red_log.config_classes.filters import LEVEL_FILTER_THRESHOLDS, FilterConfig
 from red_log.config_classes.formatters import FormatterConfig
 from red_log.config_classes.handlers import (
+    QUEUEABLE_HANDLER_CLASSES,
     FileHandlerConfig,
     QueueHandlerConfig,
     QueueListenerConfig,
@@ -22,11 +26,18 @@ from red_log.config_classes.handlers import (
     StreamHandlerConfig,
     TimedRotatingFileHandlerConfig,
 )
+from red_log.config_classes.instrumentation import (
+    RED_LOG_CONFIG_KEY,
+    MetricsConfig,
+    ProfilingConfig,
+)
 from red_log.config_classes.loggers import (
     LoggerConfig,
     LoggerFactory,
 )
 from red_log.config_classes.types import (
+    FORMATTER_CLASSES_TYPE,
+    FORMATTER_CLASSES_TYPE_ANNOTATION,
     HANDLER_CLASSES_TYPE,
     HANDLER_CLASSES_TYPE_ANNOTATION,
     LOGGING_CONFIG_DICT_TYPE,
@@ -43,6 +54,13 @@ from red_log.fmts import (
     RED_LOG_FMT,
 )
 
+from ._configdict_cache import (
+    cache_configdict,
+    compile_config,
+    get_cached_configdict,
+    make_cache_key,
+)
+
 
 def ensure_logdir(p: t.Union[str, Path] = None) -> None:
     """Ensure a directory exists.
@@ -198,6 +216,7 @@ def get_formatter_config(
     datefmt: str = DATE_FMT_STANDARD,
     style: str = "%",
     validate: bool = True,
+    formatter_class: str | None = None,
     as_dict: bool = False,
 ) -> dict[str, dict[str, str]] | FormatterConfig:
     """Return a FormatterConfig, or a dict representing a Formatter.
@@ -210,6 +229,8 @@ def get_formatter_config(
         style (str): The style of string substitution to use for the formatter. Options include `%` for `'%', some_var`,
             `{` for `'{some_var}`, etc.
         validate (bool): If `True`, the handler will be validated by the logging module before fully initializing.
+        formatter_class (str | None): Dotted path to a `logging.Formatter` subclass to use, i.e.
+            `red_log.formatters.CompiledFormatter`. Defaults to the stdlib `logging.Formatter`.
         as_dict (bool): If `True`, return the configuration as a dict that can be joined into `dictConfig()`.
 
     Returns:
@@ -220,7 +241,12 @@ def get_formatter_config(
     try:
         ## Initialize formatter object
         _formatter: FormatterConfig = FormatterConfig(
-            name=name, fmt=fmt, datefmt=datefmt, style=style, validate=validate
+            name=name,
+            fmt=fmt,
+            datefmt=datefmt,
+            style=style,
+            validate=validate,
+            formatter_class=formatter_class,
         )
 
         if as_dict:
@@ -283,7 +309,11 @@ def assemble_configdict(
     root_handlers: list[str] = ["console"],
     root_level: str = "DEBUG",
     formatters: (
-        t.Union[list[FormatterConfig], list[LOGGING_CONFIG_DICT_TYPE_ANNOTATION]] | None
+        t.Union[
+            list[FORMATTER_CLASSES_TYPE_ANNOTATION],
+            list[LOGGING_CONFIG_DICT_TYPE_ANNOTATION],
+        ]
+        | None
     ) = None,
     handlers: (
         t.Union[HANDLER_CLASSES_TYPE_ANNOTATION, LOGGING_CONFIG_DICT_TYPE_ANNOTATION]
@@ -296,7 +326,16 @@ def assemble_configdict(
         ]
         | None
     ) = None,
-) -> dict[str, t.Any]:
+    filters: (
+        t.Union[list[FilterConfig], list[LOGGING_CONFIG_DICT_TYPE_ANNOTATION]] | None
+    ) = None,
+    non_blocking: bool = False,
+    queue_listener: QueueListenerConfig | None = None,
+    use_cache: bool = True,
+    fold_level_filters: bool = True,
+    metrics: MetricsConfig | None = None,
+    profiling: ProfilingConfig | None = None,
+) -> FrozenDict:
     """Build a logging dictConfig dict.
 
     Description:
@@ -317,16 +356,58 @@ def assemble_configdict(
         propagate (bool): When `True`, log messages will propagate up/down to the root logger.
         root_handlers (list[str]): List of handlers for the root logger. These handler configs must exist in the logging dictConfig.
         root_level (str): The log level for the root logger.
-        formatters (list[FormatterConfig] | list[dict[str, dict[str, t.Any]]] | None): List of logging formatter config objects.
+        formatters (list[FormatterConfig | JsonFormatterConfig] | list[dict[str, dict[str, t.Any]]] | None): List of logging formatter config objects.
         handlers (list[BaseHandlerConfig | dict[str, dict[str, t.Any]]] | None): List of logging handler config objects.
         loggers (list[LoggerConfig | LoggerFactory | dict[str, dict[str, t.Any]]]] | None): List of logging logger config objects.
+        filters (list[FilterConfig] | list[dict[str, dict[str, t.Any]]] | None): List of logging filter config objects. Handlers
+            and loggers reference filters by name.
+        non_blocking (bool): When `True`, every file, stream, and socket handler used by the root logger or a logger is moved
+            behind a `red_log.handlers.ManagedQueueHandler`. Log calls only put records on a queue, and a listener thread
+            does the blocking I/O.
+        queue_listener (QueueListenerConfig | None): Settings (name, queue, respect_handler_level, spill_*) for the queue handler
+            created when `non_blocking=True`. Defaults to a `QueueListenerConfig` named `queue`.
+        use_cache (bool): When `True`, return the cached config if this function was already called with the
+            same inputs.
+        fold_level_filters (bool): When `True`, level-only filters on handlers (`debug_filter`, `info_filter`, ...) are
+            removed and folded into the handler's `level`, so records are not passed through a Python function per filter.
+            Level-only filters that are redundant, or that stop the handler from ever emitting a record, are logged as warnings.
+        metrics (MetricsConfig | None): When set, `red_log.runtime.apply_configdict()` collects runtime metrics (records,
+            latency, bytes, queue depth) for the config's handlers. Stored in the config's `red_log` section.
+        profiling (ProfilingConfig | None): When set, `red_log.runtime.apply_configdict()` samples the time and bytes the
+            config's handlers spend on each log statement (see `red_log.metrics.get_profile_report()`). Stored in the
+            config's `red_log` section.
 
     Returns:
-        (dict[str, Any]): An initialized logging config dict created from inputs. Used with `logging.config.dictConfig()`
+        (FrozenDict): An initialized, read-only logging config dict created from inputs. Used with
+            `logging.config.dictConfig()`. Use `.copy()` or `red_log.config_classes.base.thaw()` for a mutable copy.
 
     """
-    ## Get base logging configDict object, with empty formatters, loggers, etc
-    logging_config: dict[str, t.Any] = BASE_LOGGING_CONFIG_DICT
+    ## Return the compiled config if these inputs were already assembled
+    cache_key = (
+        make_cache_key(
+            disable_existing_loggers,
+            propagate,
+            root_handlers,
+            root_level,
+            formatters,
+            handlers,
+            loggers,
+            filters,
+            non_blocking,
+            queue_listener,
+            fold_level_filters,
+            metrics,
+            profiling,
+        )
+        if use_cache
+        else None
+    )
+    cached_config: FrozenDict | None = get_cached_configdict(cache_key)
+    if cached_config is not None:
+        return cached_config
+
+    ## Copy the base logging configDict object, with empty formatters, loggers, etc
+    logging_config: dict[str, t.Any] = dict(BASE_LOGGING_CONFIG_DICT)
 
     ## Set logging config options
     logging_config["disable_existing_loggers"] = disable_existing_loggers
@@ -335,7 +416,7 @@ def assemble_configdict(
     ## Build root logger
     config_key_root = {
         ## Set handlers
-        "handlers": root_handlers,
+        "handlers": list(root_handlers),
         ## Set log level string
         "level": root_level.upper(),
     }
@@ -344,6 +425,7 @@ def assemble_configdict(
     logging_config["root"] = config_key_root
 
     ## Initialize formatter, handler, logger config dicts
+    filter_configdicts: LOGGING_CONFIG_DICT_TYPE = {}
     formatter_configdicts: LOGGING_CONFIG_DICT_TYPE = {}
     handler_configdicts: LOGGING_CONFIG_DICT_TYPE = {}
     logger_configdicts: LOGGING_CONFIG_DICT_TYPE = {}
@@ -353,12 +435,12 @@ def assemble_configdict(
         for formatter_dict in formatters:
             if isinstance(formatter_dict, dict):
                 pass
-            elif isinstance(formatter_dict, FormatterConfig):
+            elif isinstance(formatter_dict, FORMATTER_CLASSES_TYPE):
                 try:
-                    formatter_dict: dict = formatter_dict.get_configdict()
+                    formatter_dict: dict = compile_config(formatter_dict)
                 except Exception as exc:
                     msg = Exception(
-                        f"Unhandled exception getting config dict for FormatterConfig object. Details: {exc}"
+                        f"Unhandled exception getting config dict for *FormatterConfig object. Details: {exc}"
                     )
                     log.error(msg)
 
@@ -373,7 +455,7 @@ def assemble_configdict(
                 pass
             elif isinstance(handler_dict, HANDLER_CLASSES_TYPE):
                 try:
-                    handler_dict = handler_dict.get_configdict()
+                    handler_dict = compile_config(handler_dict)
                 except Exception as exc:
                     msg = Exception(
                         f"Unhandled exception getting config dict for *HandlerConfig object. Details: {exc}"
@@ -391,7 +473,7 @@ def assemble_configdict(
                 pass
             elif isinstance(logger_dict, LoggerConfig):
                 try:
-                    logger_dict = logger_dict.get_configdict()
+                    logger_dict = compile_config(logger_dict)
                 except Exception as exc:
                     msg = Exception(
                         f"Unhandled exception getting config dict for LoggerConfig object. Details: {exc}"
@@ -402,24 +484,246 @@ def assemble_configdict(
 
             logger_configdicts.update(logger_dict)
 
-    ## Create a copy of the original config
-    try:
-        return_dict = deepcopy(logging_config)
-    except Exception as exc:
-        msg = Exception(
-            f"Unhandled exception copying original logging config. Proceeding with original logging config"
+    if filters:
+        ## Filters passed to function, parse and add to config
+        for filter_dict in filters:
+            if isinstance(filter_dict, dict):
+                pass
+            elif isinstance(filter_dict, FilterConfig):
+                try:
+                    filter_dict = compile_config(filter_dict)
+                except Exception as exc:
+                    msg = Exception(
+                        f"Unhandled exception getting config dict for FilterConfig object. Details: {exc}"
+                    )
+                    log.error(msg)
+
+                    raise exc
+
+            filter_configdicts.update(filter_dict)
+
+    if fold_level_filters:
+        ## Replace level-only filters with handler levels
+        _fold_level_filters(
+            filter_configdicts=filter_configdicts,
+            handler_configdicts=handler_configdicts,
+            logger_configdicts=logger_configdicts,
         )
-        log.warning(msg)
 
-        return_dict = logging_config
+    if non_blocking:
+        ## Move blocking handlers behind a queue
+        _enqueue_blocking_handlers(
+            queue_listener=queue_listener or QueueListenerConfig(),
+            root=config_key_root,
+            handler_configdicts=handler_configdicts,
+            logger_configdicts=logger_configdicts,
+        )
+
+    ## Update filters, formatters, handlers, loggers in logging config
+    if filter_configdicts:
+        logging_config["filters"] = filter_configdicts
+    logging_config["formatters"] = formatter_configdicts
+    logging_config["handlers"] = handler_configdicts
+    logging_config["loggers"] = logger_configdicts
+
+    ## red_log's own settings, ignored by dictConfig()
+    for instrumentation in (metrics, profiling):
+        if instrumentation is not None:
+            logging_config.setdefault(RED_LOG_CONFIG_KEY, {}).update(instrumentation.get_configdict())
+
+    ## Return initialized, read-only logging config
+    return cache_configdict(cache_key, freeze(logging_config))
+
+
+def _get_level_filter_threshold(
+    name: str, filter_configdicts: LOGGING_CONFIG_DICT_TYPE
+) -> int | None:
+    """Return the level a filter is equivalent to, or `None` if it is not a level-only filter.
+
+    Params:
+        name (str): A filter name, from a handler's `filters`.
+        filter_configdicts (dict[str, dict[str, Any]]): The `filters` section of the config.
 
-    ## Update formatters, handlers, loggers in logging config copy
-    return_dict["formatters"] = formatter_configdicts
-    return_dict["handlers"] = handler_configdicts
-    return_dict["loggers"] = logger_configdicts
+    """
+    filter_dict: t.Any = filter_configdicts.get(name)
+    if filter_dict is None:
+        ## Level filters referenced by function name, without an entry in the `filters` section
+        for func, threshold in LEVEL_FILTER_THRESHOLDS.items():
+            if func.__name__ == name:
+                return threshold
+
+        return None
+
+    ## FilterConfig(func=...) compiles to {"()": <FilterConfig.get_filter>}
+    factory: t.Any = filter_dict.get("()") if isinstance(filter_dict, t.Mapping) else None
+    filter_config: t.Any = getattr(factory, "__self__", None)
+    if isinstance(filter_config, FilterConfig) and filter_config.func is not None:
+        return LEVEL_FILTER_THRESHOLDS.get(filter_config.func)
+
+    return None
+
+
+def _fold_level_filters(
+    filter_configdicts: LOGGING_CONFIG_DICT_TYPE,
+    handler_configdicts: LOGGING_CONFIG_DICT_TYPE,
+    logger_configdicts: LOGGING_CONFIG_DICT_TYPE,
+) -> None:
+    """Fold handlers' level-only filters into their `level`, and warn about filters that do wasted work.
+
+    A level filter passes records at or above its level, so a handler with level `L` and level filters
+    `T1, T2, ...` emits the same records with level `max(L, T1, T2, ...)` and no filters. Filters at or below
+    the handler's level (or below another of its level filters) never reject a record, and are reported as
+    redundant. A combined level above `CRITICAL` means the handler can never emit a record.
+
+    Level filters that are no longer referenced by a handler or logger are removed from the `filters` section.
+
+    Params:
+        filter_configdicts (dict[str, dict[str, Any]]): The `filters` section of the config. Updated in place.
+        handler_configdicts (dict[str, dict[str, Any]]): The `handlers` section of the config. Updated in place.
+        logger_configdicts (dict[str, dict[str, Any]]): The `loggers` section of the config.
+
+    """
+    folded_filters: set[str] = set()
+
+    for handler_name, handler_dict in list(handler_configdicts.items()):
+        filter_names: list[t.Any] = list(handler_dict.get("filters") or [])
+        if not filter_names:
+            continue
+
+        handler_level: int = level_to_int(handler_dict.get("level") or logging.NOTSET)
+        thresholds: dict[str, int] = {}
+        kept_filters: list[t.Any] = []
+
+        for filter_name in filter_names:
+            threshold: int | None = (
+                _get_level_filter_threshold(filter_name, filter_configdicts)
+                if isinstance(filter_name, str)
+                else LEVEL_FILTER_THRESHOLDS.get(filter_name)
+            )
+            if threshold is None:
+                kept_filters.append(filter_name)
+            else:
+                thresholds[f"{getattr(filter_name, '__name__', filter_name)}"] = threshold
+
+        if not thresholds:
+            continue
+
+        level: int = max(handler_level, *thresholds.values())
+        ## The filter that sets the level, if the handler's own level does not
+        binding_filter: str | None = (
+            None
+            if handler_level >= level
+            else next(name for name, threshold in thresholds.items() if threshold == level)
+        )
+        for filter_name in thresholds:
+            if filter_name != binding_filter:
+                log.warning(
+                    f"Filter '{filter_name}' on handler '{handler_name}' is redundant: it does not reject any "
+                    f"record that the handler's level or another level filter does not already reject."
+                )
+        if level > logging.CRITICAL:
+            log.warning(
+                f"Handler '{handler_name}' can never emit a record: its level and filters reject everything "
+                f"below {logging.getLevelName(level)}."
+            )
+
+        log.debug(
+            f"Folded level filters {list(thresholds)} into handler '{handler_name}' level "
+            f"{logging.getLevelName(level)}."
+        )
+        folded_filters.update(name for name in filter_names if isinstance(name, str))
+
+        new_handler_dict: dict[str, t.Any] = dict(handler_dict)
+        new_handler_dict["level"] = logging.getLevelName(level)
+        if kept_filters:
+            new_handler_dict["filters"] = kept_filters
+        else:
+            new_handler_dict.pop("filters", None)
+        handler_configdicts[handler_name] = new_handler_dict
+
+    ## Drop folded filters that nothing references anymore
+    still_referenced: set[t.Any] = {
+        filter_name
+        for config_dict in (*handler_configdicts.values(), *logger_configdicts.values())
+        for filter_name in (config_dict.get("filters") or [])
+        if isinstance(filter_name, str)
+    }
+    for filter_name in folded_filters - still_referenced:
+        if _get_level_filter_threshold(filter_name, filter_configdicts) is not None:
+            filter_configdicts.pop(filter_name, None)
+
+
+def _enqueue_blocking_handlers(
+    queue_listener: QueueListenerConfig,
+    root: dict[str, t.Any],
+    handler_configdicts: LOGGING_CONFIG_DICT_TYPE,
+    logger_configdicts: LOGGING_CONFIG_DICT_TYPE,
+) -> None:
+    """Route the root logger & loggers' blocking handlers through `ManagedQueueHandler`s.
+
+    Loggers that use the same set of blocking handlers share one queue handler. Loggers that use
+    different sets get their own queue handler (named `<queue_listener.name>_<n>`), so records are
+    still only written by the handlers their logger was configured with.
+
+    Params:
+        queue_listener (QueueListenerConfig): Settings for the queue handler(s) to create.
+        root (dict[str, Any]): The root logger's config dict. Updated in place.
+        handler_configdicts (dict[str, dict[str, Any]]): The `handlers` section of the config. Updated in place.
+        logger_configdicts (dict[str, dict[str, Any]]): The `loggers` section of the config. Updated in place.
+
+    """
+    blocking_handlers: set[str] = {
+        name
+        for name, handler_dict in handler_configdicts.items()
+        if handler_dict.get("class") in QUEUEABLE_HANDLER_CLASSES
+    }
+    if not blocking_handlers:
+        return
 
-    ## Return initialized logging config
-    return return_dict
+    ## Map each distinct set of blocking handlers to the name of its queue handler
+    queue_names: dict[tuple[str, ...], str] = {}
+
+    def _route(logger_dict: dict[str, t.Any]) -> dict[str, t.Any]:
+        logger_handlers: list[str] = list(logger_dict.get("handlers") or [])
+        moved: tuple[str, ...] = tuple(h for h in logger_handlers if h in blocking_handlers)
+        if not moved:
+            return logger_dict
+
+        if moved not in queue_names:
+            if not queue_names:
+                _listener = replace(queue_listener, handlers=list(moved))
+            else:
+                ## Only the first queue handler can use a queue object passed by the caller
+                _name: str = f"{queue_listener.name}_{len(queue_names)}"
+                _listener = replace(
+                    queue_listener,
+                    name=_name,
+                    queue=None,
+                    ## Each spill queue needs its own directory
+                    spill_dir=(
+                        str(Path(queue_listener.spill_dir) / _name)
+                        if queue_listener.spill_dir is not None
+                        else None
+                    ),
+                    handlers=list(moved),
+                )
+            queue_names[moved] = _listener.name
+
+            handler_configdicts.update(_listener.get_configdict())
+
+        ## Replace the moved handlers with the queue handler, keeping the handlers' order
+        routed_handlers: list[str] = []
+        for h in logger_handlers:
+            _h: str = queue_names[moved] if h in blocking_handlers else h
+            if _h not in routed_handlers:
+                routed_handlers.append(_h)
+
+        return {**logger_dict, "handlers": routed_handlers}
+
+    root.update(_route(root))
+    for logger_name, logger_dict in logger_configdicts.items():
+        ## Copy instead of updating, logger dicts may have been passed in by the caller
+        logger_configdicts[logger_name] = _route(logger_dict)
 
 
 def save_configdict(
@@ -0,0 +1,197 @@
+"""Cache compiled logging dictConfigs, so assembling the same config twice is a dict lookup."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import functools
+import hashlib
+import json
+import threading
+import typing as t
+
+from red_log.config_classes.base import BaseLoggingConfig, FrozenDict, freeze
+
+## Maximum number of compiled configs kept by assemble_configdict()
+CONFIGDICT_CACHE_MAXSIZE: int = 256
+
+_CONFIGDICT_CACHE: OrderedDict[t.Hashable, FrozenDict] = OrderedDict()
+_CONFIGDICT_CACHE_LOCK: threading.Lock = threading.Lock()
+
+## Config file path -> (mtime ns, size, SHA-256 of contents, compiled config), for load_configdict()
+_LOADED_CONFIGDICTS: dict[str, tuple[int, int, str, FrozenDict]] = {}
+
+_KEY_SCALAR_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+## __hash__ of every config class, which caches the hash on the (frozen) config object
+_CONFIG_HASH: t.Callable[[t.Any], int] = BaseLoggingConfig.__hash__
+
+
+class _CacheKey:
+    """The frozen inputs of a config compilation, hashed once for the lookup and the LRU update."""
+
+    __slots__ = ("parts", "_hash")
+
+    def __init__(self, parts: tuple) -> None:
+        self.parts = parts
+        self._hash: int = hash(parts)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CacheKey) and self.parts == other.parts
+
+
+def _freeze_key_part(value: t.Any) -> t.Any:
+    """`freeze()` an input, without descending into the config objects in lists of them."""
+    value_type: type = type(value)
+    if value_type in _KEY_SCALAR_TYPES or value_type.__hash__ is _CONFIG_HASH:
+        return value
+    if value_type is list or value_type is tuple:
+        ## Checked by type, isinstance() of an ABC subclass is slower than freezing
+        return tuple(
+            [v if type(v).__hash__ is _CONFIG_HASH else freeze(v) for v in value]
+        )
+
+    return freeze(value)
+
+
+def make_cache_key(*parts: t.Any) -> t.Hashable | None:
+    """Build a cache key from the inputs to a config compilation.
+
+    Config objects are frozen and cache their hash, so they are used in the key as they are, and a
+    lookup with the same config objects does not freeze or hash them again.
+
+    Params:
+        parts (Any): The inputs, i.e. the arguments passed to `assemble_configdict()`.
+
+    Returns:
+        (Hashable | None): A hashable, frozen copy of `parts`, or `None` if an input cannot be hashed
+            (in which case the result should not be cached).
+
+    """
+    try:
+        return _CacheKey(tuple([_freeze_key_part(part) for part in parts]))
+    except TypeError:
+        return None
+
+
+def get_cached_configdict(key: t.Hashable | None) -> FrozenDict | None:
+    """Return the compiled config stored under `key`, or `None` on a cache miss."""
+    if key is None:
+        return None
+
+    with _CONFIGDICT_CACHE_LOCK:
+        configdict: FrozenDict | None = _CONFIGDICT_CACHE.get(key)
+        if configdict is not None:
+            _CONFIGDICT_CACHE.move_to_end(key)
+
+    return configdict
+
+
+def cache_configdict(key: t.Hashable | None, configdict: FrozenDict) -> FrozenDict:
+    """Store a compiled config under `key`, evicting the least recently used entry if the cache is full.
+
+    Returns:
+        (FrozenDict): The cached config. If another thread cached the same key first, its config is
+            returned so all callers share one object.
+
+    """
+    if key is None:
+        return configdict
+
+    with _CONFIGDICT_CACHE_LOCK:
+        configdict = _CONFIGDICT_CACHE.setdefault(key, configdict)
+        _CONFIGDICT_CACHE.move_to_end(key)
+
+        while len(_CONFIGDICT_CACHE) > CONFIGDICT_CACHE_MAXSIZE:
+            _CONFIGDICT_CACHE.popitem(last=False)
+
+    return configdict
+
+
+def get_loaded_configdict(
+    path: str, mtime_ns: int, size: int, digest: str | None = None
+) -> FrozenDict | None:
+    """Return the config compiled from the file at `path`, or `None` if the file changed since.
+
+    The file is unchanged if its mtime and size are the same, or (when `digest` is given) if its
+    contents hash the same.
+    """
+    with _CONFIGDICT_CACHE_LOCK:
+        entry: tuple[int, int, str, FrozenDict] | None = _LOADED_CONFIGDICTS.get(path)
+        if entry is None:
+            return None
+
+        cached_mtime_ns, cached_size, cached_digest, configdict = entry
+        if (cached_mtime_ns, cached_size) == (mtime_ns, size):
+            return configdict
+        if digest is not None and digest == cached_digest:
+            ## Touched, but not changed
+            _LOADED_CONFIGDICTS[path] = (mtime_ns, size, digest, configdict)
+
+            return configdict
+
+    return None
+
+
+def cache_loaded_configdict(
+    path: str, mtime_ns: int, size: int, digest: str, configdict: FrozenDict
+) -> None:
+    """Store the config compiled from the file at `path`, with the file's mtime, size, and SHA-256."""
+    with _CONFIGDICT_CACHE_LOCK:
+        _LOADED_CONFIGDICTS[path] = (mtime_ns, size, digest, configdict)
+
+
+def clear_configdict_cache() -> None:
+    """Empty the compiled config cache, including configs loaded from files."""
+    with _CONFIGDICT_CACHE_LOCK:
+        _CONFIGDICT_CACHE.clear()
+        _LOADED_CONFIGDICTS.clear()
+
+    _compile_hashable_config.cache_clear()
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_hashable_config(config: BaseLoggingConfig) -> FrozenDict:
+    return freeze(config.get_configdict())
+
+
+def compile_config(config: BaseLoggingConfig) -> FrozenDict:
+    """Return a config object's `.get_configdict()` as a `FrozenDict`.
+
+    Results are memoized per (equal) config object, so configs built from the same formatter,
+    handler, or logger config share a single dict for it.
+
+    Params:
+        config (BaseLoggingConfig): A formatter, handler, logger, or filter config object.
+
+    Returns:
+        (FrozenDict): The config object's dict representation.
+
+    """
+    try:
+        hash(config)
+    except TypeError:
+        return freeze(config.get_configdict())
+
+    return _compile_hashable_config(config)
+
+
+def config_fingerprint(configdict: t.Mapping[str, t.Any]) -> str:
+    """Return a stable SHA-256 hex digest of a logging config dict's contents.
+
+    Lists and tuples produce the same fingerprint, as do dicts with the same items in a different
+    order. Objects that are not JSON serializable (i.e. a `queue.Queue`) are included by their `repr()`.
+
+    Params:
+        configdict (Mapping[str, Any]): A logging dictConfig, or a section of one.
+
+    Returns:
+        (str): The fingerprint.
+
+    """
+    canonical: str = json.dumps(
+        configdict, sort_keys=True, default=repr, separators=(",", ":")
+    )
+
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,462 @@
+"""Load logging dictConfigs from JSON, TOML, or YAML files into red_log's config classes."""
+
+from __future__ import annotations
+
+import dataclasses
+import difflib
+import hashlib
+import inspect
+import json
+import logging
+import logging.config
+import os
+from pathlib import Path
+import tempfile
+import typing as t
+
+from red_log.config_classes.base import FrozenDict, freeze
+from red_log.config_classes.formatters import FormatterConfig, JsonFormatterConfig
+from red_log.config_classes.instrumentation import (
+    RED_LOG_CONFIG_KEY,
+    MetricsConfig,
+    ProfilingConfig,
+)
+from red_log.config_classes.loggers import LoggerConfig
+from red_log.config_classes.types import HANDLER_CLASSES_TYPE
+
+from .__methods import assemble_configdict
+from ._configdict_cache import cache_loaded_configdict, get_loaded_configdict
+from ._configdict_validation import ConfigValidationError, get_configdict_errors
+
+log = logging.getLogger("red_log.helpers")
+
+## File suffix -> config file format
+CONFIG_FILE_FORMATS: dict[str, str] = {
+    ".json": "json",
+    ".toml": "toml",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+
+## Bump when the compiled output of load_configdict() changes, to invalidate disk cache entries
+_DISK_CACHE_VERSION: int = 2
+
+## Keys dictConfig() reads from each section of a config
+_TOP_LEVEL_KEYS: tuple[str, ...] = (
+    "version",
+    "disable_existing_loggers",
+    "propagate",
+    "root",
+    "formatters",
+    "filters",
+    "handlers",
+    "loggers",
+    RED_LOG_CONFIG_KEY,
+)
+_FORMATTER_KEYS: tuple[str, ...] = ("format", "datefmt", "style", "validate", "class", "defaults", "()")
+_LOGGER_KEYS: tuple[str, ...] = ("level", "handlers", "propagate", "filters")
+_INSTRUMENTATION_CLASSES: dict[str, type] = {"metrics": MetricsConfig, "profiling": ProfilingConfig}
+
+
+def _get_handler_config_classes() -> dict[str, type]:
+    """Return a map of handler class path (`class` or `()`) -> the config class that describes it."""
+    classes: dict[str, type] = {}
+    for config_class in t.get_args(HANDLER_CLASSES_TYPE):
+        classes[config_class().get_handler_class()] = config_class
+
+    return classes
+
+
+def _get_required_args(handler_class: str) -> list[str]:
+    """Return the arguments a handler class's constructor has no default for."""
+    try:
+        parameters = inspect.signature(logging.config.BaseConfigurator({}).resolve(handler_class)).parameters
+    except (ValueError, TypeError):
+        return []
+
+    return [
+        param.name
+        for param in parameters.values()
+        if param.default is param.empty and param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+    ]
+
+
+def _unknown_key_error(section: str, key: str, valid_keys: t.Iterable[str]) -> str:
+    suggestion: list[str] = difflib.get_close_matches(key, list(valid_keys), n=1)
+    hint: str = f" Did you mean '{suggestion[0]}'?" if suggestion else ""
+
+    return f"{section}: unknown key '{key}'.{hint}"
+
+
+def _check_keys(
+    section: str, raw: t.Mapping[str, t.Any], valid_keys: t.Iterable[str], errors: list[str]
+) -> bool:
+    """Add an error for each key of `raw` not in `valid_keys`. Returns `True` if there were none."""
+    valid_keys = tuple(valid_keys)
+    unknown: list[str] = [key for key in raw if key not in valid_keys]
+    for key in unknown:
+        errors.append(_unknown_key_error(section, key, valid_keys))
+
+    return not unknown
+
+
+def _build(section: str, config_class: type, kwargs: dict[str, t.Any], errors: list[str]) -> t.Any:
+    """Create a config class, adding its validation error (if any) to `errors`."""
+    try:
+        return config_class(**kwargs)
+    except (TypeError, ValueError) as exc:
+        errors.append(f"{section}: {exc}")
+
+        return None
+
+
+def _load_formatter(name: str, raw: t.Mapping[str, t.Any], errors: list[str]) -> t.Any:
+    section: str = f"formatters.{name}"
+    factory: t.Any = raw.get("()")
+
+    if factory == JsonFormatterConfig(name=name).get_formatter_class():
+        valid_keys = ("()", *(f.name for f in dataclasses.fields(JsonFormatterConfig) if f.name != "name"))
+        if not _check_keys(section, raw, valid_keys, errors):
+            return None
+
+        kwargs: dict[str, t.Any] = {k: v for k, v in raw.items() if k != "()"}
+        kwargs.setdefault("datefmt", None)
+
+        return _build(section, JsonFormatterConfig, {"name": name, **kwargs}, errors)
+
+    if not _check_keys(section, raw, _FORMATTER_KEYS, errors):
+        return None
+    if factory is not None or "defaults" in raw:
+        ## Not expressible as a FormatterConfig
+        return {name: dict(raw)}
+
+    return _build(
+        section,
+        FormatterConfig,
+        {
+            "name": name,
+            ## Same defaults as logging.Formatter
+            "fmt": raw.get("format"),
+            "datefmt": raw.get("datefmt"),
+            "style": raw.get("style", "%"),
+            "validate": raw.get("validate", True),
+            "formatter_class": raw.get("class"),
+        },
+        errors,
+    )
+
+
+def _load_handler(
+    name: str, raw: t.Mapping[str, t.Any], config_classes: dict[str, type], errors: list[str]
+) -> t.Any:
+    section: str = f"handlers.{name}"
+    class_key: str = "()" if "()" in raw else "class"
+    config_class: type | None = config_classes.get(raw.get(class_key))
+
+    if config_class is None:
+        if "class" not in raw and "()" not in raw:
+            errors.append(f"{section}: missing 'class' (or '()').")
+
+            return None
+
+        ## A handler red_log has no config class for, dictConfig() checks its arguments
+        return {name: dict(raw)}
+
+    valid_keys = (class_key, *(f.name for f in dataclasses.fields(config_class) if f.name != "name"))
+    if not _check_keys(section, raw, valid_keys, errors):
+        return None
+
+    missing: list[str] = [arg for arg in _get_required_args(raw[class_key]) if arg not in raw]
+    for arg in missing:
+        errors.append(f"{section}: missing required argument '{arg}'.")
+
+    handler_config: t.Any = _build(
+        section, config_class, {"name": name, **{k: v for k, v in raw.items() if k != class_key}}, errors
+    )
+    if handler_config is None or missing:
+        return None
+
+    ## Only the keys the file sets, so arguments it leaves out take the handler class's defaults (not the
+    #  config class's, i.e. StreamHandlerConfig writes to stdout, logging.StreamHandler to stderr)
+    handler_dict: dict[str, t.Any] = handler_config.get_configdict()[name]
+
+    return {name: {k: v for k, v in handler_dict.items() if k == class_key or k in raw}}
+
+
+def _load_logger(name: str, raw: t.Mapping[str, t.Any], errors: list[str]) -> t.Any:
+    section: str = f"loggers.{name}"
+    if not _check_keys(section, raw, _LOGGER_KEYS, errors):
+        return None
+    if "level" not in raw or "filters" in raw:
+        ## Not expressible as a LoggerConfig
+        return {name: dict(raw)}
+
+    return _build(
+        section,
+        LoggerConfig,
+        {
+            "name": name,
+            "level": raw["level"],
+            "handlers": list(raw.get("handlers", [])),
+            ## dictConfig() leaves propagate on when it is not set
+            "propagate": raw.get("propagate", True),
+        },
+        errors,
+    )
+
+
+def _get_section(
+    raw: t.Mapping[str, t.Any], key: str, errors: list[str]
+) -> t.Mapping[str, t.Any]:
+    section: t.Any = raw.get(key) or {}
+    if not isinstance(section, t.Mapping):
+        errors.append(f"{key}: must be a mapping, not {type(section).__name__}.")
+
+        return {}
+
+    return section
+
+
+def compile_raw_configdict(raw: t.Mapping[str, t.Any], source: str = "<config>") -> FrozenDict:
+    """Convert a parsed logging dictConfig to red_log config classes, validate them, and assemble them.
+
+    Formatters, handlers, and loggers red_log has a config class for are created from those classes (so
+    their validation runs), keys that `dictConfig()` would not understand are reported with the closest
+    valid key, and the config is checked with `validate_configdict()`. Handlers only get the arguments the
+    config sets, so the ones it leaves out take the handler class's defaults (i.e. a `logging.StreamHandler`
+    without a `stream` writes to stderr), and arguments the handler class requires are reported when missing.
+    Sections red_log has no class for (filters, handlers with other classes) are kept as they are.
+
+    Params:
+        raw (Mapping[str, Any]): The parsed config.
+        source (str): Where the config came from, for error messages.
+
+    Returns:
+        (FrozenDict): The compiled config, from `assemble_configdict()`.
+
+    Raises:
+        ConfigValidationError: When the config is invalid. `errors` lists every error found.
+
+    """
+    errors: list[str] = []
+
+    if not isinstance(raw, t.Mapping):
+        raise ConfigValidationError([f"config: must be a mapping, not {type(raw).__name__}."], source=source)
+
+    _check_keys("config", raw, _TOP_LEVEL_KEYS, errors)
+
+    formatters: list[t.Any] = [
+        _load_formatter(name, formatter, errors)
+        for name, formatter in _get_section(raw, "formatters", errors).items()
+    ]
+
+    handler_config_classes: dict[str, type] = _get_handler_config_classes()
+    handlers: list[t.Any] = [
+        _load_handler(name, handler, handler_config_classes, errors)
+        for name, handler in _get_section(raw, "handlers", errors).items()
+    ]
+
+    loggers: list[t.Any] = [
+        _load_logger(name, logger_dict, errors)
+        for name, logger_dict in _get_section(raw, "loggers", errors).items()
+    ]
+
+    filters: list[t.Any] = [
+        {name: dict(filter_dict)} for name, filter_dict in _get_section(raw, "filters", errors).items()
+    ]
+
+    root: t.Mapping[str, t.Any] = _get_section(raw, "root", errors)
+    _check_keys("root", root, _LOGGER_KEYS, errors)
+
+    instrumentation: dict[str, t.Any] = {}
+    red_log_settings: t.Mapping[str, t.Any] = _get_section(raw, RED_LOG_CONFIG_KEY, errors)
+    _check_keys(RED_LOG_CONFIG_KEY, red_log_settings, _INSTRUMENTATION_CLASSES, errors)
+    for key, config_class in _INSTRUMENTATION_CLASSES.items():
+        if key in red_log_settings:
+            instrumentation[key] = _build(
+                f"{RED_LOG_CONFIG_KEY}.{key}", config_class, dict(red_log_settings[key]), errors
+            )
+
+    ## Cross-references, levels, and format strings, checked on the config as written
+    errors.extend(get_configdict_errors(raw))
+    if errors:
+        ## The same mistake can be found by both passes (i.e. `fmt`)
+        raise ConfigValidationError(list(dict.fromkeys(errors)), source=source)
+
+    return assemble_configdict(
+        disable_existing_loggers=raw.get("disable_existing_loggers", False),
+        propagate=raw.get("propagate", False),
+        root_handlers=list(root.get("handlers", [])),
+        ## The root logger's default level
+        root_level=root.get("level", "WARNING"),
+        formatters=formatters,
+        handlers=handlers,
+        loggers=loggers,
+        filters=filters,
+        use_cache=False,
+        **instrumentation,
+    )
+
+
+def _parse_config_file(path: Path, data: bytes) -> t.Any:
+    """Parse a config file's contents, by the file's suffix."""
+    file_format: str | None = CONFIG_FILE_FORMATS.get(path.suffix.lower())
+
+    if file_format == "json":
+        return json.loads(data)
+
+    if file_format == "toml":
+        import tomllib
+
+        return tomllib.loads(data.decode("utf-8"))
+
+    if file_format == "yaml":
+        try:
+            import yaml
+        except ImportError as exc:
+            raise ImportError(
+                f"Loading YAML logging config '{path}' requires PyYAML (pip install pyyaml)."
+            ) from exc
+
+        return yaml.safe_load(data)
+
+    raise ValueError(
+        f"Unsupported logging config file type '{path.suffix}', must be one of {list(CONFIG_FILE_FORMATS)}."
+    )
+
+
+def _get_disk_cache_path(cache_dir: Path, path: str) -> Path:
+    key: str = hashlib.sha256(f"{_DISK_CACHE_VERSION}\0{path}".encode("utf-8")).hexdigest()
+
+    return cache_dir / f"{key}.json"
+
+
+def _read_disk_cache(cache_file: Path) -> dict[str, t.Any] | None:
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            entry: dict[str, t.Any] = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    return entry if entry.get("version") == _DISK_CACHE_VERSION else None
+
+
+def _write_disk_cache(cache_file: Path, entry: dict[str, t.Any]) -> None:
+    """Write a disk cache entry atomically. Errors are logged, the cache is only an optimization."""
+    try:
+        text: str = json.dumps(entry)
+    except (TypeError, ValueError) as exc:
+        log.debug(f"Not caching logging config '{entry['path']}', it is not JSON serializable. Details: {exc}")
+
+        return
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=f".{cache_file.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    except OSError as exc:
+        log.warning(f"Could not write logging config cache file '{cache_file}'. Details: {exc}")
+
+
+def load_configdict(
+    path: t.Union[str, Path],
+    cache_dir: t.Union[str, Path] | None = None,
+    use_cache: bool = True,
+) -> FrozenDict:
+    """Load a logging dictConfig from a JSON, TOML, or YAML file.
+
+    The file is parsed, converted to red_log's config classes and validated (see
+    `compile_raw_configdict()`), and assembled with `assemble_configdict()`. YAML files need PyYAML.
+
+    Compiled configs are cached per file path, with the file's mtime, size, and SHA-256. Loading an
+    unchanged file again (same mtime and size) returns the cached config without reading it, and a file
+    that was only touched is read and hashed, but not parsed again. When `cache_dir` is set, the compiled
+    config is also cached in a JSON file in that directory, so other processes (i.e. short-lived workers)
+    loading the same file skip parsing and validating it.
+
+    Params:
+        path (str | Path): The config file. Its type is detected from its suffix (`.json`, `.toml`, `.yaml`, `.yml`).
+        cache_dir (str | Path | None): Directory for the cross-process cache. Created if it does not exist.
+        use_cache (bool): When `False`, always parse the file (results are still cached).
+
+    Returns:
+        (FrozenDict): The compiled config, which can be passed to `red_log.runtime.apply_configdict()` or
+            `logging.config.dictConfig()`.
+
+    Raises:
+        FileNotFoundError: When the file does not exist.
+        ValueError: When the file cannot be parsed.
+        ConfigValidationError: When the config is invalid (a `ValueError`).
+
+    """
+    config_path = Path(f"{path}").expanduser().resolve()
+    key: str = str(config_path)
+
+    stat: os.stat_result = config_path.stat()
+    if use_cache:
+        configdict: FrozenDict | None = get_loaded_configdict(key, stat.st_mtime_ns, stat.st_size)
+        if configdict is not None:
+            return configdict
+
+    cache_file: Path | None = None
+    entry: dict[str, t.Any] | None = None
+    if cache_dir is not None:
+        cache_file = _get_disk_cache_path(Path(f"{cache_dir}").expanduser(), key)
+        entry = _read_disk_cache(cache_file) if use_cache else None
+
+        if entry is not None and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+            configdict = freeze(entry["config"])
+            cache_loaded_configdict(key, stat.st_mtime_ns, stat.st_size, entry["sha256"], configdict)
+
+            return configdict
+
+    data: bytes = config_path.read_bytes()
+    digest: str = hashlib.sha256(data).hexdigest()
+
+    if use_cache:
+        configdict = get_loaded_configdict(key, stat.st_mtime_ns, stat.st_size, digest)
+        if configdict is None and entry is not None and entry["sha256"] == digest:
+            configdict = freeze(entry["config"])
+
+        if configdict is not None:
+            cache_loaded_configdict(key, stat.st_mtime_ns, stat.st_size, digest, configdict)
+            if cache_file is not None and entry is not None:
+                _write_disk_cache(cache_file, {**entry, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+
+            return configdict
+
+    try:
+        raw: t.Any = _parse_config_file(config_path, data)
+    except (ValueError, UnicodeDecodeError) as exc:
+        ## json.JSONDecodeError and tomllib.TOMLDecodeError are ValueErrors
+        raise ValueError(f"Could not parse logging config file '{config_path}'. Details: {exc}") from exc
+    except ImportError:
+        raise
+    except Exception as exc:
+        ## i.e. yaml.YAMLError
+        raise ValueError(f"Could not parse logging config file '{config_path}'. Details: {exc}") from exc
+
+    configdict = compile_raw_configdict(raw, source=f"'{config_path}'")
+
+    cache_loaded_configdict(key, stat.st_mtime_ns, stat.st_size, digest, configdict)
+    if cache_file is not None:
+        _write_disk_cache(
+            cache_file,
+            {
+                "version": _DISK_CACHE_VERSION,
+                "path": key,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": digest,
+                "config": configdict,
+            },
+        )
+
+    return configdict
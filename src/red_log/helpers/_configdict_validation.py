@@ -0,0 +1,299 @@
+"""Validate a logging dictConfig before it is applied, reporting every error at once."""
+
+from __future__ import annotations
+
+import difflib
+import functools
+import logging
+import re
+import string
+import typing as t
+
+## Attributes every LogRecord has, plus the ones logging.Formatter.format() adds
+LOG_RECORD_ATTRIBUTES: frozenset[str] = frozenset(
+    logging.LogRecord("", logging.NOTSET, "", 0, "", (), None).__dict__
+) | frozenset({"message", "asctime", "taskName"})
+
+## Formatter classes whose `format` option is a format string for logging.Formatter's styles
+_FORMAT_STRING_CLASSES: frozenset[str | None] = frozenset(
+    {None, "logging.Formatter", "red_log.formatters.CompiledFormatter"}
+)
+_JSON_FORMATTER_CLASS: str = "red_log.formatters.JsonFormatter"
+## Handler config keys that reference other handlers by name
+_HANDLER_REFERENCE_KEYS: tuple[str, ...] = ("handlers", "target")
+
+## Placeholders of each format style, same as logging.PercentStyle/StrFormatStyle/StringTemplateStyle
+_PERCENT_FIELD_RE: re.Pattern = re.compile(r"%\((\w+)\)", re.I)
+_STR_FORMATTER: string.Formatter = string.Formatter()
+
+
+class ConfigValidationError(ValueError):
+    """A logging config is invalid.
+
+    Params:
+        errors (list[str]): Every error found, as `section.name: message`.
+    """
+
+    def __init__(self, errors: list[str], source: str = "") -> None:
+        self.errors: list[str] = list(errors)
+        source = f" {source}" if source else ""
+
+        super().__init__(
+            f"Invalid logging config{source} ({len(self.errors)} error(s)):\n"
+            + "\n".join(f"  - {error}" for error in self.errors)
+        )
+
+
+def _suggest(name: str, candidates: t.Iterable[str]) -> str:
+    match: list[str] = difflib.get_close_matches(name, list(candidates), n=1)
+
+    return f" Did you mean '{match[0]}'?" if match else ""
+
+
+@functools.lru_cache(maxsize=1024)
+def _suggest_attribute(field_name: str) -> str:
+    """`_suggest()` a LogRecord attribute. Cached, custom fields are checked on every apply."""
+    return _suggest(field_name, LOG_RECORD_ATTRIBUTES)
+
+
+def _get_format_fields(fmt: str, style: str) -> list[str]:
+    """Return the record attributes a format string uses."""
+    if style == "%":
+        return _PERCENT_FIELD_RE.findall(fmt)
+
+    if style == "{":
+        fields: list[str] = []
+        for _, field_name, _, _ in _STR_FORMATTER.parse(fmt):
+            if field_name:
+                ## `{exc_info[0]}`, `{created.real}` use the `exc_info`/`created` attributes
+                fields.append(re.split(r"[.\[]", field_name, maxsplit=1)[0])
+
+        return fields
+
+    return [
+        match.group("named") or match.group("braced")
+        for match in string.Template.pattern.finditer(fmt)
+        if match.group("named") or match.group("braced")
+    ]
+
+
+class _Validator:
+    """Check a config in one pass over its sections, looking names up in its own sections."""
+
+    def __init__(self, config: t.Mapping[str, t.Any], extra_fields: t.Iterable[str]) -> None:
+        self.config = config
+        self.extra_fields: frozenset[str] = frozenset(extra_fields)
+        self.errors: list[str] = []
+
+        self.formatters: t.Mapping[str, t.Any] = self._get_section("formatters")
+        self.filters: t.Mapping[str, t.Any] = self._get_section("filters")
+        self.handlers: t.Mapping[str, t.Any] = self._get_section("handlers")
+        self.loggers: t.Mapping[str, t.Any] = self._get_section("loggers")
+        self.level_names: t.Mapping[str, int] = logging.getLevelNamesMapping()
+
+    def _get_section(self, key: str) -> t.Mapping[str, t.Any]:
+        section: t.Any = self.config.get(key)
+        if section is None:
+            return {}
+        if not isinstance(section, t.Mapping):
+            self.errors.append(f"{key}: must be a mapping, not {type(section).__name__}.")
+
+            return {}
+
+        return section
+
+    def _check_level(self, where: str, level: t.Any) -> None:
+        if level is None or (isinstance(level, int) and not isinstance(level, bool)):
+            return
+
+        if not isinstance(level, str):
+            self.errors.append(f"{where}: level must be a level name or number, not {type(level).__name__}.")
+        elif level not in self.level_names:
+            ## dictConfig() does not change the case of level names
+            hint: str = (
+                f" Did you mean '{level.upper()}'?"
+                if level.upper() in self.level_names
+                else _suggest(level.upper(), self.level_names)
+            )
+            self.errors.append(f"{where}: unknown level '{level}'.{hint}")
+
+    def _check_names(
+        self, where: str, key: str, names: t.Any, section_name: str, section: t.Mapping[str, t.Any]
+    ) -> list[str]:
+        """Check that `names` is a list of names defined in `section`."""
+        if names is None:
+            return []
+        if isinstance(names, str) or not isinstance(names, t.Iterable):
+            self.errors.append(f"{where}: {key} must be a list of names, not {type(names).__name__}.")
+
+            return []
+
+        names = list(names)
+        for name in names:
+            ## Python 3.12+ dictConfig() also accepts filter objects
+            if isinstance(name, str) and name not in section:
+                self.errors.append(
+                    f"{where}: {key} references unknown {section_name} '{name}'.{_suggest(name, section)}"
+                )
+
+        return names
+
+    def _check_fields(self, where: str, fields: t.Iterable[str], defaults: t.Container[str]) -> None:
+        """Report format fields that look like misspelled LogRecord attributes.
+
+        Other unknown fields are allowed, they can be added by filters or `extra=`.
+        """
+        for field_name in fields:
+            if field_name in LOG_RECORD_ATTRIBUTES or field_name in self.extra_fields or field_name in defaults:
+                continue
+
+            hint: str = _suggest_attribute(field_name)
+            if hint:
+                self.errors.append(f"{where}: unknown LogRecord attribute '{field_name}'.{hint}")
+
+    def check_formatter(self, name: str, formatter: t.Any) -> None:
+        where: str = f"formatters.{name}"
+        if not isinstance(formatter, t.Mapping):
+            self.errors.append(f"{where}: must be a mapping, not {type(formatter).__name__}.")
+
+            return
+
+        factory: t.Any = formatter.get("()")
+        if factory == _JSON_FORMATTER_CLASS:
+            self._check_fields(where, formatter.get("fields") or (), ())
+
+            return
+        if factory is not None or formatter.get("class") not in _FORMAT_STRING_CLASSES:
+            ## A custom formatter, its options are its own
+            return
+
+        if "fmt" in formatter:
+            self.errors.append(f"{where}: unknown key 'fmt'. Did you mean 'format'?")
+
+        style: t.Any = formatter.get("style", "%")
+        if style not in logging._STYLES:
+            self.errors.append(f"{where}: style must be one of {list(logging._STYLES)}, not {style!r}.")
+
+            return
+
+        fmt: t.Any = formatter.get("format")
+        if fmt is None:
+            return
+        if not isinstance(fmt, str):
+            self.errors.append(f"{where}: format must be a string, not {type(fmt).__name__}.")
+
+            return
+
+        if formatter.get("validate", True):
+            try:
+                logging._STYLES[style][0](fmt).validate()
+            except ValueError as exc:
+                self.errors.append(f"{where}: invalid format. Details: {exc}")
+
+                return
+
+        self._check_fields(where, _get_format_fields(fmt, style), formatter.get("defaults") or ())
+
+    def check_handler(self, name: str, handler: t.Any) -> None:
+        where: str = f"handlers.{name}"
+        if not isinstance(handler, t.Mapping):
+            self.errors.append(f"{where}: must be a mapping, not {type(handler).__name__}.")
+
+            return
+
+        if "class" not in handler and "()" not in handler:
+            self.errors.append(f"{where}: missing 'class' (or '()').")
+
+        self._check_level(where, handler.get("level"))
+
+        formatter: t.Any = handler.get("formatter")
+        if formatter is not None and formatter not in self.formatters:
+            self.errors.append(
+                f"{where}: formatter references unknown formatter '{formatter}'.{_suggest(f'{formatter}', self.formatters)}"
+            )
+
+        self._check_names(where, "filters", handler.get("filters"), "filter", self.filters)
+
+        for key in _HANDLER_REFERENCE_KEYS:
+            references: t.Any = handler.get(key)
+            if references is None:
+                continue
+
+            if key == "target" and isinstance(references, str):
+                references = [references]
+            for reference in self._check_names(where, key, references, "handler", self.handlers):
+                if reference == name:
+                    self.errors.append(f"{where}: {key} references the handler itself.")
+
+    def check_logger(self, where: str, logger_dict: t.Any) -> None:
+        if not isinstance(logger_dict, t.Mapping):
+            self.errors.append(f"{where}: must be a mapping, not {type(logger_dict).__name__}.")
+
+            return
+
+        self._check_level(where, logger_dict.get("level"))
+        self._check_names(where, "handlers", logger_dict.get("handlers"), "handler", self.handlers)
+        self._check_names(where, "filters", logger_dict.get("filters"), "filter", self.filters)
+
+    def validate(self) -> list[str]:
+        if self.config.get("version") != 1:
+            self.errors.append(f"version: must be 1, not {self.config.get('version')!r}.")
+
+        for name, formatter in self.formatters.items():
+            self.check_formatter(name, formatter)
+        for name, handler in self.handlers.items():
+            self.check_handler(name, handler)
+
+        root: t.Any = self.config.get("root")
+        if root is not None:
+            self.check_logger("root", root)
+        for name, logger_dict in self.loggers.items():
+            self.check_logger(f"loggers.{name}", logger_dict)
+
+        return self.errors
+
+
+def get_configdict_errors(
+    config: t.Mapping[str, t.Any], extra_fields: t.Iterable[str] = ()
+) -> list[str]:
+    """Return every error `validate_configdict()` finds in a logging config, without raising."""
+    if not isinstance(config, t.Mapping):
+        return [f"config: must be a mapping, not {type(config).__name__}."]
+
+    return _Validator(config, extra_fields).validate()
+
+
+def validate_configdict(
+    config: t.Mapping[str, t.Any], extra_fields: t.Iterable[str] = (), source: str = ""
+) -> None:
+    """Check a logging dictConfig (i.e. from `assemble_configdict()`) before it is applied.
+
+    `logging.config.dictConfig()` closes the existing handlers before it finds most mistakes, so an
+    invalid config leaves logging half configured. This checks the whole config first, and reports
+    every error at once:
+
+    - Handlers, loggers, and the root logger only reference formatters, filters, and handlers that exist
+      in the config (including `handlers`/`target` of queue and memory handlers).
+    - Levels are registered level names (dictConfig does not upper-case them) or numbers.
+    - Format strings are valid for their style, and use LogRecord attributes. Fields that look like a
+      misspelled attribute (`astime`, `funcname`) are errors; other unknown fields are assumed to be
+      added by filters or `extra=`.
+    - Formatters do not use `fmt` (the config key is `format`).
+
+    Incremental configs (`"incremental": True`) only change levels, and are not checked.
+
+    Params:
+        config (Mapping[str, Any]): The logging config.
+        extra_fields (Iterable[str]): Custom record attributes to accept in format strings.
+        source (str): Where the config came from, for the error message.
+
+    Raises:
+        ConfigValidationError: When the config is invalid. `errors` lists every error found.
+
+    """
+    if isinstance(config, t.Mapping) and config.get("incremental"):
+        return
+
+    errors: list[str] = get_configdict_errors(config, extra_fields=extra_fields)
+    if errors:
+        raise ConfigValidationError(errors, source=source)
@@ -0,0 +1,39 @@
+"""Opt-in runtime metrics for logging handlers.
+
+Instrumented handlers count the records they emit and filter (per logger), the errors they report, and
+the bytes they format, and time each `handle()` call into a latency histogram. Read the metrics with
+`get_metrics_snapshot()`, or write them in the Prometheus text format with `write_prometheus()`.
+
+Handlers can be instrumented directly with `instrument_handler()`, or for every handler in a config by
+passing a `red_log.config_classes.MetricsConfig` to `assemble_configdict()` and applying the config with
+`red_log.runtime.apply_configdict()`.
+
+The profiler samples the records handled by handlers and attributes their cost (time spent in `handle()`
+and `format()`, bytes formatted) to the log statement (logger, `pathname:lineno`) that created them.
+Start it with `start_profiling()` (or `assemble_configdict(profiling=ProfilingConfig(...))`), and read
+the most expensive statements with `get_profile_report()` or `format_profile_report()`.
+"""
+
+from __future__ import annotations
+
+from ._configure import configure_metrics
+from ._profiling import (
+    PROFILE_SORT_KEYS,
+    CallSiteProfile,
+    configure_profiling,
+    format_profile_report,
+    get_profile_report,
+    reset_profiling,
+    start_profiling,
+    stop_profiling,
+)
+from ._prometheus import PrometheusFileExporter, render_prometheus, write_prometheus
+from ._registry import (
+    DEFAULT_LATENCY_BUCKETS,
+    HandlerMetricsSnapshot,
+    LatencyHistogram,
+    get_metrics_snapshot,
+    instrument_handler,
+    reset_metrics,
+    uninstrument_handler,
+)
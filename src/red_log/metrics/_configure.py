@@ -0,0 +1,85 @@
+"""Turn metrics collection on/off from the `red_log` section of a logging config."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import typing as t
+
+from ._prometheus import PrometheusFileExporter
+from ._registry import (
+    _METRICS,
+    _METRICS_LOCK,
+    DEFAULT_LATENCY_BUCKETS,
+    instrument_handler,
+    uninstrument_handler,
+)
+
+log = logging.getLogger("red_log.metrics")
+
+_EXPORTER: PrometheusFileExporter | None = None
+_EXPORTER_LOCK: threading.Lock = threading.Lock()
+## Handlers instrumented by configure_metrics() (not by hand with instrument_handler()), by name
+_CONFIGURED: dict[str, logging.Handler] = {}
+
+
+def configure_metrics(
+    settings: t.Mapping[str, t.Any] | None, handlers: t.Mapping[str, logging.Handler]
+) -> None:
+    """Instrument handlers, and start/stop the Prometheus file exporter, to match `settings`.
+
+    Called by `red_log.runtime.apply_configdict()` with the `metrics` settings from the config's `red_log`
+    section (see `red_log.config_classes.MetricsConfig`), and the handlers it created.
+
+    Params:
+        settings (Mapping[str, Any] | None): The metrics settings. `None` stops collecting metrics for the
+            handlers a previous call instrumented. Handlers instrumented with `instrument_handler()` are
+            never uninstrumented here.
+        handlers (Mapping[str, logging.Handler]): The live handlers, by name.
+
+    """
+    global _EXPORTER
+
+    selected: dict[str, logging.Handler] = {}
+    if settings is not None:
+        names = settings.get("handlers")
+        selected = {
+            name: handler for name, handler in handlers.items() if names is None or name in names
+        }
+        buckets: t.Sequence[float] = settings.get("latency_buckets") or DEFAULT_LATENCY_BUCKETS
+
+    with _METRICS_LOCK:
+        ## Stop instrumenting handlers this function instrumented, that were removed from the config or
+        #  deselected. Handlers instrumented by hand are left alone.
+        for name, handler in list(_CONFIGURED.items()):
+            if selected.get(name) is not handler:
+                metrics = _METRICS.get(name)
+                if metrics is not None and metrics.handler is handler:
+                    uninstrument_handler(handler)
+                del _CONFIGURED[name]
+
+        for name in sorted(selected):
+            handler = selected[name]
+            metrics = _METRICS.get(name)
+            if name not in _CONFIGURED and metrics is not None and metrics.handler is handler:
+                ## Already instrumented by hand
+                continue
+
+            instrument_handler(handler, name=name, buckets=buckets)
+            _CONFIGURED[name] = handler
+
+    prometheus_file: str | None = settings.get("prometheus_file") if settings else None
+    interval: float = settings.get("interval", 15.0) if settings else 15.0
+
+    with _EXPORTER_LOCK:
+        if _EXPORTER is not None and (
+            prometheus_file is None
+            or str(_EXPORTER.path) != str(prometheus_file)
+            or _EXPORTER.interval != interval
+        ):
+            _EXPORTER.stop()
+            _EXPORTER = None
+
+        if prometheus_file is not None and _EXPORTER is None:
+            _EXPORTER = PrometheusFileExporter(prometheus_file, interval=interval)
+            _EXPORTER.start()
@@ -0,0 +1,124 @@
+"""Wrap a handler's methods once, and let several observers (metrics, profiling) time its calls."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing as t
+
+## Handler methods replaced by add_handler_hooks()
+_WRAPPED_METHODS: tuple[str, ...] = ("handle", "format", "handleError")
+## Handler instance attribute holding the hooks
+_HOOKS_ATTR: str = "_red_log_hooks"
+
+_HOOKS_LOCK: threading.RLock = threading.RLock()
+
+## Called with (record, handle() return value, duration in ns)
+HandleHook = t.Callable[[logging.LogRecord, t.Any, int], None]
+## Called with (record, formatted text, duration in ns)
+FormatHook = t.Callable[[logging.LogRecord, str, int], None]
+## Called with (record)
+ErrorHook = t.Callable[[logging.LogRecord], None]
+
+
+class _HandlerHooks:
+    """The observers of one handler, by owner."""
+
+    __slots__ = ("handle", "format", "error")
+
+    def __init__(self) -> None:
+        self.handle: dict[str, HandleHook] = {}
+        self.format: dict[str, FormatHook] = {}
+        self.error: dict[str, ErrorHook] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.handle or self.format or self.error)
+
+
+def _install_wrappers(handler: logging.Handler, hooks: _HandlerHooks) -> None:
+    """Replace the handler's methods (on the instance) with wrappers that call `hooks`."""
+    handle = handler.handle
+    format_record = handler.format
+    handle_error = handler.handleError
+    clock = time.perf_counter_ns
+
+    def instrumented_handle(record: logging.LogRecord) -> t.Any:
+        start: int = clock()
+        rv = handle(record)
+        elapsed: int = clock() - start
+
+        for hook in tuple(hooks.handle.values()):
+            hook(record, rv, elapsed)
+
+        return rv
+
+    def instrumented_format(record: logging.LogRecord) -> str:
+        start: int = clock()
+        text: str = format_record(record)
+        elapsed: int = clock() - start
+
+        for hook in tuple(hooks.format.values()):
+            hook(record, text, elapsed)
+
+        return text
+
+    def instrumented_handle_error(record: logging.LogRecord) -> None:
+        for hook in tuple(hooks.error.values()):
+            hook(record)
+
+        handle_error(record)
+
+    handler.handle = instrumented_handle
+    handler.format = instrumented_format
+    handler.handleError = instrumented_handle_error
+
+
+def add_handler_hooks(
+    handler: logging.Handler,
+    owner: str,
+    on_handle: HandleHook | None = None,
+    on_format: FormatHook | None = None,
+    on_error: ErrorHook | None = None,
+) -> None:
+    """Call observers after the handler's `handle()`/`format()`, and before its `handleError()`.
+
+    Hooks are kept by `owner`, so adding hooks again for the same owner replaces them. The handler's
+    methods are wrapped once, however many owners observe it.
+
+    Params:
+        handler (logging.Handler): The handler to observe.
+        owner (str): Who the hooks belong to, i.e. `metrics`.
+        on_handle (HandleHook | None): Called with the record, `handle()`'s return value, and its duration (ns).
+        on_format (FormatHook | None): Called with the record, the formatted text, and `format()`'s duration (ns).
+        on_error (ErrorHook | None): Called with the record, when the handler reports an error.
+
+    """
+    with _HOOKS_LOCK:
+        hooks: _HandlerHooks | None = handler.__dict__.get(_HOOKS_ATTR)
+        if hooks is None:
+            hooks = _HandlerHooks()
+            _install_wrappers(handler, hooks)
+            handler.__dict__[_HOOKS_ATTR] = hooks
+
+        for hook_dict, hook in ((hooks.handle, on_handle), (hooks.format, on_format), (hooks.error, on_error)):
+            if hook is None:
+                hook_dict.pop(owner, None)
+            else:
+                hook_dict[owner] = hook
+
+
+def remove_handler_hooks(handler: logging.Handler, owner: str) -> None:
+    """Remove an owner's hooks from a handler, and restore its methods when no hooks are left."""
+    with _HOOKS_LOCK:
+        hooks: _HandlerHooks | None = handler.__dict__.get(_HOOKS_ATTR)
+        if hooks is None:
+            return
+
+        hooks.handle.pop(owner, None)
+        hooks.format.pop(owner, None)
+        hooks.error.pop(owner, None)
+
+        if not hooks:
+            for attr in (*_WRAPPED_METHODS, _HOOKS_ATTR):
+                handler.__dict__.pop(attr, None)
@@ -0,0 +1,330 @@
+"""Attribute the time handlers spend on records to the log statements that created them."""
+
+from __future__ import annotations
+
+import atexit
+from dataclasses import dataclass
+import logging
+import logging.handlers
+import os
+from pathlib import Path
+import random
+import threading
+import typing as t
+
+from ._hooks import add_handler_hooks, remove_handler_hooks
+from ._registry import encoded_size
+
+log = logging.getLogger("red_log.metrics")
+
+## Owner of the handler hooks added by the profiler
+_HOOKS_OWNER: str = "profiling"
+
+## Sort keys accepted by get_profile_report()
+PROFILE_SORT_KEYS: tuple[str, ...] = ("emit", "format", "write", "bytes", "records")
+
+
+@dataclass
+class CallSiteProfile:
+    """The estimated logging cost of one log statement.
+
+    Values are estimated from sampled records (each sample is weighted by `1 / sample_rate`), and are
+    summed over every profiled handler the statement's records were emitted by.
+
+    Params:
+        logger (str): The logger's name.
+        pathname (str): The source file of the log statement.
+        lineno (int): The line of the log statement.
+        samples (int): Number of sampled records.
+        records (float): Estimated number of records handled.
+        emit_seconds (float): Estimated time spent in the handlers' `handle()` (filter, format, and write).
+        format_seconds (float): Estimated time spent formatting records.
+        bytes (float): Estimated size (in bytes, UTF-8) of the formatted records.
+    """
+
+    logger: str
+    pathname: str
+    lineno: int
+    samples: int = 0
+    records: float = 0.0
+    emit_seconds: float = 0.0
+    format_seconds: float = 0.0
+    bytes: float = 0.0
+
+    @property
+    def write_seconds(self) -> float:
+        """Estimated time spent in the handlers' `handle()` besides formatting (mostly writing)."""
+        return max(0.0, self.emit_seconds - self.format_seconds)
+
+    @property
+    def location(self) -> str:
+        return f"{self.pathname}:{self.lineno}"
+
+
+class _Profiler:
+    """Sample the records handled by the profiled handlers, and sum their cost per call site."""
+
+    def __init__(self) -> None:
+        self.sample_rate: float = 1.0
+        self.handlers: dict[str, logging.Handler] = {}
+        ## (logger, pathname, lineno) -> [samples, records, emit ns, format ns, bytes]
+        self.sites: dict[tuple[str, str, int], list[float]] = {}
+        self.lock = threading.Lock()
+        ## Format time and size of the record being handled on this thread
+        self.local = threading.local()
+
+    def on_format(self, record: logging.LogRecord, text: str, elapsed: int) -> None:
+        local = self.local
+        local.format_ns = getattr(local, "format_ns", 0) + elapsed
+        local.text = text
+
+    def on_handle(self, record: logging.LogRecord, rv: t.Any, elapsed: int) -> None:
+        local = self.local
+        format_ns: int = getattr(local, "format_ns", 0)
+        text: str | None = getattr(local, "text", None)
+        local.format_ns = 0
+        local.text = None
+
+        rate: float = self.sample_rate
+        if not rv or (rate < 1.0 and random.random() >= rate):
+            return
+
+        weight: float = 1.0 / rate
+        size: int = encoded_size(text) if text is not None else 0
+        key: tuple[str, str, int] = (record.name, record.pathname, record.lineno)
+
+        with self.lock:
+            site: list[float] | None = self.sites.get(key)
+            if site is None:
+                site = self.sites[key] = [0, 0.0, 0.0, 0.0, 0.0]
+
+            site[0] += 1
+            site[1] += weight
+            site[2] += elapsed * weight
+            site[3] += format_ns * weight
+            site[4] += size * weight
+
+
+_PROFILER = _Profiler()
+_PROFILER_LOCK: threading.RLock = threading.RLock()
+## File the report is written to at exit, set by configure_profiling()
+_REPORT_FILE: str | None = None
+_REPORT_TOP: int = 20
+## Handlers profiled because of configure_profiling() (not start_profiling()), by name
+_CONFIGURED: dict[str, logging.Handler] = {}
+
+
+def _add_handler(name: str, handler: logging.Handler) -> bool:
+    """Start profiling a handler. Returns `False` if it is skipped. Caller must hold `_PROFILER_LOCK`."""
+    if isinstance(handler, logging.handlers.QueueHandler) or name in _PROFILER.handlers:
+        return False
+
+    add_handler_hooks(
+        handler, _HOOKS_OWNER, on_handle=_PROFILER.on_handle, on_format=_PROFILER.on_format
+    )
+    _PROFILER.handlers[name] = handler
+
+    return True
+
+
+def _remove_handler(name: str) -> None:
+    """Stop profiling a handler. Caller must hold `_PROFILER_LOCK`."""
+    remove_handler_hooks(_PROFILER.handlers.pop(name), _HOOKS_OWNER)
+
+
+def start_profiling(
+    handlers: t.Mapping[str, logging.Handler] | t.Iterable[logging.Handler],
+    sample_rate: float = 0.1,
+) -> None:
+    """Start sampling the records emitted by handlers, and attributing their cost to call sites.
+
+    For a sampled record, the time the handler's `handle()` takes (filtering, formatting, and writing),
+    the time spent in its `format()`, and the formatted size, are added to the record's call site
+    (logger name, `pathname`, `lineno`). Read the results with `get_profile_report()`.
+
+    Queue handlers are skipped: the cost of a queued record is measured in the handlers the queue
+    listener passes it to, which still see the record's original call site.
+
+    Params:
+        handlers (Mapping[str, Handler] | Iterable[Handler]): The handlers to profile, i.e. by name.
+        sample_rate (float): Fraction (0-1) of records to sample. Totals are scaled by `1 / sample_rate`.
+
+    """
+    if not 0 < sample_rate <= 1:
+        raise ValueError("sample_rate must be greater than 0, and at most 1.")
+
+    if isinstance(handlers, t.Mapping):
+        named: dict[str, logging.Handler] = dict(handlers)
+    else:
+        named = {handler.name or repr(handler): handler for handler in handlers}
+
+    with _PROFILER_LOCK:
+        _PROFILER.sample_rate = sample_rate
+
+        for name, handler in list(_PROFILER.handlers.items()):
+            if named.get(name) is not handler:
+                _remove_handler(name)
+
+        for name, handler in named.items():
+            _add_handler(name, handler)
+
+
+def stop_profiling() -> None:
+    """Stop profiling every handler. Collected results are kept."""
+    with _PROFILER_LOCK:
+        for handler in _PROFILER.handlers.values():
+            remove_handler_hooks(handler, _HOOKS_OWNER)
+
+        _PROFILER.handlers.clear()
+
+
+def reset_profiling() -> None:
+    """Delete the collected results."""
+    with _PROFILER.lock:
+        _PROFILER.sites.clear()
+
+
+def get_profile_report(top: int | None = 20, sort_by: str = "emit") -> list[CallSiteProfile]:
+    """Return the most expensive log statements.
+
+    Params:
+        top (int | None): Number of call sites to return. `None` returns all of them.
+        sort_by (str): `emit` (total time in the handlers), `format`, `write`, `bytes`, or `records`.
+
+    Returns:
+        (list[CallSiteProfile]): Call sites, most expensive first.
+
+    """
+    if sort_by not in PROFILE_SORT_KEYS:
+        raise ValueError(f"Invalid sort_by '{sort_by}', must be one of {list(PROFILE_SORT_KEYS)}.")
+
+    with _PROFILER.lock:
+        sites: list[tuple[tuple[str, str, int], list[float]]] = [
+            (key, list(values)) for key, values in _PROFILER.sites.items()
+        ]
+
+    profiles: list[CallSiteProfile] = [
+        CallSiteProfile(
+            logger=logger_name,
+            pathname=pathname,
+            lineno=lineno,
+            samples=int(samples),
+            records=records,
+            emit_seconds=emit_ns / 1_000_000_000,
+            format_seconds=format_ns / 1_000_000_000,
+            bytes=size,
+        )
+        for (logger_name, pathname, lineno), (samples, records, emit_ns, format_ns, size) in sites
+    ]
+
+    sort_keys: dict[str, t.Callable[[CallSiteProfile], float]] = {
+        "emit": lambda p: p.emit_seconds,
+        "format": lambda p: p.format_seconds,
+        "write": lambda p: p.write_seconds,
+        "bytes": lambda p: p.bytes,
+        "records": lambda p: p.records,
+    }
+    profiles.sort(key=sort_keys[sort_by], reverse=True)
+
+    return profiles if top is None else profiles[:top]
+
+
+def format_profile_report(top: int | None = 20, sort_by: str = "emit") -> str:
+    """Return `get_profile_report()` as a text table.
+
+    Params:
+        top (int | None): Number of call sites to include. `None` includes all of them.
+        sort_by (str): `emit`, `format`, `write`, `bytes`, or `records`.
+
+    Returns:
+        (str): The report.
+
+    """
+    profiles: list[CallSiteProfile] = get_profile_report(top=top, sort_by=sort_by)
+    total_emit: float = sum(p.emit_seconds for p in get_profile_report(top=None)) or 1.0
+
+    lines: list[str] = [
+        f"{'emit s':>10} {'%':>6} {'format s':>10} {'write s':>10} {'records':>10} {'bytes':>12}  logger  location",
+    ]
+    for p in profiles:
+        lines.append(
+            f"{p.emit_seconds:>10.4f} {p.emit_seconds / total_emit * 100:>5.1f}% {p.format_seconds:>10.4f} "
+            f"{p.write_seconds:>10.4f} {p.records:>10.0f} {p.bytes:>12.0f}  {p.logger}  {p.location}"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def _write_report_file() -> None:
+    if _REPORT_FILE is None:
+        return
+
+    try:
+        path = Path(_REPORT_FILE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path: str = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(format_profile_report(top=_REPORT_TOP))
+        os.replace(tmp_path, path)
+    except Exception as exc:
+        log.warning(f"Could not write the logging profile report to '{_REPORT_FILE}'. Details: {exc}")
+
+
+def configure_profiling(
+    settings: t.Mapping[str, t.Any] | None, handlers: t.Mapping[str, logging.Handler]
+) -> None:
+    """Start/stop profiling handlers to match `settings`.
+
+    Called by `red_log.runtime.apply_configdict()` with the `profiling` settings from the config's `red_log`
+    section (see `red_log.config_classes.ProfilingConfig`), and the handlers it created.
+
+    Params:
+        settings (Mapping[str, Any] | None): The profiling settings. `None` stops profiling the handlers a
+            previous call started profiling (and writes the report file, if one was set). Handlers profiled
+            with `start_profiling()` are never stopped here.
+        handlers (Mapping[str, logging.Handler]): The live handlers, by name.
+
+    """
+    global _REPORT_FILE, _REPORT_TOP
+
+    names = settings.get("handlers") if settings is not None else None
+    selected: dict[str, logging.Handler] = (
+        {name: handler for name, handler in handlers.items() if names is None or name in names}
+        if settings is not None
+        else {}
+    )
+
+    with _PROFILER_LOCK:
+        ## Stop profiling handlers a previous call started profiling, that were removed from the config or
+        #  deselected. Handlers profiled with start_profiling() are left alone.
+        for name, handler in list(_CONFIGURED.items()):
+            if selected.get(name) is not handler:
+                if _PROFILER.handlers.get(name) is handler:
+                    _remove_handler(name)
+                del _CONFIGURED[name]
+
+        if settings is None:
+            if _REPORT_FILE is not None:
+                _write_report_file()
+                atexit.unregister(_write_report_file)
+                _REPORT_FILE = None
+
+            return
+
+        sample_rate: float = settings.get("sample_rate", 0.1)
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be greater than 0, and at most 1.")
+        _PROFILER.sample_rate = sample_rate
+
+        for name, handler in selected.items():
+            if name not in _CONFIGURED and _add_handler(name, handler):
+                _CONFIGURED[name] = handler
+
+        _REPORT_TOP = settings.get("top", 20)
+        report_file: str | None = settings.get("report_file")
+        if report_file != _REPORT_FILE:
+            if _REPORT_FILE is None:
+                atexit.register(_write_report_file)
+            elif report_file is None:
+                atexit.unregister(_write_report_file)
+            _REPORT_FILE = report_file
@@ -0,0 +1,201 @@
+"""Render handler metrics in the Prometheus text exposition format, and write them to a file."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import math
+import os
+from pathlib import Path
+import tempfile
+import threading
+import typing as t
+
+from ._registry import HandlerMetricsSnapshot, get_metrics_snapshot
+
+log = logging.getLogger("red_log.metrics")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(bound)
+
+
+def render_prometheus(snapshots: t.Mapping[str, HandlerMetricsSnapshot] | None = None) -> str:
+    """Render handler metrics in the Prometheus text exposition format.
+
+    Params:
+        snapshots (Mapping[str, HandlerMetricsSnapshot] | None): The metrics to render. Defaults to
+            `get_metrics_snapshot()`.
+
+    Returns:
+        (str): The metrics, i.e. for a node_exporter textfile collector.
+
+    """
+    if snapshots is None:
+        snapshots = get_metrics_snapshot()
+
+    lines: list[str] = []
+
+    def _family(name: str, kind: str, help_text: str) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    _family("red_log_handler_records_total", "counter", "Records emitted by a handler, by logger.")
+    for snapshot in snapshots.values():
+        for logger_name, count in sorted(snapshot.emitted.items()):
+            lines.append(
+                f"red_log_handler_records_total{_labels(handler=snapshot.name, logger=logger_name)} {count}"
+            )
+
+    _family(
+        "red_log_handler_records_filtered_total",
+        "counter",
+        "Records dropped by a handler's filters, by logger.",
+    )
+    for snapshot in snapshots.values():
+        for logger_name, count in sorted(snapshot.filtered.items()):
+            lines.append(
+                f"red_log_handler_records_filtered_total{_labels(handler=snapshot.name, logger=logger_name)} {count}"
+            )
+
+    _family(
+        "red_log_handler_records_dropped_total",
+        "counter",
+        "Records dropped by a handler itself, i.e. because its buffer was full.",
+    )
+    for snapshot in snapshots.values():
+        if snapshot.dropped is not None:
+            lines.append(
+                f"red_log_handler_records_dropped_total{_labels(handler=snapshot.name)} {snapshot.dropped}"
+            )
+
+    _family("red_log_handler_errors_total", "counter", "Errors reported by a handler.")
+    for snapshot in snapshots.values():
+        lines.append(f"red_log_handler_errors_total{_labels(handler=snapshot.name)} {snapshot.errors}")
+
+    _family("red_log_handler_bytes_total", "counter", "Bytes (UTF-8) of records formatted by a handler.")
+    for snapshot in snapshots.values():
+        lines.append(
+            f"red_log_handler_bytes_total{_labels(handler=snapshot.name)} {snapshot.bytes_written}"
+        )
+
+    _family(
+        "red_log_handler_queue_depth", "gauge", "Records waiting in a queue-based handler's queue/buffer."
+    )
+    for snapshot in snapshots.values():
+        if snapshot.queue_depth is not None:
+            lines.append(
+                f"red_log_handler_queue_depth{_labels(handler=snapshot.name)} {snapshot.queue_depth}"
+            )
+
+    _family(
+        "red_log_handler_emit_seconds", "histogram", "Time spent in a handler's handle() per emitted record."
+    )
+    for snapshot in snapshots.values():
+        for bound, count in snapshot.latency_buckets:
+            lines.append(
+                f"red_log_handler_emit_seconds_bucket{_labels(handler=snapshot.name, le=_format_bound(bound))} {count}"
+            )
+        lines.append(
+            f"red_log_handler_emit_seconds_sum{_labels(handler=snapshot.name)} {snapshot.latency_sum!r}"
+        )
+        lines.append(
+            f"red_log_handler_emit_seconds_count{_labels(handler=snapshot.name)} {snapshot.latency_count}"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(
+    path: t.Union[str, Path], snapshots: t.Mapping[str, HandlerMetricsSnapshot] | None = None
+) -> None:
+    """Write `render_prometheus()` output to a file, atomically.
+
+    The metrics are written to a temporary file in the same directory, which then replaces `path`, so
+    a reader (i.e. a node_exporter textfile collector) never sees a partly written file.
+
+    Params:
+        path (str | Path): The file to write.
+        snapshots (Mapping[str, HandlerMetricsSnapshot] | None): The metrics to write. Defaults to
+            `get_metrics_snapshot()`.
+
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    text: str = render_prometheus(snapshots)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class PrometheusFileExporter:
+    """Write the handler metrics to a Prometheus text file every `interval` seconds, on a background thread.
+
+    The file is also written when the exporter is stopped, and at interpreter exit.
+
+    Params:
+        path (str | Path): The file to write.
+        interval (float): Seconds between writes.
+    """
+
+    def __init__(self, path: t.Union[str, Path], interval: float = 15.0) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0.")
+
+        self.path: Path = Path(path)
+        self.interval = interval
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def write(self) -> None:
+        """Write the metrics file now."""
+        try:
+            write_prometheus(self.path)
+        except Exception as exc:
+            log.warning(f"Could not write metrics to '{self.path}'. Details: {exc}")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def start(self) -> None:
+        """Start the background thread, if it is not already running."""
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"red_log-PrometheusFileExporter-{self.path}", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Stop the background thread, and write the metrics one last time."""
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        atexit.unregister(self.stop)
+
+        self.write()
@@ -0,0 +1,284 @@
+"""Wrap handlers to count the records they handle, and time how long handling them takes."""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass, field
+import logging
+import logging.handlers
+import threading
+import typing as t
+import weakref
+
+from ._hooks import add_handler_hooks, remove_handler_hooks
+
+log = logging.getLogger("red_log.metrics")
+
+## Upper bounds (in seconds) of the emit latency histogram buckets
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.000_001,
+    0.000_005,
+    0.000_01,
+    0.000_025,
+    0.000_05,
+    0.000_1,
+    0.000_25,
+    0.000_5,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+)
+
+## Owner of the handler hooks added by instrument_handler()
+_HOOKS_OWNER: str = "metrics"
+
+
+class LatencyHistogram:
+    """Count durations into buckets with fixed upper bounds (in seconds), like a Prometheus histogram."""
+
+    __slots__ = ("bounds", "_bounds_ns", "counts", "sum_ns", "count")
+
+    def __init__(self, bounds: t.Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.bounds: tuple[float, ...] = tuple(sorted(bounds))
+        self._bounds_ns: list[int] = [int(bound * 1_000_000_000) for bound in self.bounds]
+        ## One count per bound, plus one for durations above the last bound
+        self.counts: list[int] = [0] * (len(self.bounds) + 1)
+        self.sum_ns: int = 0
+        self.count: int = 0
+
+    def observe(self, duration_ns: int) -> None:
+        self.counts[bisect.bisect_left(self._bounds_ns, duration_ns)] += 1
+        self.sum_ns += duration_ns
+        self.count += 1
+
+
+@dataclass
+class HandlerMetricsSnapshot:
+    """The metrics of one handler, at the time `get_metrics_snapshot()` was called.
+
+    Params:
+        name (str): The handler's name.
+        handler_class (str): The handler's class.
+        emitted (dict[str, int]): Number of records the handler emitted, by logger name.
+        filtered (dict[str, int]): Number of records the handler's filters dropped, by logger name.
+        dropped (int | None): Number of records the handler dropped itself (i.e. a full buffer), for handlers that
+            count them (`AsyncHandler`, `BatchingSocketHandler`, a `SpillQueue`). Includes the records dropped by
+            handlers this name was instrumented on before.
+        errors (int): Number of errors reported by the handler (calls to `handleError()`).
+        bytes_written (int): Size (in bytes, UTF-8) of the records the handler formatted. Not counted for queue handlers.
+        queue_depth (int | None): Number of records waiting in the handler's queue/buffer, for queue-based handlers.
+        latency_buckets (tuple[tuple[float, int], ...]): `(upper bound in seconds, cumulative count)` of the time
+            `handle()` took for emitted records. The last bound is `inf`.
+        latency_sum (float): Total time (in seconds) spent handling emitted records.
+        latency_count (int): Number of timed records.
+    """
+
+    name: str
+    handler_class: str
+    emitted: dict[str, int] = field(default_factory=dict)
+    filtered: dict[str, int] = field(default_factory=dict)
+    dropped: int | None = None
+    errors: int = 0
+    bytes_written: int = 0
+    queue_depth: int | None = None
+    latency_buckets: tuple[tuple[float, int], ...] = ()
+    latency_sum: float = 0.0
+    latency_count: int = 0
+
+    @property
+    def emitted_total(self) -> int:
+        return sum(self.emitted.values())
+
+    @property
+    def latency_mean(self) -> float:
+        """Mean time (in seconds) spent handling an emitted record."""
+        return self.latency_sum / self.latency_count if self.latency_count else 0.0
+
+
+class _HandlerMetrics:
+    """Counters for one handler name. Kept when the handler object is replaced by a re-applied config."""
+
+    def __init__(self, name: str, buckets: t.Sequence[float]) -> None:
+        self.name = name
+        self.handler: logging.Handler | None = None
+        self.emitted: dict[str, int] = {}
+        self.filtered: dict[str, int] = {}
+        self.errors: int = 0
+        self.bytes_written: int = 0
+        ## Records dropped by the handlers this name was instrumented on before, so `dropped` carries on
+        self.dropped_offset: int | None = None
+        ## Uninstrumented handler -> its count included in dropped_offset, taken out if it is instrumented again
+        self.retired: weakref.WeakKeyDictionary[logging.Handler, int] = weakref.WeakKeyDictionary()
+        self.latency = LatencyHistogram(buckets)
+        self.lock = threading.Lock()
+
+    def snapshot(self) -> HandlerMetricsSnapshot:
+        handler: logging.Handler | None = self.handler
+        dropped: int | None = _get_dropped(handler)
+        if self.dropped_offset is not None:
+            dropped = (dropped or 0) + self.dropped_offset
+
+        with self.lock:
+            cumulative: int = 0
+            buckets: list[tuple[float, int]] = []
+            for bound, count in zip((*self.latency.bounds, float("inf")), self.latency.counts):
+                cumulative += count
+                buckets.append((bound, cumulative))
+
+            return HandlerMetricsSnapshot(
+                name=self.name,
+                handler_class=type(handler).__name__ if handler is not None else "",
+                emitted=dict(self.emitted),
+                filtered=dict(self.filtered),
+                dropped=dropped,
+                errors=self.errors,
+                bytes_written=self.bytes_written,
+                queue_depth=_get_queue_depth(handler),
+                latency_buckets=tuple(buckets),
+                latency_sum=self.latency.sum_ns / 1_000_000_000,
+                latency_count=self.latency.count,
+            )
+
+
+## Handler name -> its metrics
+_METRICS: dict[str, _HandlerMetrics] = {}
+_METRICS_LOCK: threading.RLock = threading.RLock()
+
+
+def _get_dropped(handler: logging.Handler | None) -> int | None:
+    """Return the number of records a handler (or its queue) dropped, if it counts them."""
+    dropped: int | None = getattr(handler, "dropped", None)
+    queue_dropped: int | None = getattr(getattr(handler, "queue", None), "dropped", None)
+
+    if dropped is None and queue_dropped is None:
+        return None
+
+    return (dropped or 0) + (queue_dropped or 0)
+
+
+def _get_queue_depth(handler: logging.Handler | None) -> int | None:
+    """Return the number of records waiting in a handler's queue or buffer, for queue-based handlers."""
+    queue = getattr(handler, "queue", None)
+    if queue is not None and hasattr(queue, "qsize"):
+        try:
+            return queue.qsize()
+        except NotImplementedError:
+            ## multiprocessing queues on macOS
+            return None
+
+    return getattr(handler, "pending", None)
+
+
+def encoded_size(text: str) -> int:
+    """Return the size (in bytes) of `text` encoded as UTF-8."""
+    return len(text) if text.isascii() else len(text.encode("utf-8", "replace"))
+
+
+def instrument_handler(
+    handler: logging.Handler,
+    name: str | None = None,
+    buckets: t.Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+) -> None:
+    """Start collecting metrics for a handler.
+
+    The handler's `handle()`, `format()`, and `handleError()` are wrapped (on the instance), to count
+    emitted & filtered records per logger, time `handle()`, and count formatted bytes (except for
+    `QueueHandler`s) and errors. Metrics are kept by handler name, so when a handler is replaced by one
+    with the same name (i.e. by `apply_configdict()`), its counters carry on.
+
+    Params:
+        handler (logging.Handler): The handler to instrument.
+        name (str | None): The name to report metrics under. Defaults to `handler.name`.
+        buckets (Sequence[float]): Upper bounds (in seconds) of the latency histogram buckets. Only used the
+            first time a handler name is instrumented.
+
+    """
+    name = name or handler.name
+    if not name:
+        raise ValueError(f"Handler {handler!r} has no name, pass one to instrument_handler().")
+
+    with _METRICS_LOCK:
+        metrics: _HandlerMetrics | None = _METRICS.get(name)
+        if metrics is None:
+            metrics = _METRICS[name] = _HandlerMetrics(name, buckets)
+        elif metrics.handler is handler:
+            return
+        elif metrics.handler is not None:
+            uninstrument_handler(metrics.handler)
+
+        ## In case the handler was instrumented under another name
+        uninstrument_handler(handler)
+
+        retired_dropped: int | None = metrics.retired.pop(handler, None)
+        if retired_dropped is not None:
+            ## Instrumented again, its dropped count is read from the handler
+            metrics.dropped_offset -= retired_dropped
+
+        lock: threading.Lock = metrics.lock
+        emitted: dict[str, int] = metrics.emitted
+        filtered: dict[str, int] = metrics.filtered
+        observe = metrics.latency.observe
+
+        def on_handle(record: logging.LogRecord, rv: t.Any, elapsed: int) -> None:
+            with lock:
+                if rv:
+                    emitted[record.name] = emitted.get(record.name, 0) + 1
+                    observe(elapsed)
+                else:
+                    filtered[record.name] = filtered.get(record.name, 0) + 1
+
+        def on_format(record: logging.LogRecord, text: str, elapsed: int) -> None:
+            size: int = encoded_size(text)
+
+            with lock:
+                metrics.bytes_written += size
+
+        def on_error(record: logging.LogRecord) -> None:
+            with lock:
+                metrics.errors += 1
+
+        add_handler_hooks(
+            handler,
+            _HOOKS_OWNER,
+            on_handle=on_handle,
+            ## Queue handlers format records to pass them on, not to write them
+            on_format=None if isinstance(handler, logging.handlers.QueueHandler) else on_format,
+            on_error=on_error,
+        )
+        metrics.handler = handler
+
+
+def uninstrument_handler(handler: logging.Handler) -> None:
+    """Stop collecting metrics for a handler, restoring its methods. Its metrics are kept."""
+    with _METRICS_LOCK:
+        remove_handler_hooks(handler, _HOOKS_OWNER)
+
+        for metrics in _METRICS.values():
+            if metrics.handler is handler:
+                dropped: int | None = _get_dropped(handler)
+                if dropped is not None:
+                    metrics.dropped_offset = (metrics.dropped_offset or 0) + dropped
+                    metrics.retired[handler] = dropped
+                metrics.handler = None
+
+
+def get_metrics_snapshot() -> dict[str, HandlerMetricsSnapshot]:
+    """Return the current metrics of every handler that has been instrumented, by handler name."""
+    with _METRICS_LOCK:
+        metrics: list[_HandlerMetrics] = list(_METRICS.values())
+
+    return {m.name: m.snapshot() for m in metrics}
+
+
+def reset_metrics() -> None:
+    """Uninstrument every handler and delete all collected metrics."""
+    with _METRICS_LOCK:
+        for metrics in _METRICS.values():
+            if metrics.handler is not None:
+                uninstrument_handler(metrics.handler)
+
+        _METRICS.clear()
@@ -0,0 +1,14 @@
+"""Log record classes and record factories provided by red_log.
+
+Install `LazyLogRecord` as the record factory with `install_record_factory()`, so records only compute
+attributes like `relativeCreated` and `processName` when something reads them.
+"""
+
+from __future__ import annotations
+
+from ._lazy import (
+    LAZY_RECORD_FIELDS,
+    LazyLogRecord,
+    install_record_factory,
+    uninstall_record_factory,
+)
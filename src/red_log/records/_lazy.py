@@ -0,0 +1,244 @@
+"""A `LogRecord` that computes its less-used attributes only when they are read."""
+
+from __future__ import annotations
+
+import collections.abc
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+import typing as t
+
+log = logging.getLogger("red_log.records")
+
+## The record factory that was set before install_record_factory()
+_previous_factory: t.Callable[..., logging.LogRecord] | None = None
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_pathname(pathname: str) -> tuple[str, str]:
+    """Return the `(filename, module)` of a source file path, like `LogRecord.__init__()`."""
+    try:
+        filename: str = os.path.basename(pathname)
+
+        return filename, os.path.splitext(filename)[0]
+    except (TypeError, ValueError, AttributeError):
+        return pathname, "Unknown module"
+
+
+def _get_relative_created(record_dict: dict[str, t.Any]) -> float:
+    return (record_dict["created"] - logging._startTime) * 1000
+
+
+def _get_process_name(record_dict: dict[str, t.Any]) -> str:
+    mp = sys.modules.get("multiprocessing")
+    if mp is not None:
+        try:
+            return mp.current_process().name
+        except Exception:
+            pass
+
+    return "MainProcess"
+
+
+## Attribute name -> function computing it from the record's other attributes
+LAZY_RECORD_FIELDS: dict[str, t.Callable[[dict[str, t.Any]], t.Any]] = {
+    "relativeCreated": _get_relative_created,
+    "process": lambda record_dict: os.getpid(),
+    "processName": _get_process_name,
+}
+
+
+class _LazyRecordDict(dict):
+    """A record `__dict__` that computes fields in `LAZY_RECORD_FIELDS` on first lookup.
+
+    %-style formatting (`fmt % record.__dict__`) and `str.format_map()` look keys up with `__getitem__`,
+    so they see the lazy fields. Copying the dict (`dict(d)`, `{**d}`, `d.copy()`, iterating it), as
+    `logging.handlers.SocketHandler` does, computes every field first.
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> t.Any:
+        compute = LAZY_RECORD_FIELDS.get(key)
+        if compute is None:
+            raise KeyError(key)
+
+        value = self[key] = compute(self)
+
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        ## Logger.makeRecord() checks `extra` keys against the record's __dict__
+        return dict.__contains__(self, key) or key in LAZY_RECORD_FIELDS
+
+    def materialize(self) -> None:
+        """Compute every lazy field that has not been computed yet."""
+        for key in LAZY_RECORD_FIELDS:
+            if not dict.__contains__(self, key):
+                self[key]
+
+    def __iter__(self) -> t.Iterator[str]:
+        self.materialize()
+
+        return dict.__iter__(self)
+
+    def keys(self):
+        self.materialize()
+
+        return dict.keys(self)
+
+    def values(self):
+        self.materialize()
+
+        return dict.values(self)
+
+    def items(self):
+        self.materialize()
+
+        return dict.items(self)
+
+    def copy(self) -> dict[str, t.Any]:
+        self.materialize()
+
+        return dict(dict.items(self))
+
+
+class LazyLogRecord(logging.LogRecord):
+    """A `logging.LogRecord` that defers computing `relativeCreated`, `process`, and `processName` until a
+    formatter, filter, or handler reads them.
+
+    Records that are filtered out, or formatted with a format that does not use those fields, skip the
+    work. `filename` and `module` are split from `pathname` once per source file and cached, which is
+    cheaper than deferring them (most formats use `module`). `pathname`, `lineno`, and `funcName` are
+    found by the logger (`Logger.findCaller()`) before the record is created, so they are not deferred.
+    `threadName` is read when the record is created, like `LogRecord` does: a record formatted on another
+    thread (i.e. by `AsyncHandler`) could otherwise get the name of a thread that reused the ident.
+
+    The gain depends on the format. With formats that read most of the deferred fields (i.e. `RED_LOG_FMT`),
+    the lookups cost about as much as they save, and `LazyLogRecord` can be slightly slower than `LogRecord`.
+    Measure with `benchmarks/bench_records.py` and your own formats before installing it.
+
+    Records still have a `__dict__` (the stdlib formatters, handlers, and `extra=` all use it), but it is
+    filled with the attributes every record needs, and the lazy ones are added on first read. Copying or
+    pickling a record (i.e. in `QueueHandler.prepare()`, or to send it to another process) computes every
+    lazy field first, on the thread that logged it.
+
+    Install it with `install_record_factory()`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        level: int,
+        pathname: str,
+        lineno: int,
+        msg: t.Any,
+        args: t.Any,
+        exc_info: t.Any,
+        func: str | None = None,
+        sinfo: str | None = None,
+        **kwargs: t.Any,
+    ) -> None:
+        ## Same eager attributes as LogRecord.__init__(), without the ones in LAZY_RECORD_FIELDS
+        created: float = time.time()
+
+        if args and len(args) == 1 and isinstance(args[0], collections.abc.Mapping) and args[0]:
+            args = args[0]
+
+        try:
+            filename, module = _split_pathname(pathname)
+        except TypeError:
+            ## Unhashable pathname
+            filename, module = pathname, "Unknown module"
+
+        record_dict = _LazyRecordDict(
+            name=name,
+            msg=msg,
+            args=args,
+            levelname=logging.getLevelName(level),
+            levelno=level,
+            pathname=pathname,
+            filename=filename,
+            module=module,
+            lineno=lineno,
+            exc_info=exc_info,
+            exc_text=None,
+            stack_info=sinfo,
+            funcName=func,
+            created=created,
+            msecs=int((created - int(created)) * 1000) + 0.0,
+            thread=threading.get_ident() if logging.logThreads else None,
+            threadName=threading.current_thread().name if logging.logThreads else None,
+        )
+        if not logging.logProcesses:
+            record_dict["process"] = None
+        if not logging.logMultiprocessing:
+            record_dict["processName"] = None
+
+        if sys.version_info >= (3, 12):
+            ## The current task has to be read in the caller's context
+            record_dict["taskName"] = None
+            if logging.logAsyncioTasks:
+                asyncio = sys.modules.get("asyncio")
+                if asyncio:
+                    try:
+                        record_dict["taskName"] = asyncio.current_task().get_name()
+                    except Exception:
+                        pass
+
+        self.__dict__ = record_dict
+
+    def __getattr__(self, name: str) -> t.Any:
+        ## Only called when `name` is not in the instance __dict__
+        if name in LAZY_RECORD_FIELDS:
+            return self.__dict__[name]
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def materialize(self) -> None:
+        """Compute every lazy attribute now."""
+        if isinstance(self.__dict__, _LazyRecordDict):
+            self.__dict__.materialize()
+
+    def __getstate__(self) -> dict[str, t.Any]:
+        ## Used by copy.copy() and pickle, returns a plain dict with every attribute computed
+        self.materialize()
+
+        return dict(dict.items(self.__dict__))
+
+
+def install_record_factory() -> t.Callable[..., logging.LogRecord]:
+    """Make `LazyLogRecord` the record factory (`logging.setLogRecordFactory()`).
+
+    Returns:
+        (Callable[..., LogRecord]): The factory that was replaced.
+
+    """
+    global _previous_factory
+
+    current = logging.getLogRecordFactory()
+    if current is LazyLogRecord:
+        return _previous_factory or logging.LogRecord
+
+    if current is not logging.LogRecord:
+        log.warning(
+            f"Replacing custom log record factory {current!r} with LazyLogRecord. It is restored by uninstall_record_factory()."
+        )
+
+    _previous_factory = current
+    logging.setLogRecordFactory(LazyLogRecord)
+
+    return current
+
+
+def uninstall_record_factory() -> None:
+    """Restore the record factory that was set before `install_record_factory()`."""
+    global _previous_factory
+
+    if logging.getLogRecordFactory() is LazyLogRecord:
+        logging.setLogRecordFactory(_previous_factory or logging.LogRecord)
+
+    _previous_factory = None
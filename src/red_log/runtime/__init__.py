@@ -0,0 +1,17 @@
+"""Apply and manage logging configs in a running process."""
+
+from __future__ import annotations
+
+from ._apply import (
+    ApplyResult,
+    apply_configdict,
+    get_applied_configdict,
+    get_applied_handler,
+    reset_applied_configdict,
+)
+from ._controller import ROOT_LOGGER_NAME, LevelOverride, RuntimeController
+from ._multiprocess import (
+    MultiprocessLogWriter,
+    configure_worker,
+    get_worker_configdict,
+)
@@ -0,0 +1,465 @@
+"""Apply logging dictConfigs incrementally, only touching the objects that changed.
+
+`logging.config.dictConfig()` closes every existing handler and builds the whole logging tree
+again, even when the new config is identical to the one already applied. `apply_configdict()`
+remembers the last config it applied, diffs the new config against it, and only creates,
+closes, or updates the formatters, filters, handlers, and loggers that are different.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import logging.config
+import threading
+import typing as t
+
+from red_log.__levels import level_to_int
+from red_log.config_classes.base import FrozenDict, freeze, thaw
+from red_log.config_classes.instrumentation import RED_LOG_CONFIG_KEY
+from red_log.handlers import get_handler_by_name
+from red_log.helpers._configdict_validation import validate_configdict
+
+log = logging.getLogger("red_log.runtime")
+
+## Handler config keys that can be changed on an existing handler object
+_IN_PLACE_HANDLER_KEYS: frozenset[str] = frozenset({"level", "formatter", "filters"})
+## Handler config keys that reference other handlers by name
+_HANDLER_REFERENCE_KEYS: tuple[str, ...] = ("handlers", "target")
+
+
+@dataclass
+class ApplyResult:
+    """Describe what `apply_configdict()` changed.
+
+    Params:
+        full (bool): `True` when the config was applied with `logging.config.dictConfig()`.
+        created_handlers (list[str]): Names of handlers that were created (new, or re-created because their
+            class/arguments changed).
+        closed_handlers (list[str]): Names of handlers that were closed.
+        updated_handlers (list[str]): Names of existing handlers whose level, formatter, or filters were changed.
+        updated_loggers (list[str]): Names of loggers whose level, handlers, filters, or propagation changed.
+            The root logger is named `root`.
+    """
+
+    full: bool = False
+    created_handlers: list[str] = field(default_factory=list)
+    closed_handlers: list[str] = field(default_factory=list)
+    updated_handlers: list[str] = field(default_factory=list)
+    updated_loggers: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        """`True` if the logging tree was modified."""
+        return bool(
+            self.full
+            or self.created_handlers
+            or self.closed_handlers
+            or self.updated_handlers
+            or self.updated_loggers
+        )
+
+
+@dataclass
+class _AppliedState:
+    """The last applied config, and the live objects created from it."""
+
+    config: FrozenDict
+    formatters: dict[str, logging.Formatter] = field(default_factory=dict)
+    filters: dict[str, t.Any] = field(default_factory=dict)
+    handlers: dict[str, logging.Handler] = field(default_factory=dict)
+
+
+_STATE: _AppliedState | None = None
+_STATE_LOCK: threading.RLock = threading.RLock()
+
+
+def get_applied_configdict() -> FrozenDict | None:
+    """Return the config most recently applied by `apply_configdict()`, or `None`."""
+    with _STATE_LOCK:
+        return _STATE.config if _STATE is not None else None
+
+
+def get_applied_handler(name: str) -> logging.Handler | None:
+    """Return a live handler created by `apply_configdict()`, by its name in the config."""
+    with _STATE_LOCK:
+        return _STATE.handlers.get(name) if _STATE is not None else None
+
+
+def reset_applied_configdict() -> None:
+    """Forget the applied config, so the next `apply_configdict()` call does a full `dictConfig()`.
+
+    Call this if the logging tree was configured outside of `apply_configdict()`.
+    """
+    global _STATE
+
+    with _STATE_LOCK:
+        _STATE = None
+
+
+def _section(config: t.Mapping[str, t.Any], key: str) -> t.Mapping[str, t.Any]:
+    return config.get(key) or {}
+
+
+def _logger_configs(config: t.Mapping[str, t.Any]) -> dict[str, t.Mapping[str, t.Any]]:
+    """Return the config's loggers, with the root logger under the name `root`."""
+    logger_configs: dict[str, t.Mapping[str, t.Any]] = dict(_section(config, "loggers"))
+    if config.get("root"):
+        logger_configs["root"] = config["root"]
+
+    return logger_configs
+
+
+def _get_logger(name: str) -> logging.Logger:
+    return logging.getLogger() if name == "root" else logging.getLogger(name)
+
+
+def _handler_references(handler_config: t.Mapping[str, t.Any]) -> set[str]:
+    """Return the names of other handlers a handler config refers to."""
+    references: set[str] = set()
+
+    for key in _HANDLER_REFERENCE_KEYS:
+        value = handler_config.get(key)
+        if isinstance(value, str):
+            references.add(value.removeprefix("cfg://handlers."))
+        elif isinstance(value, (list, tuple)):
+            references.update(
+                v.removeprefix("cfg://handlers.") for v in value if isinstance(v, str)
+            )
+
+    return references
+
+
+def _record_filters(
+    state: _AppliedState, filter_names: t.Iterable[t.Any] | None, filter_objs: list[t.Any]
+) -> None:
+    """Record the filter objects dictConfig() attached for each filter name in a handler/logger config."""
+    for filter_name, filter_obj in zip(filter_names or (), filter_objs):
+        if isinstance(filter_name, str):
+            state.filters[filter_name] = filter_obj
+
+
+def _resolve_filters(filter_names: t.Iterable[t.Any] | None, filters: dict[str, t.Any]) -> list:
+    """Return the filter objects for a handler/logger config's `filters`.
+
+    Like dictConfig() (Python 3.12+), entries that are filter objects instead of names are used as they are.
+    """
+    return [filters[f] if isinstance(f, str) else f for f in filter_names or ()]
+
+
+def _full_apply(config: FrozenDict) -> ApplyResult:
+    """Apply `config` with `dictConfig()`, and record the objects it created."""
+    global _STATE
+
+    logging.config.dictConfig(config)
+
+    state = _AppliedState(config=config)
+    for name, handler_config in _section(config, "handlers").items():
+        handler: logging.Handler | None = get_handler_by_name(name)
+        if handler is None:
+            continue
+
+        state.handlers[name] = handler
+        if handler_config.get("formatter") and handler.formatter is not None:
+            state.formatters[handler_config["formatter"]] = handler.formatter
+        _record_filters(state, handler_config.get("filters"), handler.filters)
+
+    ## Filters on loggers, so the next incremental apply keeps them (and their state) when unchanged
+    for name, logger_config in _logger_configs(config).items():
+        _record_filters(state, logger_config.get("filters"), _get_logger(name).filters)
+
+    _STATE = state
+
+    return ApplyResult(full=True, created_handlers=list(state.handlers))
+
+
+def apply_configdict(
+    config: t.Mapping[str, t.Any], incremental: bool = True, validate: bool = True
+) -> ApplyResult:
+    """Apply a logging dictConfig, changing only what differs from the previously applied config.
+
+    The first call (or any call with `incremental=False`) applies the config with
+    `logging.config.dictConfig()`. Later calls diff the new config against the last one:
+
+    - Handlers whose class or constructor arguments changed (or that are new) are created, and handlers that
+      were removed or replaced are closed.
+    - Handlers where only the `level`, `formatter`, or `filters` changed are updated in place, and keep their
+      open files/sockets.
+    - Handlers that refer to a re-created handler (i.e. a `ManagedQueueHandler`'s `handlers`) are re-created.
+    - Loggers get their level, propagation, filters, and handler list updated in place. Loggers removed from
+      the config have their handlers removed and their level reset to `NOTSET`.
+
+    `disable_existing_loggers` is only honored by full applies. Settings in the config's `red_log` section
+    (i.e. from `assemble_configdict(metrics=..., profiling=...)`) are applied to the live handlers after every apply.
+
+    A config that changes anything is checked with `red_log.helpers.validate_configdict()` first, so an invalid
+    config raises before any handler is closed, and the logging setup is left as it was.
+
+    Params:
+        config (Mapping[str, Any]): A logging dictConfig, i.e. from `assemble_configdict()`.
+        incremental (bool): When `False`, always apply the config with `dictConfig()`.
+        validate (bool): When `False`, skip `validate_configdict()`, i.e. for a config that was already validated.
+
+    Returns:
+        (ApplyResult): What was created, closed, and updated.
+
+    Raises:
+        ConfigValidationError: When the config is invalid (a `ValueError`).
+
+    """
+    config = freeze(config)
+
+    with _STATE_LOCK:
+        if config.get("incremental"):
+            ## dictConfig's own incremental mode only updates levels, it does not replace the applied config
+            logging.config.dictConfig(config)
+
+            return ApplyResult(full=True)
+
+        if incremental and _STATE is not None and config == _STATE.config:
+            return ApplyResult()
+
+        if validate:
+            validate_configdict(config)
+
+        old_config: FrozenDict | None = _STATE.config if _STATE is not None else None
+
+        if (
+            not incremental
+            or _STATE is None
+            or config.get("version") != _STATE.config.get("version")
+        ):
+            result: ApplyResult = _full_apply(config)
+        else:
+            try:
+                result = _incremental_apply(_STATE, config)
+            except Exception as exc:
+                msg = Exception(
+                    f"Unhandled exception applying logging config incrementally. Details: {exc}"
+                )
+                log.error(msg)
+
+                raise exc
+
+        _configure_instrumentation(old_config, config, _STATE.handlers)
+
+        return result
+
+
+def _configure_instrumentation(
+    old_config: FrozenDict | None, config: FrozenDict, handlers: dict[str, logging.Handler]
+) -> None:
+    """Apply the settings in the config's `red_log` section (metrics, profiling) to the live handlers.
+
+    Skipped when neither the previous config nor this one has a `red_log` section, so metrics and
+    profiling started by hand (i.e. with `instrument_handler()`) are left alone.
+    """
+    if not config.get(RED_LOG_CONFIG_KEY) and not (old_config and old_config.get(RED_LOG_CONFIG_KEY)):
+        return
+
+    settings: t.Mapping[str, t.Any] = config.get(RED_LOG_CONFIG_KEY) or {}
+
+    from red_log.metrics import configure_metrics, configure_profiling
+
+    configure_metrics(settings.get("metrics"), handlers)
+    configure_profiling(settings.get("profiling"), handlers)
+
+
+def _incremental_apply(state: _AppliedState, config: FrozenDict) -> ApplyResult:
+    """Apply the differences between `state.config` and `config` to the live logging tree."""
+    global _STATE
+
+    result = ApplyResult()
+    old_config: FrozenDict = state.config
+
+    old_formatters = _section(old_config, "formatters")
+    new_formatters = _section(config, "formatters")
+    old_filters = _section(old_config, "filters")
+    new_filters = _section(config, "filters")
+    old_handlers = _section(old_config, "handlers")
+    new_handlers = _section(config, "handlers")
+
+    ## Build any formatters & filters that are new or changed, reuse the rest
+    configurator = logging.config.DictConfigurator(
+        {"version": 1, "formatters": {}, "filters": {}, "handlers": {}}
+    )
+
+    formatters: dict[str, logging.Formatter] = {}
+    for name, formatter_config in new_formatters.items():
+        if old_formatters.get(name) == formatter_config and name in state.formatters:
+            formatters[name] = state.formatters[name]
+        else:
+            formatters[name] = configurator.configure_formatter(
+                configurator.convert(thaw(formatter_config))
+            )
+
+    filters: dict[str, t.Any] = {}
+    for name, filter_config in new_filters.items():
+        if old_filters.get(name) == filter_config and name in state.filters:
+            filters[name] = state.filters[name]
+        else:
+            filters[name] = configurator.configure_filter(
+                configurator.convert(thaw(filter_config))
+            )
+
+    configurator.config["formatters"].update(formatters)
+    configurator.config["filters"].update(filters)
+
+    ## Decide which handlers to (re-)create, and which can be updated in place
+    recreate: set[str] = set()
+    for name, handler_config in new_handlers.items():
+        old_handler_config = old_handlers.get(name)
+        if old_handler_config is None or name not in state.handlers:
+            recreate.add(name)
+            continue
+
+        changed_keys: set[str] = {
+            key
+            for key in set(handler_config) | set(old_handler_config)
+            if handler_config.get(key) != old_handler_config.get(key)
+        }
+        if changed_keys - _IN_PLACE_HANDLER_KEYS:
+            recreate.add(name)
+
+    ## Handlers that refer to a re-created handler must be re-created to pick up the new object
+    references: dict[str, set[str]] = {
+        name: _handler_references(handler_config)
+        for name, handler_config in new_handlers.items()
+    }
+    while True:
+        dependents: set[str] = {
+            name
+            for name, refs in references.items()
+            if name not in recreate and refs & recreate
+        }
+        if not dependents:
+            break
+        recreate |= dependents
+
+    ## Create new handlers before closing old ones, so a failure leaves the current tree intact.
+    #  Handlers that refer to other handlers are created last, so the handlers they refer to exist.
+    live_handlers: dict[str, logging.Handler] = {
+        name: handler
+        for name, handler in state.handlers.items()
+        if name in new_handlers and name not in recreate
+    }
+    configurator.config["handlers"].update(live_handlers)
+
+    created: dict[str, logging.Handler] = {}
+    for name in sorted(recreate, key=lambda n: (bool(references[n]), n)):
+        try:
+            handler = configurator.configure_handler(
+                configurator.convert(thaw(new_handlers[name]))
+            )
+        except Exception:
+            for _handler in created.values():
+                _handler.close()
+
+            raise
+
+        created[name] = handler
+        configurator.config["handlers"][name] = handler
+
+    ## Close replaced & removed handlers. Handlers that refer to others (i.e. queue handlers, which
+    #  flush into the handlers they refer to) are closed first.
+    closing: list[str] = sorted(
+        (name for name in state.handlers if name not in live_handlers),
+        key=lambda n: (not _handler_references(old_handlers.get(n, {})), n),
+    )
+    for name in closing:
+        try:
+            state.handlers[name].close()
+        except Exception as exc:
+            log.warning(f"Error closing handler '{name}'. Details: {exc}")
+
+        result.closed_handlers.append(name)
+
+    ## Name the new handlers after closing the old ones, closing a handler unregisters its name
+    for name, handler in created.items():
+        handler.name = name
+        result.created_handlers.append(name)
+
+    ## Update the handlers that were kept
+    for name, handler in live_handlers.items():
+        handler_config = new_handlers[name]
+        updated: bool = False
+
+        level: int = level_to_int(handler_config.get("level") or logging.NOTSET)
+        if handler.level != level:
+            handler.setLevel(level)
+            updated = True
+
+        formatter_name = handler_config.get("formatter")
+        formatter = formatters.get(formatter_name) if formatter_name else None
+        if handler.formatter is not formatter:
+            handler.setFormatter(formatter)
+            updated = True
+
+        handler_filters: list = _resolve_filters(handler_config.get("filters"), filters)
+        if handler.filters != handler_filters:
+            handler.filters = handler_filters
+            updated = True
+
+        if updated:
+            result.updated_handlers.append(name)
+
+    handlers: dict[str, logging.Handler] = {**live_handlers, **created}
+
+    ## Update loggers
+    new_loggers = _logger_configs(config)
+    for name in {**_logger_configs(old_config), **new_loggers}:
+        logger: logging.Logger = _get_logger(name)
+        logger_config = new_loggers.get(name)
+
+        if logger_config is None:
+            ## Removed from the config, reset to defaults
+            logger_config = {"level": "NOTSET", "propagate": True}
+
+        if _update_logger(logger, logger_config, handlers, filters):
+            result.updated_loggers.append(name)
+
+    _STATE = _AppliedState(
+        config=config, formatters=formatters, filters=filters, handlers=handlers
+    )
+
+    return result
+
+
+def _update_logger(
+    logger: logging.Logger,
+    logger_config: t.Mapping[str, t.Any],
+    handlers: dict[str, logging.Handler],
+    filters: dict[str, t.Any],
+) -> bool:
+    """Make a logger match its config, return `True` if anything changed."""
+    updated: bool = False
+
+    level = logger_config.get("level")
+    if level is not None and logger.level != level_to_int(level):
+        logger.setLevel(level_to_int(level))
+        updated = True
+
+    propagate = logger_config.get("propagate")
+    if propagate is not None and logger.propagate != propagate:
+        logger.propagate = propagate
+        updated = True
+
+    if logger.disabled:
+        logger.disabled = False
+        updated = True
+
+    logger_handlers: list[logging.Handler] = [
+        handlers[h] for h in logger_config.get("handlers") or ()
+    ]
+    if logger.handlers != logger_handlers:
+        ## Swap the list instead of removing/adding handlers, so records logged by other threads
+        #  during the update always see a complete set of handlers
+        logger.handlers = logger_handlers
+        updated = True
+
+    logger_filters: list = _resolve_filters(logger_config.get("filters"), filters)
+    if logger.filters != logger_filters:
+        logger.filters = logger_filters
+        updated = True
+
+    return updated
@@ -0,0 +1,544 @@
+"""Tune logging in a running process: reload a config file, or change levels temporarily.
+
+`RuntimeController` re-applies a config file with `apply_configdict()` when the file changes (or on
+`SIGHUP`, or a `reload` command on its control socket), so only the levels, filters, and handlers that
+changed are touched, and open files/sockets are kept. It can also raise a logger or handler to a
+different level for a while (i.e. `DEBUG` during an incident), and set it back when the time is up.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import logging
+import math
+import os
+from pathlib import Path
+import signal
+import socket
+import stat
+import threading
+import time
+import typing as t
+
+from red_log.__levels import level_to_int
+from red_log.handlers import get_handler_by_name
+
+from ._apply import ApplyResult, apply_configdict, get_applied_configdict, get_applied_handler
+
+log = logging.getLogger("red_log.runtime")
+
+## Name of the root logger in commands and overrides
+ROOT_LOGGER_NAME: str = "root"
+
+## Maximum size of one control socket command
+_MAX_COMMAND_SIZE: int = 4096
+
+
+@dataclass
+class LevelOverride:
+    """A temporary level set with `RuntimeController.set_level()`/`set_handler_level()`.
+
+    Params:
+        kind (str): `logger` or `handler`.
+        name (str): The logger's name (`root` for the root logger), or the handler's name.
+        level (int): The level set.
+        previous_level (int): The level before the override, restored if the config does not set one.
+        expires (float | None): `time.monotonic()` time the override ends at. `None` lasts until it is reset.
+    """
+
+    kind: str
+    name: str
+    level: int
+    previous_level: int
+    expires: float | None = None
+
+    def as_dict(self) -> dict[str, t.Any]:
+        remaining: float | None = (
+            None if self.expires is None else max(0.0, self.expires - time.monotonic())
+        )
+
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "level": logging.getLevelName(self.level),
+            "previous_level": logging.getLevelName(self.previous_level),
+            "remaining": remaining,
+        }
+
+
+class RuntimeController:
+    """Reload a logging config file, and change levels temporarily, without re-creating handlers.
+
+    Started with `start()` (or as a context manager), the controller:
+
+    - Applies `config_file` (loaded with `red_log.helpers.load_configdict()`), and applies it again when the
+      file's mtime or size changes (checked every `poll_interval` seconds). Configs are applied with
+      `apply_configdict()`, so only what changed is updated in place. An invalid file is logged and ignored,
+      the running config is kept.
+    - When `handle_sighup=True`, reloads `config_file` on `SIGHUP` (POSIX, main thread only).
+    - When `control_socket` is set, listens on a Unix domain socket at that path (mode `0600`) for
+      one-line commands, and answers each with one line, `ok <json>` or `error <message>`:
+        - `reload`: reload `config_file`.
+        - `set-level <logger> <level> [seconds]`: set a logger's level (`root` for the root logger).
+        - `set-handler-level <handler> <level> [seconds]`: set a handler's level.
+        - `reset <logger|handler>`: end an override early.
+        - `status`: the active overrides.
+
+    Level overrides last `seconds` (or until reset), and survive config reloads. When one ends, the level
+    from the applied config is restored, or the level from before the override if the config does not set one.
+
+    Usage:
+        ```python title="Runtime controller" linenums="1"
+        controller = RuntimeController("logging.toml", control_socket="/run/app/logging.sock")
+
+        with controller:
+            ## i.e. from an admin endpoint, or `echo "set-level app DEBUG 300" | nc -U /run/app/logging.sock`
+            controller.set_level("app", "DEBUG", duration=300)
+            ...
+        ```
+
+    Params:
+        config_file (str | Path | None): A JSON, TOML, or YAML logging config file.
+        poll_interval (float): Seconds between checks of `config_file` for changes.
+        cache_dir (str | Path | None): Passed to `load_configdict()`.
+        control_socket (str | Path | None): Path of the Unix domain control socket. An existing socket at the
+            path (i.e. left by a crashed process) is replaced; any other file there is an error.
+        handle_sighup (bool): When `True`, reload `config_file` on `SIGHUP`.
+        apply_on_start (bool): When `True`, `start()` applies `config_file` before returning.
+    """
+
+    def __init__(
+        self,
+        config_file: t.Union[str, Path] | None = None,
+        poll_interval: float = 2.0,
+        cache_dir: t.Union[str, Path] | None = None,
+        control_socket: t.Union[str, Path] | None = None,
+        handle_sighup: bool = False,
+        apply_on_start: bool = True,
+    ) -> None:
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be greater than 0.")
+        if handle_sighup and config_file is None:
+            raise ValueError("handle_sighup needs a config_file to reload.")
+        if handle_sighup and not hasattr(signal, "SIGHUP"):
+            raise ValueError("handle_sighup is not supported on this platform.")
+
+        self.config_file: Path | None = None if config_file is None else Path(config_file).expanduser()
+        self.poll_interval = poll_interval
+        self.cache_dir = cache_dir
+        self.control_socket: str | None = None if control_socket is None else os.fspath(control_socket)
+        self.handle_sighup = handle_sighup
+        self.apply_on_start = apply_on_start
+
+        ## (kind, name) -> override
+        self._overrides: dict[tuple[str, str], LevelOverride] = {}
+        self._lock = threading.RLock()
+        ## Set to wake the watcher thread, i.e. for a new override or a SIGHUP
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._reload_requested: bool = False
+        ## (mtime ns, size) of config_file when it was last loaded
+        self._file_signature: tuple[int, int] | None = None
+        self._missing_logged: bool = False
+
+        self._watcher: threading.Thread | None = None
+        self._listener: threading.Thread | None = None
+        self._server: socket.socket | None = None
+        self._previous_sighup: t.Any = None
+
+    ## Config file
+
+    def _get_file_signature(self) -> tuple[int, int] | None:
+        try:
+            stat: os.stat_result = self.config_file.stat()
+        except FileNotFoundError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def reload(self) -> ApplyResult | None:
+        """Load and apply `config_file` now, then re-apply the active level overrides.
+
+        Returns:
+            (ApplyResult | None): What the apply changed, or `None` if the file could not be loaded or applied
+                (the error is logged, and the running config is kept).
+
+        """
+        if self.config_file is None:
+            raise ValueError("RuntimeController has no config_file to reload.")
+
+        from red_log.helpers import load_configdict
+
+        with self._lock:
+            signature: tuple[int, int] | None = self._get_file_signature()
+            try:
+                config = load_configdict(self.config_file, cache_dir=self.cache_dir)
+                result: ApplyResult = apply_configdict(config)
+            except Exception as exc:
+                log.error(f"Could not apply logging config file '{self.config_file}'. Details: {exc}")
+                ## Do not retry until the file changes again
+                self._file_signature = signature
+
+                return None
+
+            self._file_signature = signature
+            self._missing_logged = False
+            self._apply_overrides()
+
+        if result.changed:
+            log.info(f"Applied logging config file '{self.config_file}': {result}")
+
+        return result
+
+    def _check_config_file(self) -> None:
+        signature: tuple[int, int] | None = self._get_file_signature()
+        if signature is None:
+            if not self._missing_logged:
+                log.warning(f"Logging config file '{self.config_file}' does not exist.")
+                self._missing_logged = True
+
+            return
+
+        if signature != self._file_signature:
+            self.reload()
+
+    ## Level overrides
+
+    def _get_target(self, kind: str, name: str) -> logging.Logger | logging.Handler:
+        if kind == "logger":
+            return logging.getLogger(None if name == ROOT_LOGGER_NAME else name)
+
+        handler: logging.Handler | None = get_applied_handler(name) or get_handler_by_name(name)
+        if handler is None:
+            raise ValueError(f"No handler named '{name}'.")
+
+        return handler
+
+    def _get_configured_level(self, kind: str, name: str) -> int | None:
+        """Return the level the applied config sets for a logger/handler, or `None`."""
+        config: t.Mapping[str, t.Any] | None = get_applied_configdict()
+        if config is None:
+            return None
+
+        if kind == "handler":
+            section: t.Any = (config.get("handlers") or {}).get(name)
+            ## dictConfig() leaves handlers at NOTSET when they have no level
+            return level_to_int(section.get("level") or logging.NOTSET) if section is not None else None
+
+        if name == ROOT_LOGGER_NAME:
+            section = config.get("root")
+        else:
+            section = (config.get("loggers") or {}).get(name)
+
+        if section is None or section.get("level") is None:
+            return None
+
+        return level_to_int(section["level"])
+
+    def _set_override(
+        self, kind: str, name: str, level: t.Union[int, str], duration: float | None
+    ) -> LevelOverride:
+        if duration is not None and not (math.isfinite(duration) and duration > 0):
+            raise ValueError("duration must be a finite number greater than 0.")
+
+        level_no: int = level_to_int(level)
+
+        with self._lock:
+            target = self._get_target(kind, name)
+            existing: LevelOverride | None = self._overrides.get((kind, name))
+            override = LevelOverride(
+                kind=kind,
+                name=name,
+                level=level_no,
+                previous_level=existing.previous_level if existing else target.level,
+                expires=None if duration is None else time.monotonic() + duration,
+            )
+            self._overrides[(kind, name)] = override
+            target.setLevel(level_no)
+
+        self._wake.set()
+        log.info(
+            f"Set {kind} '{name}' level to {logging.getLevelName(level_no)}"
+            + (f" for {duration} second(s)." if duration is not None else ".")
+        )
+
+        return override
+
+    def set_level(
+        self, name: str, level: t.Union[int, str], duration: float | None = None
+    ) -> LevelOverride:
+        """Set a logger's level, in place, optionally for `duration` seconds.
+
+        Params:
+            name (str): The logger's name. `root` (or `""`) is the root logger.
+            level (int | str): The level.
+            duration (float | None): Seconds until the level is set back. `None` keeps it until `reset()`.
+
+        Returns:
+            (LevelOverride): The override.
+
+        """
+        return self._set_override("logger", name or ROOT_LOGGER_NAME, level, duration)
+
+    def set_handler_level(
+        self, name: str, level: t.Union[int, str], duration: float | None = None
+    ) -> LevelOverride:
+        """Set a handler's level, in place, optionally for `duration` seconds.
+
+        Params:
+            name (str): The handler's name in the applied config.
+            level (int | str): The level.
+            duration (float | None): Seconds until the level is set back. `None` keeps it until `reset()`.
+
+        Returns:
+            (LevelOverride): The override.
+
+        """
+        return self._set_override("handler", name, level, duration)
+
+    def reset(self, name: str) -> bool:
+        """End the overrides of the logger and/or handler called `name`, restoring their levels.
+
+        Returns:
+            (bool): `True` if there was an override to end.
+
+        """
+        name = name or ROOT_LOGGER_NAME
+
+        with self._lock:
+            overrides: list[LevelOverride] = [
+                self._overrides.pop(key) for key in list(self._overrides) if key[1] == name
+            ]
+            for override in overrides:
+                self._restore(override)
+
+        return bool(overrides)
+
+    def get_overrides(self) -> list[LevelOverride]:
+        """Return the active level overrides."""
+        with self._lock:
+            return list(self._overrides.values())
+
+    def _restore(self, override: LevelOverride) -> None:
+        configured: int | None = self._get_configured_level(override.kind, override.name)
+        level: int = override.previous_level if configured is None else configured
+
+        try:
+            self._get_target(override.kind, override.name).setLevel(level)
+        except ValueError:
+            ## The handler was removed from the config
+            return
+
+        log.info(f"Restored {override.kind} '{override.name}' level to {logging.getLevelName(level)}.")
+
+    def _apply_overrides(self) -> None:
+        """Set the override levels again, after a reload may have changed them."""
+        for override in self._overrides.values():
+            try:
+                self._get_target(override.kind, override.name).setLevel(override.level)
+            except ValueError:
+                pass
+
+    def _expire_overrides(self) -> float | None:
+        """Restore the overrides that have ended. Returns the seconds until the next one ends, or `None`."""
+        now: float = time.monotonic()
+        next_expiry: float | None = None
+
+        with self._lock:
+            for key, override in list(self._overrides.items()):
+                if override.expires is None:
+                    continue
+                if override.expires <= now:
+                    del self._overrides[key]
+                    self._restore(override)
+                elif next_expiry is None or override.expires < next_expiry:
+                    next_expiry = override.expires
+
+        return None if next_expiry is None else next_expiry - now
+
+    ## Background threads
+
+    def _watch(self) -> None:
+        """Check the config file and expire overrides, until stopped."""
+        while not self._stop.is_set():
+            try:
+                if self._reload_requested:
+                    self._reload_requested = False
+                    self.reload()
+                elif self.config_file is not None:
+                    self._check_config_file()
+
+                until_expiry: float | None = self._expire_overrides()
+            except Exception as exc:
+                log.error(f"Unhandled exception in logging RuntimeController. Details: {exc}")
+                until_expiry = None
+
+            timeout: float = self.poll_interval if self.config_file is not None else 3600.0
+            if until_expiry is not None:
+                timeout = min(timeout, until_expiry)
+
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def handle_command(self, command: str) -> str:
+        """Run one control command (see the class docstring), and return the response line."""
+        parts: list[str] = command.split()
+        if not parts:
+            return "error empty command"
+
+        action, args = parts[0].lower(), parts[1:]
+
+        try:
+            if action == "reload" and not args:
+                result: ApplyResult | None = self.reload()
+                if result is None:
+                    return "error config file could not be applied, see the logs"
+
+                return f"ok {json.dumps({'changed': result.changed})}"
+
+            if action in ("set-level", "set-handler-level") and len(args) in (2, 3):
+                duration: float | None = float(args[2]) if len(args) == 3 else None
+                set_override = self.set_level if action == "set-level" else self.set_handler_level
+                override: LevelOverride = set_override(args[0], args[1], duration=duration)
+
+                return f"ok {json.dumps(override.as_dict())}"
+
+            if action == "reset" and len(args) == 1:
+                return f"ok {json.dumps({'reset': self.reset(args[0])})}"
+
+            if action == "status" and not args:
+                return f"ok {json.dumps([override.as_dict() for override in self.get_overrides()])}"
+        except ValueError as exc:
+            return f"error {exc}"
+
+        return f"error invalid command '{command.strip()}'"
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        with conn:
+            conn.settimeout(5.0)
+            data: bytes = b""
+            try:
+                while b"\n" not in data and len(data) < _MAX_COMMAND_SIZE:
+                    chunk: bytes = conn.recv(_MAX_COMMAND_SIZE)
+                    if not chunk:
+                        break
+                    data += chunk
+
+                response: str = self.handle_command(data.split(b"\n", 1)[0].decode("utf-8", "replace"))
+                conn.sendall(f"{response}\n".encode("utf-8"))
+            except OSError as exc:
+                log.warning(f"Logging control socket connection failed. Details: {exc}")
+
+    def _listen(self) -> None:
+        """Answer control socket commands, one connection at a time, until stopped."""
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                ## Closed by stop()
+                break
+
+            self._serve_connection(conn)
+
+    def _open_control_socket(self) -> None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("control_socket needs Unix domain sockets, which this platform does not support.")
+
+        try:
+            mode: int | None = os.lstat(self.control_socket).st_mode
+        except FileNotFoundError:
+            mode = None
+
+        if mode is not None:
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"control_socket '{self.control_socket}' exists and is not a socket.")
+
+            os.remove(self.control_socket)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.control_socket)
+            os.chmod(self.control_socket, 0o600)
+            server.listen()
+            ## Wake up regularly to check for stop()
+            server.settimeout(0.5)
+        except BaseException:
+            server.close()
+            raise
+
+        self._server = server
+
+    def _on_sighup(self, signum: int, frame: t.Any) -> None:
+        ## Reload on the watcher thread, the interrupted code may hold logging's locks
+        self._reload_requested = True
+        self._wake.set()
+
+    def start(self) -> RuntimeController:
+        """Apply `config_file` (if `apply_on_start`), and start watching it and the control socket."""
+        if self._watcher is not None:
+            return self
+
+        if self.config_file is not None and self.apply_on_start:
+            self.reload()
+
+        self._stop.clear()
+
+        if self.control_socket is not None:
+            self._open_control_socket()
+            self._listener = threading.Thread(
+                target=self._listen, name=f"red_log-RuntimeController-{self.control_socket}", daemon=True
+            )
+            self._listener.start()
+
+        if self.handle_sighup:
+            self._previous_sighup = signal.signal(signal.SIGHUP, self._on_sighup)
+
+        self._watcher = threading.Thread(
+            target=self._watch, name=f"red_log-RuntimeController-{id(self)}", daemon=True
+        )
+        self._watcher.start()
+
+        return self
+
+    def stop(self, restore_levels: bool = True) -> None:
+        """Stop watching, close the control socket, and (when `restore_levels`) end the level overrides."""
+        if self._watcher is None:
+            return
+
+        self._stop.set()
+        self._wake.set()
+
+        if self.handle_sighup and self._previous_sighup is not None:
+            signal.signal(signal.SIGHUP, self._previous_sighup)
+            self._previous_sighup = None
+
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            if self._listener is not threading.current_thread():
+                self._listener.join()
+            self._listener = None
+            try:
+                os.remove(self.control_socket)
+            except OSError:
+                pass
+
+        if self._watcher is not threading.current_thread():
+            self._watcher.join()
+        self._watcher = None
+
+        if restore_levels:
+            with self._lock:
+                overrides: list[LevelOverride] = list(self._overrides.values())
+                self._overrides.clear()
+                for override in overrides:
+                    self._restore(override)
+
+    def __enter__(self) -> RuntimeController:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
@@ -0,0 +1,222 @@
+"""Multiprocess-safe logging: workers send records over a queue to one writer process.
+
+Several processes writing to the same (rotating) log file race each other on rotation and
+interleave partial lines. With `MultiprocessLogWriter`, only one dedicated writer process
+owns the file/stream/socket handlers. Every other process (the parent and its workers) is
+configured with a single `QueueHandler` that sends records to the writer over a
+`multiprocessing` queue.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.config
+import logging.handlers
+import multiprocessing
+import multiprocessing.context
+import multiprocessing.queues
+import threading
+import typing as t
+
+from red_log.config_classes.base import FrozenDict, freeze, thaw
+
+from ._apply import apply_configdict
+
+log = logging.getLogger("red_log.runtime")
+
+## Name of the QueueHandler in worker process configs
+WORKER_QUEUE_HANDLER_NAME: str = "red_log_multiprocess_queue"
+
+
+def get_worker_configdict(
+    configdict: t.Mapping[str, t.Any], queue: multiprocessing.queues.Queue
+) -> FrozenDict:
+    """Build the logging config for a process that sends its records to a `MultiprocessLogWriter`.
+
+    The root logger gets one `QueueHandler`. Every logger in `configdict` keeps its level, but has no
+    handlers and propagates to the root logger, so each record is put on the queue exactly once. The
+    writer process then routes records through the loggers in `configdict`, so each record is still
+    written only by the handlers of the logger it was logged to.
+
+    Params:
+        configdict (Mapping[str, Any]): The logging config the writer process applies.
+        queue (multiprocessing.Queue): The queue the writer process reads from.
+
+    Returns:
+        (FrozenDict): A logging dictConfig for worker processes.
+
+    """
+    root: t.Mapping[str, t.Any] = configdict.get("root") or {}
+
+    return freeze(
+        {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "handlers": {
+                WORKER_QUEUE_HANDLER_NAME: {
+                    "class": "logging.handlers.QueueHandler",
+                    "queue": queue,
+                }
+            },
+            "loggers": {
+                name: {
+                    "level": logger_config.get("level", "NOTSET"),
+                    "handlers": [],
+                    "propagate": True,
+                }
+                for name, logger_config in (configdict.get("loggers") or {}).items()
+            },
+            "root": {
+                "level": root.get("level", "WARNING"),
+                "handlers": [WORKER_QUEUE_HANDLER_NAME],
+            },
+        }
+    )
+
+
+def configure_worker(worker_configdict: t.Mapping[str, t.Any]) -> None:
+    """Configure logging in a worker process.
+
+    Pass this function as a process pool's `initializer` (i.e. `MultiprocessLogWriter.worker_initializer`),
+    or call it at the start of a `multiprocessing.Process` target. Processes started with the `spawn` or
+    `forkserver` methods do not inherit the parent's logging config, so they must call it; calling it in
+    `fork`ed processes is harmless.
+
+    Params:
+        worker_configdict (Mapping[str, Any]): A config from `get_worker_configdict()`.
+
+    """
+    apply_configdict(worker_configdict, incremental=False)
+
+
+def _writer_main(
+    queue: multiprocessing.queues.Queue, configdict: t.Mapping[str, t.Any]
+) -> None:
+    """Entry point of the writer process: apply `configdict`, then handle records until a `None` sentinel."""
+    config: dict[str, t.Any] = thaw(configdict)
+    ## Loggers inherited from a forked parent must stay enabled, the writer handles their records
+    config["disable_existing_loggers"] = False
+
+    logging.config.dictConfig(config)
+
+    while True:
+        record: logging.LogRecord | None = queue.get()
+        if record is None:
+            break
+
+        logger: logging.Logger = (
+            logging.getLogger()
+            if record.name == "root"
+            else logging.getLogger(record.name)
+        )
+        logger.handle(record)
+
+    logging.shutdown()
+
+
+class MultiprocessLogWriter:
+    """Run a dedicated process that owns all log handlers, and receives records from other processes.
+
+    Usage:
+        ```python title="Multiprocess logging" linenums="1"
+        writer = MultiprocessLogWriter(configdict)
+
+        with writer:
+            ## Log from this process through the writer, too
+            writer.configure_worker()
+
+            with ProcessPoolExecutor(
+                initializer=writer.worker_initializer, initargs=writer.worker_initargs
+            ) as pool:
+                ...
+        ```
+
+    Params:
+        configdict (Mapping[str, Any]): The logging config for the writer process, i.e. from `assemble_configdict()`.
+            It must be picklable when using the `spawn`/`forkserver` start methods.
+        start_method (str | None): The `multiprocessing` start method (`fork`, `spawn`, `forkserver`). Defaults
+            to the platform default. Use the same method as the processes that will log.
+        queue_maxsize (int): Maximum number of records waiting for the writer. `0` is unbounded.
+    """
+
+    def __init__(
+        self,
+        configdict: t.Mapping[str, t.Any],
+        start_method: str | None = None,
+        queue_maxsize: int = 0,
+    ) -> None:
+        self.configdict: FrozenDict = freeze(configdict)
+        self.context: multiprocessing.context.BaseContext = multiprocessing.get_context(
+            start_method
+        )
+        self.queue: multiprocessing.queues.Queue = self.context.Queue(queue_maxsize)
+        self.worker_configdict: FrozenDict = get_worker_configdict(
+            self.configdict, self.queue
+        )
+        self.process: multiprocessing.process.BaseProcess | None = None
+
+        self._lock = threading.Lock()
+
+    @property
+    def worker_initializer(self) -> t.Callable[[t.Mapping[str, t.Any]], None]:
+        """The `initializer` to pass to a process pool, so its workers log through the writer."""
+        return configure_worker
+
+    @property
+    def worker_initargs(self) -> tuple[FrozenDict]:
+        """The `initargs` to pass to a process pool along with `worker_initializer`."""
+        return (self.worker_configdict,)
+
+    def configure_worker(self) -> None:
+        """Configure logging in the current process to send records to the writer."""
+        configure_worker(self.worker_configdict)
+
+    def start(self) -> MultiprocessLogWriter:
+        """Start the writer process, if it is not already running."""
+        with self._lock:
+            if self.process is not None:
+                return self
+
+            self.process = self.context.Process(
+                target=_writer_main,
+                args=(self.queue, self.configdict),
+                name="red_log-log-writer",
+            )
+            self.process.start()
+
+            atexit.register(self.stop)
+
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the writer process after it has written all queued records.
+
+        Params:
+            timeout (float | None): Seconds to wait for the writer to finish. `None` waits until it is done.
+
+        """
+        with self._lock:
+            if self.process is None:
+                return
+
+            atexit.unregister(self.stop)
+
+            try:
+                ## Records put on the queue by this process before the sentinel are written first
+                self.queue.put(None)
+                self.process.join(timeout)
+            except Exception as exc:
+                log.error(f"Unhandled exception stopping log writer process. Details: {exc}")
+            finally:
+                if self.process.is_alive():
+                    log.warning("Log writer process did not stop in time, terminating it.")
+                    self.process.terminate()
+
+                self.process = None
+
+    def __enter__(self) -> MultiprocessLogWriter:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
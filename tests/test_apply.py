@@ -0,0 +1,190 @@
+"""apply_configdict() only changes the parts of the logging tree that differ from the last applied config."""
+
+from __future__ import annotations
+
+import copy
+import logging
+from pathlib import Path
+import typing as t
+
+import pytest
+
+from red_log.runtime import apply_configdict, get_applied_handler, reset_applied_configdict
+
+LOGGER_NAME: str = "test_apply"
+
+
+def make_config(log_file: Path) -> dict[str, t.Any]:
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "plain": {"format": "%(message)s"},
+            "verbose": {"format": "%(levelname)s %(message)s"},
+        },
+        "filters": {
+            "only_test": {"name": LOGGER_NAME},
+        },
+        "handlers": {
+            "file": {
+                "class": "logging.FileHandler",
+                "filename": str(log_file),
+                "level": "INFO",
+                "formatter": "plain",
+            },
+            "null": {"class": "logging.NullHandler"},
+        },
+        "loggers": {
+            LOGGER_NAME: {
+                "level": "DEBUG",
+                "handlers": ["file", "null"],
+                "filters": ["only_test"],
+                "propagate": False,
+            },
+        },
+    }
+
+
+@pytest.fixture
+def config(tmp_path: Path):
+    reset_applied_configdict()
+
+    yield make_config(tmp_path / "test.log")
+
+    for name in ("file", "null"):
+        handler = get_applied_handler(name)
+        if handler is not None:
+            handler.close()
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.handlers = []
+    logger.filters = []
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+
+    reset_applied_configdict()
+
+
+def test_first_apply_is_full(config: dict):
+    result = apply_configdict(config)
+
+    assert result.full
+    logger = logging.getLogger(LOGGER_NAME)
+    assert logger.handlers == [get_applied_handler("file"), get_applied_handler("null")]
+
+
+def test_unchanged_config_is_a_no_op(config: dict):
+    apply_configdict(config)
+    handler = get_applied_handler("file")
+
+    result = apply_configdict(copy.deepcopy(config))
+
+    assert not result.full
+    assert not (
+        result.created_handlers
+        or result.closed_handlers
+        or result.updated_handlers
+        or result.updated_loggers
+    )
+    assert get_applied_handler("file") is handler
+
+
+def test_level_and_formatter_changes_update_handler_in_place(config: dict):
+    apply_configdict(config)
+    handler = get_applied_handler("file")
+    stream = handler.stream
+
+    config["handlers"]["file"]["level"] = "WARNING"
+    config["handlers"]["file"]["formatter"] = "verbose"
+    result = apply_configdict(config)
+
+    assert result.updated_handlers == ["file"]
+    assert result.created_handlers == [] and result.closed_handlers == []
+    assert get_applied_handler("file") is handler
+    assert handler.stream is stream
+    assert handler.level == logging.WARNING
+
+    logging.getLogger(LOGGER_NAME).warning("hello")
+    handler.flush()
+    assert Path(handler.baseFilename).read_text() == "WARNING hello\n"
+
+
+def test_changed_arguments_recreate_handler(config: dict, tmp_path: Path):
+    apply_configdict(config)
+    old_handler = get_applied_handler("file")
+    null_handler = get_applied_handler("null")
+
+    config["handlers"]["file"]["filename"] = str(tmp_path / "other.log")
+    result = apply_configdict(config)
+
+    new_handler = get_applied_handler("file")
+    assert result.created_handlers == ["file"]
+    assert result.closed_handlers == ["file"]
+    assert new_handler is not old_handler
+    assert new_handler.name == "file"
+    assert old_handler.stream is None
+    ## Untouched handlers are kept, and the logger points at the new handler
+    assert get_applied_handler("null") is null_handler
+    assert logging.getLogger(LOGGER_NAME).handlers == [new_handler, null_handler]
+    assert result.updated_loggers == [LOGGER_NAME]
+
+
+def test_removed_handler_is_closed(config: dict):
+    apply_configdict(config)
+    old_handler = get_applied_handler("file")
+
+    del config["handlers"]["file"]
+    config["loggers"][LOGGER_NAME]["handlers"] = ["null"]
+    result = apply_configdict(config)
+
+    assert result.closed_handlers == ["file"]
+    assert get_applied_handler("file") is None
+    assert old_handler.stream is None
+    assert logging.getLogger(LOGGER_NAME).handlers == [get_applied_handler("null")]
+
+
+def test_logger_filters_are_kept_across_applies(config: dict):
+    apply_configdict(config)
+    logger = logging.getLogger(LOGGER_NAME)
+    logger_filter = logger.filters[0]
+
+    ## Change something unrelated, the logger's filter object is reused
+    config["handlers"]["file"]["level"] = "ERROR"
+    apply_configdict(config)
+
+    assert logger.filters == [logger_filter]
+
+    ## Change the filter, the logger gets the new one
+    config["filters"]["only_test"]["name"] = "something_else"
+    result = apply_configdict(config)
+
+    assert LOGGER_NAME in result.updated_loggers
+    assert len(logger.filters) == 1 and logger.filters[0] is not logger_filter
+    assert logger.filters[0].name == "something_else"
+
+
+def test_removed_logger_is_reset(config: dict):
+    apply_configdict(config)
+
+    del config["loggers"][LOGGER_NAME]
+    result = apply_configdict(config)
+
+    logger = logging.getLogger(LOGGER_NAME)
+    assert result.updated_loggers == [LOGGER_NAME]
+    assert logger.handlers == []
+    assert logger.filters == []
+    assert logger.level == logging.NOTSET
+    assert logger.propagate
+
+
+def test_invalid_config_leaves_tree_untouched(config: dict):
+    apply_configdict(config)
+    handler = get_applied_handler("file")
+
+    config["loggers"][LOGGER_NAME]["handlers"] = ["file", "does_not_exist"]
+    with pytest.raises(ValueError):
+        apply_configdict(config)
+
+    assert get_applied_handler("file") is handler
+    assert handler.stream is not None
+    assert logging.getLogger(LOGGER_NAME).handlers[0] is handler
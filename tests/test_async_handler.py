@@ -0,0 +1,163 @@
+"""AsyncHandler buffers records on the event loop, and applies its overflow policy when the buffer is full."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+
+from red_log.handlers import AsyncHandler
+
+
+class ListHandler(logging.Handler):
+    """Collect the messages of the records it handles, and the threads it handled them on."""
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.messages: list[str] = []
+        self.threads: set[int] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+        self.threads.add(threading.get_ident())
+
+
+def make_record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.makeLogRecord({"name": "test", "msg": msg, "levelno": level})
+
+
+def test_invalid_overflow_policy():
+    with pytest.raises(ValueError):
+        AsyncHandler(overflow="drop_everything")
+
+
+def test_writes_synchronously_without_loop():
+    target = ListHandler()
+    handler = AsyncHandler(handlers=[target])
+    try:
+        handler.handle(make_record("no loop"))
+
+        assert target.messages == ["no loop"]
+        assert target.threads == {threading.get_ident()}
+        assert handler.pending == 0
+    finally:
+        handler.close()
+
+
+def test_drain_writes_off_the_loop_thread():
+    target = ListHandler()
+    handler = AsyncHandler(handlers=[target], batch_size=3)
+
+    async def main() -> None:
+        for i in range(10):
+            handler.handle(make_record(f"record {i}"))
+
+        assert handler.pending == 10
+
+        await handler.drain()
+
+        assert handler.pending == 0
+        assert threading.get_ident() not in target.threads
+
+    try:
+        asyncio.run(main())
+    finally:
+        handler.close()
+
+    assert target.messages == [f"record {i}" for i in range(10)]
+    assert handler.dropped == 0
+
+
+@pytest.mark.parametrize(
+    ("overflow", "expected"),
+    [
+        ("drop_new", ["record 0", "record 1", "record 2"]),
+        ("drop_oldest", ["record 7", "record 8", "record 9"]),
+        ("block", [f"record {i}" for i in range(10)]),
+    ],
+)
+def test_overflow_policy_on_loop(overflow: str, expected: list[str]):
+    target = ListHandler()
+    handler = AsyncHandler(handlers=[target], capacity=3, overflow=overflow)
+
+    async def main() -> None:
+        ## The drain task cannot run until the loop is awaited, so the buffer fills up
+        for i in range(10):
+            handler.handle(make_record(f"record {i}"))
+
+        await handler.drain()
+
+    try:
+        asyncio.run(main())
+    finally:
+        handler.close()
+
+    assert target.messages == expected
+    assert handler.dropped == 10 - len(expected)
+
+
+def test_block_waits_for_room_off_the_loop():
+    target = ListHandler()
+    handler = AsyncHandler(handlers=[target], capacity=3, overflow="block")
+
+    async def main() -> None:
+        for i in range(3):
+            handler.handle(make_record(f"record {i}"))
+
+        thread = threading.Thread(target=handler.handle, args=(make_record("from thread"),))
+        thread.start()
+        ## Keep the loop busy, the thread must wait for the drain task to make room
+        time.sleep(0.2)
+
+        assert thread.is_alive()
+        assert handler.pending == 3
+
+        await asyncio.to_thread(thread.join, 5.0)
+        await handler.drain()
+
+        assert not thread.is_alive()
+
+    try:
+        asyncio.run(main())
+    finally:
+        handler.close()
+
+    assert target.messages == ["record 0", "record 1", "record 2", "from thread"]
+    assert handler.dropped == 0
+
+
+def test_loop_shutdown_writes_buffered_records():
+    target = ListHandler()
+    handler = AsyncHandler(handlers=[target])
+
+    async def main() -> None:
+        for i in range(5):
+            handler.handle(make_record(f"record {i}"))
+        ## Return without draining, asyncio.run() cancels the drain task
+
+    try:
+        asyncio.run(main())
+
+        assert target.messages == [f"record {i}" for i in range(5)]
+    finally:
+        handler.close()
+
+
+def test_respects_handler_level():
+    target = ListHandler(level=logging.WARNING)
+    handler = AsyncHandler(handlers=[target])
+
+    async def main() -> None:
+        handler.handle(make_record("info", logging.INFO))
+        handler.handle(make_record("warning", logging.WARNING))
+        await handler.drain()
+
+    try:
+        asyncio.run(main())
+    finally:
+        handler.close()
+
+    assert target.messages == ["warning"]
@@ -0,0 +1,173 @@
+"""BatchingSocketHandler against a local TCP collector."""
+
+from __future__ import annotations
+
+import logging
+import pickle
+import queue
+import socket
+import socketserver
+import threading
+import time
+
+import pytest
+
+from red_log.handlers import BatchingSocketHandler
+from red_log.handlers._batching_socket import FRAME_HEADER
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    ## Rebind the port of a collector that was down
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class Collector:
+    """A TCP server on 127.0.0.1 that reads length-prefixed frames, and queues the messages of each batch."""
+
+    def __init__(self, port: int = 0) -> None:
+        self.batches: queue.Queue[list[str]] = queue.Queue()
+        batches = self.batches
+
+        class FrameHandler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                while True:
+                    header: bytes = self.rfile.read(FRAME_HEADER.size)
+                    if len(header) < FRAME_HEADER.size:
+                        return
+
+                    length: int = FRAME_HEADER.unpack(header)[0]
+                    payload: bytes = self.rfile.read(length)
+                    assert len(payload) == length
+
+                    batches.put([record_dict["msg"] for record_dict in pickle.loads(payload)])
+
+        self.server = _Server(("127.0.0.1", port), FrameHandler)
+        self.port: int = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def get_messages(self, count: int, timeout: float = 5.0) -> tuple[list[list[str]], list[str]]:
+        """Wait for `count` messages, return them by batch and flattened."""
+        batches: list[list[str]] = []
+        messages: list[str] = []
+        deadline: float = time.monotonic() + timeout
+
+        while len(messages) < count:
+            batch: list[str] = self.batches.get(timeout=max(0.0, deadline - time.monotonic()))
+            batches.append(batch)
+            messages.extend(batch)
+
+        return batches, messages
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def get_free_port() -> int:
+    """Return a port nothing is listening on."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+
+        return sock.getsockname()[1]
+
+
+def make_record(msg: str) -> logging.LogRecord:
+    return logging.makeLogRecord({"name": "test", "msg": msg, "levelno": logging.INFO})
+
+
+@pytest.fixture
+def collector():
+    collector = Collector()
+    yield collector
+    collector.close()
+
+
+def test_sends_batches_as_frames(collector: Collector):
+    handler = BatchingSocketHandler("127.0.0.1", collector.port, batch_size=5, flush_interval=10_000)
+    try:
+        for i in range(10):
+            handler.emit(make_record(f"record {i}"))
+
+        batches, messages = collector.get_messages(10)
+    finally:
+        handler.close()
+
+    assert batches == [[f"record {i}" for i in range(5)], [f"record {i}" for i in range(5, 10)]]
+    assert handler.dropped == 0
+
+
+def test_flush_interval_sends_partial_batch(collector: Collector):
+    handler = BatchingSocketHandler("127.0.0.1", collector.port, batch_size=100, flush_interval=50)
+    try:
+        handler.emit(make_record("alone"))
+
+        batches, _ = collector.get_messages(1)
+    finally:
+        handler.close()
+
+    assert batches == [["alone"]]
+
+
+def test_delivers_records_buffered_during_outage_in_order():
+    port: int = get_free_port()
+    handler = BatchingSocketHandler(
+        "127.0.0.1", port, batch_size=4, flush_interval=10, retry_start=0.05, retry_max=0.1
+    )
+    collector: Collector | None = None
+    try:
+        for i in range(10):
+            handler.emit(make_record(f"record {i}"))
+        ## Let the sender fail to connect, and start backing off
+        time.sleep(0.2)
+
+        collector = Collector(port)
+        _, messages = collector.get_messages(10)
+    finally:
+        handler.close()
+        if collector is not None:
+            collector.close()
+
+    assert messages == [f"record {i}" for i in range(10)]
+    assert handler.dropped == 0
+
+
+def test_drops_oldest_records_when_buffer_is_full():
+    port: int = get_free_port()
+    handler = BatchingSocketHandler(
+        "127.0.0.1", port, batch_size=5, capacity=5, flush_interval=10, retry_start=60.0
+    )
+    collector: Collector | None = None
+    try:
+        for i in range(5):
+            handler.emit(make_record(f"record {i}"))
+        ## The first send fails, the batch is put back, and the sender waits retry_start seconds
+        time.sleep(0.3)
+
+        for i in range(5, 20):
+            handler.emit(make_record(f"record {i}"))
+
+        assert handler.pending == 5
+        assert handler.dropped == 15
+
+        collector = Collector(port)
+        ## close() interrupts the backoff and sends what is left
+        handler.close()
+        _, messages = collector.get_messages(5)
+    finally:
+        handler.close()
+        if collector is not None:
+            collector.close()
+
+    assert messages == [f"record {i}" for i in range(15, 20)]
+
+
+def test_records_after_close_are_dropped(collector: Collector):
+    handler = BatchingSocketHandler("127.0.0.1", collector.port, close_timeout=1.0)
+    handler.close()
+
+    handler.emit(make_record("late"))
+
+    assert handler.pending == 0
+    assert handler.dropped == 1
@@ -0,0 +1,229 @@
+"""RuntimeController reloads its config file when it changes, and sets temporary levels back when they expire."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+import socket
+import time
+import typing as t
+
+import pytest
+
+from red_log.runtime import RuntimeController, get_applied_handler, reset_applied_configdict
+
+LOGGER_NAME: str = "test_controller"
+
+
+def make_config(logger_level: str = "INFO", handler_level: str = "INFO") -> dict[str, t.Any]:
+    return {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {"null": {"class": "logging.NullHandler", "level": handler_level}},
+        "loggers": {
+            LOGGER_NAME: {"level": logger_level, "handlers": ["null"], "propagate": False},
+        },
+    }
+
+
+def write_config(path: Path, config: dict[str, t.Any]) -> None:
+    ## Move the mtime forward, so the change is seen on filesystems with coarse timestamps
+    mtime_ns: int = path.stat().st_mtime_ns + 1_000_000_000 if path.exists() else time.time_ns()
+    path.write_text(json.dumps(config))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class ListHandler(logging.Handler):
+    """Collect the messages of the records it handles."""
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def wait_for(condition: t.Callable[[], bool], timeout: float = 5.0) -> bool:
+    deadline: float = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+
+    return condition()
+
+
+@pytest.fixture
+def config_file(tmp_path: Path):
+    root: logging.Logger = logging.getLogger()
+    root_level: int = root.level
+    root_handlers: list[logging.Handler] = root.handlers[:]
+    reset_applied_configdict()
+
+    path: Path = tmp_path / "logging.json"
+    write_config(path, make_config())
+
+    yield path
+
+    handler = get_applied_handler("null")
+    if handler is not None:
+        handler.close()
+
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.handlers = []
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+
+    root.setLevel(root_level)
+    root.handlers = root_handlers
+    reset_applied_configdict()
+
+
+def test_invalid_duration():
+    controller = RuntimeController()
+
+    for duration in (0, -1, float("inf"), float("nan")):
+        with pytest.raises(ValueError):
+            controller.set_level(LOGGER_NAME, "DEBUG", duration=duration)
+
+
+def test_override_expires_back_to_configured_level(config_file: Path):
+    logger = logging.getLogger(LOGGER_NAME)
+
+    with RuntimeController(config_file, poll_interval=60) as controller:
+        assert logger.level == logging.INFO
+
+        controller.set_level(LOGGER_NAME, "DEBUG", duration=0.2)
+
+        assert logger.level == logging.DEBUG
+        assert len(controller.get_overrides()) == 1
+
+        ## The watcher wakes up for the expiry, not after poll_interval
+        assert wait_for(lambda: logger.level == logging.INFO, timeout=5.0)
+        assert controller.get_overrides() == []
+
+
+def test_override_without_config_restores_previous_level():
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(logging.ERROR)
+    try:
+        with RuntimeController() as controller:
+            controller.set_level(LOGGER_NAME, "DEBUG", duration=0.1)
+            ## Setting it again keeps the level from before the first override
+            controller.set_level(LOGGER_NAME, "INFO", duration=0.2)
+
+            assert logger.level == logging.INFO
+            assert wait_for(lambda: logger.level == logging.ERROR)
+    finally:
+        logger.setLevel(logging.NOTSET)
+
+
+def test_stop_restores_levels(config_file: Path):
+    logger = logging.getLogger(LOGGER_NAME)
+
+    with RuntimeController(config_file, poll_interval=60) as controller:
+        controller.set_level(LOGGER_NAME, "DEBUG")
+        controller.set_handler_level("null", "DEBUG")
+
+        assert logger.level == logging.DEBUG
+        assert get_applied_handler("null").level == logging.DEBUG
+
+    assert logger.level == logging.INFO
+    assert get_applied_handler("null").level == logging.INFO
+
+
+def test_reloads_changed_config_file_in_place(config_file: Path):
+    logger = logging.getLogger(LOGGER_NAME)
+
+    with RuntimeController(config_file, poll_interval=0.05):
+        handler = get_applied_handler("null")
+        assert handler.level == logging.INFO
+
+        write_config(config_file, make_config(logger_level="WARNING", handler_level="ERROR"))
+
+        assert wait_for(lambda: logger.level == logging.WARNING)
+        assert handler.level == logging.ERROR
+        ## Only the levels changed, so the handler was kept
+        assert get_applied_handler("null") is handler
+
+
+def test_invalid_config_file_keeps_running_config(config_file: Path):
+    logger = logging.getLogger(LOGGER_NAME)
+    ## Applying the config replaces the root logger's handlers, so listen on the controller's logger
+    error_handler = ListHandler(logging.ERROR)
+    controller_logger = logging.getLogger("red_log.runtime")
+    controller_logger.addHandler(error_handler)
+
+    try:
+        with RuntimeController(config_file, poll_interval=0.05):
+            handler = get_applied_handler("null")
+
+            config_file.write_text("{not json")
+            os.utime(config_file, ns=(time.time_ns() + 2_000_000_000,) * 2)
+
+            assert wait_for(lambda: bool(error_handler.messages))
+            assert "Could not apply logging config file" in error_handler.messages[0]
+            assert get_applied_handler("null") is handler
+            assert logger.level == logging.INFO
+
+            ## A fixed file is picked up again
+            write_config(config_file, make_config(logger_level="ERROR"))
+
+            assert wait_for(lambda: logger.level == logging.ERROR)
+    finally:
+        controller_logger.removeHandler(error_handler)
+
+
+def test_override_survives_reload(config_file: Path):
+    logger = logging.getLogger(LOGGER_NAME)
+
+    with RuntimeController(config_file, poll_interval=0.05) as controller:
+        controller.set_level(LOGGER_NAME, "DEBUG")
+
+        write_config(config_file, make_config(logger_level="ERROR", handler_level="ERROR"))
+
+        assert wait_for(lambda: get_applied_handler("null").level == logging.ERROR)
+        assert logger.level == logging.DEBUG
+
+        ## Ending the override restores the level from the reloaded config
+        assert controller.reset(LOGGER_NAME)
+        assert logger.level == logging.ERROR
+
+
+def test_control_socket(config_file: Path, tmp_path: Path):
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix domain sockets are not supported on this platform.")
+
+    socket_path: str = str(tmp_path / "ctl.sock")
+
+    def send(command: str) -> str:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(5.0)
+            conn.connect(socket_path)
+            conn.sendall(f"{command}\n".encode("utf-8"))
+
+            return conn.makefile("r", encoding="utf-8").readline().strip()
+
+    logger = logging.getLogger(LOGGER_NAME)
+
+    with RuntimeController(config_file, poll_interval=60, control_socket=socket_path):
+        assert (os.stat(socket_path).st_mode & 0o777) == 0o600
+
+        response: str = send(f"set-level {LOGGER_NAME} DEBUG 60")
+        assert response.startswith("ok ")
+        assert json.loads(response[3:])["level"] == "DEBUG"
+        assert logger.level == logging.DEBUG
+
+        status: list[dict] = json.loads(send("status")[3:])
+        assert [(s["kind"], s["name"]) for s in status] == [("logger", LOGGER_NAME)]
+
+        assert send(f"reset {LOGGER_NAME}") == 'ok {"reset": true}'
+        assert logger.level == logging.INFO
+
+        assert send("set-level").startswith("error ")
+        assert send("set-handler-level missing DEBUG").startswith("error ")
+
+    assert not os.path.exists(socket_path)
@@ -0,0 +1,69 @@
+"""Importing red_log must stay cheap: the heavy subpackages are only imported when used.
+
+`benchmarks/check_imports.py` does the same checks, and also reports import times against a budget.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+## Module -> modules importing it must not import
+FORBIDDEN_IMPORTS: dict[str, tuple[str, ...]] = {
+    "red_log": (
+        "red_log.config_classes",
+        "red_log.formatters",
+        "red_log.handlers",
+        "red_log.helpers",
+        "red_log.runtime",
+    ),
+    "red_log.fmts": (
+        "red_log.config_classes",
+        "red_log.formatters",
+        "red_log.handlers",
+        "red_log.helpers",
+        "red_log.runtime",
+    ),
+}
+
+
+def get_imported_modules(module: str) -> set[str]:
+    """Import `module` in a fresh interpreter with `-X importtime`, return the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+@pytest.mark.parametrize("module", list(FORBIDDEN_IMPORTS))
+def test_import_is_lazy(module: str):
+    imported: set[str] = get_imported_modules(module)
+
+    assert module in imported
+    for name in FORBIDDEN_IMPORTS[module]:
+        assert name not in imported, f"'import {module}' imported '{name}'"
+
+
+def test_lazy_attribute_imports_on_access():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, red_log; assert 'red_log.config_classes' not in sys.modules; "
+            "red_log.config_classes; assert 'red_log.config_classes' in sys.modules",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,139 @@
+"""ManagedQueueHandler starts its listener on demand, and stops it on close and at exit."""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import sys
+import textwrap
+
+from red_log.handlers import ManagedQueueHandler
+
+
+class ListHandler(logging.Handler):
+    """Collect the messages of the records it handles."""
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+def make_record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.makeLogRecord({"name": "test", "msg": msg, "levelno": level})
+
+
+def test_listener_starts_on_first_record_and_stops_on_close():
+    target = ListHandler()
+    handler = ManagedQueueHandler(handlers=[target])
+
+    assert handler.listener is None
+
+    for i in range(100):
+        handler.handle(make_record(f"record {i}"))
+
+    assert handler.listener is not None
+    thread = handler.listener._thread
+
+    handler.close()
+
+    assert handler.listener is None
+    assert thread is not None and not thread.is_alive()
+    ## close() drains the queue before stopping the listener
+    assert target.messages == [f"record {i}" for i in range(100)]
+
+
+def test_start_and_stop_are_idempotent():
+    handler = ManagedQueueHandler(handlers=[ListHandler()])
+    try:
+        handler.start_listener()
+        listener = handler.listener
+        handler.start_listener()
+
+        assert handler.listener is listener
+
+        handler.stop_listener()
+        handler.stop_listener()
+
+        assert handler.listener is None
+    finally:
+        handler.close()
+
+
+def test_context_manager_runs_listener():
+    target = ListHandler()
+    handler = ManagedQueueHandler(handlers=[target])
+    try:
+        with handler:
+            assert handler.listener is not None
+            handler.handle(make_record("inside"))
+
+        assert handler.listener is None
+        assert target.messages == ["inside"]
+    finally:
+        handler.close()
+
+
+def test_resolves_handlers_by_name():
+    target = ListHandler()
+    target.set_name("test_queue_handler_target")
+    handler = ManagedQueueHandler(handlers=["test_queue_handler_target"])
+    try:
+        handler.handle(make_record("by name"))
+        handler.stop_listener()
+
+        assert target.messages == ["by name"]
+    finally:
+        handler.close()
+        target.close()
+
+
+def test_respects_handler_level():
+    target = ListHandler(level=logging.WARNING)
+    handler = ManagedQueueHandler(handlers=[target])
+    try:
+        handler.handle(make_record("info", logging.INFO))
+        handler.handle(make_record("warning", logging.WARNING))
+        handler.stop_listener()
+    finally:
+        handler.close()
+
+    assert target.messages == ["warning"]
+
+
+def test_unknown_handler_name_is_reported_not_raised(capsys):
+    handler = ManagedQueueHandler(handlers=["test_queue_handler_missing"])
+    try:
+        handler.handle(make_record("lost"))
+    finally:
+        handler.close()
+
+    assert handler.listener is None
+    assert "test_queue_handler_missing" in capsys.readouterr().err
+
+
+def test_atexit_drains_queue():
+    script: str = textwrap.dedent(
+        """
+        import logging, sys, time
+        from red_log.handlers import ManagedQueueHandler
+
+        class SlowHandler(logging.StreamHandler):
+            def emit(self, record):
+                time.sleep(0.001)
+                super().emit(record)
+
+        logger = logging.getLogger("atexit_test")
+        logger.propagate = False
+        logger.addHandler(ManagedQueueHandler(handlers=[SlowHandler(sys.stdout)]))
+        for i in range(200):
+            logger.warning("record %d", i)
+        ## Exit without closing the handler
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=30)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == [f"record {i}" for i in range(200)]
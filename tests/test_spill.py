@@ -0,0 +1,171 @@
+"""SpillQueue moves records to disk past its high water mark, and replays them in order."""
+
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from red_log.handlers import SpillQueue
+
+
+def make_record(msg: str) -> logging.LogRecord:
+    return logging.makeLogRecord({"name": "test", "msg": msg, "levelno": logging.INFO})
+
+
+def get_all(q: SpillQueue) -> list[str]:
+    messages: list[str] = []
+    while not q.empty():
+        messages.append(q.get_nowait().getMessage())
+
+    return messages
+
+
+def list_segments(queue_dir: str) -> list[str]:
+    return sorted(name for name in os.listdir(queue_dir) if name.endswith(".seg"))
+
+
+def test_invalid_sizes(tmp_path: Path):
+    with pytest.raises(ValueError):
+        SpillQueue(tmp_path, high_water=0)
+    with pytest.raises(ValueError):
+        SpillQueue(tmp_path, segment_size=1024, max_bytes=1024)
+
+
+def test_spills_past_high_water_and_replays_in_order(tmp_path: Path):
+    q = SpillQueue(tmp_path, high_water=4, segment_size=512, max_bytes=1024 * 1024)
+    try:
+        for i in range(50):
+            q.put(make_record(f"record {i}"))
+
+        assert q.qsize() == 50
+        assert q.spilled == 46
+        ## Small segments, so the spilled records span several files
+        assert len(list_segments(q.queue_dir)) > 1
+
+        assert get_all(q) == [f"record {i}" for i in range(50)]
+        assert q.spilled == 0
+        assert list_segments(q.queue_dir) == []
+        assert q.dropped == 0
+    finally:
+        q.close()
+
+
+def test_records_put_while_replaying_stay_in_order(tmp_path: Path):
+    q = SpillQueue(tmp_path, high_water=4, segment_size=512, max_bytes=1024 * 1024)
+    try:
+        for i in range(20):
+            q.put(make_record(f"record {i}"))
+
+        messages: list[str] = [q.get_nowait().getMessage() for _ in range(10)]
+        for i in range(20, 30):
+            q.put(make_record(f"record {i}"))
+        messages.extend(get_all(q))
+    finally:
+        q.close()
+
+    assert messages == [f"record {i}" for i in range(30)]
+
+
+def test_evicts_oldest_segments_past_max_bytes(tmp_path: Path):
+    q = SpillQueue(tmp_path, high_water=2, segment_size=1024, max_bytes=2048)
+    try:
+        for i in range(500):
+            q.put(make_record(f"record {i}"))
+
+        assert q.dropped > 0
+        segment_bytes: int = sum(
+            os.path.getsize(os.path.join(q.queue_dir, name)) for name in list_segments(q.queue_dir)
+        )
+        assert segment_bytes <= 2048
+        assert q.qsize() == 500 - q.dropped
+
+        messages: list[str] = get_all(q)
+    finally:
+        q.close()
+
+    ## The records in memory, then the newest records from disk
+    assert messages == ["record 0", "record 1"] + [
+        f"record {i}" for i in range(2 + q.dropped, 500)
+    ]
+
+
+def test_open_queues_use_separate_directories(tmp_path: Path):
+    first = SpillQueue(tmp_path, high_water=1)
+    second = SpillQueue(tmp_path, high_water=1)
+    try:
+        assert first.queue_dir != second.queue_dir
+
+        for i in range(5):
+            first.put(make_record(f"first {i}"))
+            second.put(make_record(f"second {i}"))
+
+        assert get_all(first) == [f"first {i}" for i in range(5)]
+        assert get_all(second) == [f"second {i}" for i in range(5)]
+    finally:
+        first.close()
+        second.close()
+
+    ## Closed queues release their directories
+    third = SpillQueue(tmp_path, high_water=1)
+    try:
+        assert third.queue_dir == first.queue_dir
+    finally:
+        third.close()
+
+
+def test_replays_records_left_by_a_crashed_process(tmp_path: Path):
+    script: str = textwrap.dedent(
+        f"""
+        import logging, os
+        from red_log.handlers import SpillQueue
+
+        q = SpillQueue({str(tmp_path)!r}, high_water=2, segment_size=512)
+        for i in range(20):
+            q.put(logging.makeLogRecord({{"msg": f"record {{i}}"}}))
+        print(q.queue_dir, flush=True)
+        ## Exit without closing the queue
+        os._exit(0)
+        """
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=30)
+    assert result.returncode == 0, result.stderr
+    queue_dir: str = result.stdout.strip()
+
+    ## Cut the last record short, as if the process died while writing it
+    last_segment: str = os.path.join(queue_dir, list_segments(queue_dir)[-1])
+    with open(last_segment, "ab") as f:
+        f.write(b"\x00\x00\x01\x00partial")
+
+    q = SpillQueue(tmp_path, high_water=2, segment_size=512)
+    try:
+        assert q.queue_dir == queue_dir
+        ## The 2 records in memory were lost with the process
+        assert q.spilled == 18
+
+        assert get_all(q) == [f"record {i}" for i in range(2, 20)]
+    finally:
+        q.close()
+
+
+def test_does_not_take_over_directory_of_open_queue(tmp_path: Path):
+    first = SpillQueue(tmp_path, high_water=1)
+    try:
+        for i in range(5):
+            first.put(make_record(f"record {i}"))
+
+        second = SpillQueue(tmp_path, high_water=1)
+        try:
+            assert second.queue_dir != first.queue_dir
+            assert second.qsize() == 0
+        finally:
+            second.close()
+
+        assert get_all(first) == [f"record {i}" for i in range(5)]
+    finally:
+        first.close()